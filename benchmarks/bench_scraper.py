@@ -0,0 +1,192 @@
+# benchmarks/bench_scraper.py
+"""
+Offline end-to-end benchmark of `ScraperEngine.scrap()` against the local fixture site.
+
+Runs every combination of the given `max_concurrent`, blocking and capture
+settings and reports pages per second, p50/p95 url latency and peak RSS.
+
+    python -m benchmarks.bench_scraper --concurrency 1 5 10 --detail-pages 50 --latency 0.05
+    python -m benchmarks.bench_scraper --output bench.json  # keep the results to compare later
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import resource
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import List, Optional, Sequence
+
+from pydantic import BaseModel
+
+from benchmarks.fixture_platform import FixturePlatform
+from benchmarks.fixture_site import FixtureSite
+from v2.scraper.scraper_engine import ScraperEngine
+
+try:
+    import psutil
+except ImportError:  # peak RSS falls back to this process only
+    psutil = None
+
+DEFAULT_CONCURRENCY = (1, 5, 10)
+DEFAULT_LIST_PAGES = 2
+DEFAULT_DETAIL_PAGES = 40
+DEFAULT_RSS_INTERVAL = 0.1
+
+
+class BenchmarkCase(BaseModel):
+    max_concurrent: int
+    blocking: bool  # the engine's default resource blocking, or nothing blocked
+    capture: bool  # extract from the captured API responses instead of the DOM
+
+    @property
+    def name(self) -> str:
+        return f"c={self.max_concurrent} blocking={'on' if self.blocking else 'off'} capture={'on' if self.capture else 'off'}"
+
+
+class BenchmarkResult(BaseModel):
+    case: BenchmarkCase
+    urls: int
+    succeeded: int
+    seconds: float
+    pages_per_second: float
+    latency_p50: Optional[float]  # seconds spent on a url, the sum of its stage timings
+    latency_p95: Optional[float]
+    peak_rss_mb: Optional[float]
+    requests_served: int
+    blocked_requests: int
+
+
+def percentile(values: Sequence[float], q: float) -> Optional[float]:
+    if not values:
+        return None
+    if len(values) == 1:
+        return values[0]
+    return statistics.quantiles(values, n=100, method="inclusive")[round(q * 100) - 1]
+
+
+def rss_bytes() -> int:
+    """Resident memory of this process and its children, the browser included when psutil is installed"""
+    if psutil is None:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+    process = psutil.Process(os.getpid())
+    total = process.memory_info().rss
+    for child in process.children(recursive=True):
+        try:
+            total += child.memory_info().rss
+        except psutil.Error:
+            pass
+    return total
+
+
+async def sample_peak_rss(peak: List[int], interval: float = DEFAULT_RSS_INTERVAL) -> None:
+    while True:
+        peak[0] = max(peak[0], rss_bytes())
+        await asyncio.sleep(interval)
+
+
+async def run_case(site: FixtureSite, case: BenchmarkCase, urls: List[str]) -> BenchmarkResult:
+    """Scrapes `urls` with a fresh engine and browser configured by `case`"""
+    engine = ScraperEngine(FixturePlatform(site.base_url, capture=case.capture), adaptive_concurrency=False)
+    requests_before = site.requests
+    peak = [0]
+    sampler = asyncio.create_task(sample_peak_rss(peak))
+    start = time.perf_counter()
+    try:
+        responses = await engine.scrap(
+            urls=urls,
+            headless=True,
+            max_concurrent=case.max_concurrent,
+            blocked_resources=None if case.blocking else set(),
+        )
+    finally:
+        seconds = time.perf_counter() - start
+        sampler.cancel()
+        await asyncio.gather(sampler, return_exceptions=True)
+
+    latencies = sorted(sum(resp.timings.values()) for resp in responses if resp.timings)
+    return BenchmarkResult(
+        case=case,
+        urls=len(urls),
+        succeeded=len(responses),
+        seconds=round(seconds, 3),
+        pages_per_second=round(len(responses) / seconds, 3) if seconds else 0.0,
+        latency_p50=percentile(latencies, 0.50),
+        latency_p95=percentile(latencies, 0.95),
+        peak_rss_mb=round(peak[0] / 2**20, 1) if peak[0] else None,
+        requests_served=site.requests - requests_before,
+        blocked_requests=engine.blocking_metrics()["blocked"],
+    )
+
+
+async def run_benchmark(
+    concurrency: Sequence[int] = DEFAULT_CONCURRENCY,
+    blocking: Sequence[bool] = (True, False),
+    capture: Sequence[bool] = (False, True),
+    list_pages: int = DEFAULT_LIST_PAGES,
+    detail_pages: int = DEFAULT_DETAIL_PAGES,
+    latency: float = 0.0,
+) -> List[BenchmarkResult]:
+    results = []
+    with FixtureSite(latency=latency) as site:
+        urls = site.list_urls(list_pages) + site.detail_urls(detail_pages)
+        for max_concurrent, block, capt in itertools.product(concurrency, blocking, capture):
+            case = BenchmarkCase(max_concurrent=max_concurrent, blocking=block, capture=capt)
+            result = await run_case(site, case, urls)
+            print(format_result(result), flush=True)
+            results.append(result)
+    return results
+
+
+def format_result(result: BenchmarkResult) -> str:
+    def ms(seconds: Optional[float]) -> str:
+        return f"{seconds * 1000:7.0f}ms" if seconds is not None else "      n/a"
+
+    return (
+        f"{result.case.name:<36} {result.pages_per_second:7.2f} pages/s "
+        f"p50 {ms(result.latency_p50)} p95 {ms(result.latency_p95)} "
+        f"rss {result.peak_rss_mb or 0:7.1f}MB "
+        f"ok {result.succeeded}/{result.urls} requests {result.requests_served} blocked {result.blocked_requests}"
+    )
+
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=list(DEFAULT_CONCURRENCY))
+    parser.add_argument("--blocking", choices=["on", "off", "both"], default="both")
+    parser.add_argument("--capture", choices=["on", "off", "both"], default="both")
+    parser.add_argument("--list-pages", type=int, default=DEFAULT_LIST_PAGES)
+    parser.add_argument("--detail-pages", type=int, default=DEFAULT_DETAIL_PAGES)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every fixture response")
+    parser.add_argument("--output", type=Path, help="write the results as JSON")
+    return parser.parse_args(argv)
+
+
+def _switch(value: str) -> List[bool]:
+    return {"on": [True], "off": [False], "both": [True, False]}[value]
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = parse_args(argv)
+    if psutil is None:
+        print("psutil is not installed, peak RSS covers the python process only", file=sys.stderr)
+    results = asyncio.run(
+        run_benchmark(
+            concurrency=args.concurrency,
+            blocking=_switch(args.blocking),
+            capture=_switch(args.capture),
+            list_pages=args.list_pages,
+            detail_pages=args.detail_pages,
+            latency=args.latency,
+        )
+    )
+    if args.output:
+        args.output.write_text(json.dumps([result.model_dump() for result in results], indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
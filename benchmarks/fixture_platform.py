@@ -0,0 +1,71 @@
+# benchmarks/fixture_platform.py
+from typing import Dict, List
+
+from playwright.async_api import Page
+
+from v2.core.page_output import CapturedResponse
+from v2.platforms.linkedin.linkedin_platform import (
+    LinkedInDummyPage,
+    LinkedInJobDetailPage,
+    LinkedInJobListPage,
+    LinkedInPlatform,
+)
+
+
+class _CapturedBodyMixin:
+    def parse_captured(self, captured: List[CapturedResponse]) -> dict | None:
+        return captured[-1].body if captured else None
+
+
+class FixtureJobListPage(_CapturedBodyMixin, LinkedInJobListPage):
+    url_pattern = r"/jobs/search/"
+    capture_patterns = [r"/voyager/api/voyagerJobsDashJobCards"]
+
+
+class FixtureJobDetailPage(_CapturedBodyMixin, LinkedInJobDetailPage):
+    url_pattern = r"/jobs/view/\d+"
+    capture_patterns = [r"/voyager/api/jobs/jobPostings/"]
+
+
+class FixturePlatform(LinkedInPlatform):
+    """
+    LinkedIn's page objects, with their extraction mappings and page actions, pointed at a `FixtureSite`.
+
+    Politeness is off, the site is local. With `capture` the pages take their data
+    from the captured JSON and skip the DOM, otherwise nothing is captured.
+
+    Example:
+        ```python
+        with FixtureSite() as site:
+            platform = FixturePlatform(site.base_url, capture=True)
+        ```
+    """
+    name = "Fixture"
+    rate_limit = None
+    rate_burst = 1
+    min_delay = 0.0
+    login_wall_pattern = None
+    blocked_url_patterns = []
+    session_check_url = None
+
+    def __init__(self, base_url: str, capture: bool = False) -> None:
+        """
+        Args:
+            base_url (str): The fixture site's url.
+            capture (bool): Extract from the captured API responses instead of the DOM.
+        """
+        self.base_url = base_url
+        self.login_url = f"{base_url}/login/"
+        self.pages = [FixtureJobListPage(), FixtureJobDetailPage()]
+        self.dummy_page = LinkedInDummyPage()
+        for page_obj in self.pages:
+            if capture:
+                page_obj.capture_only = True
+            else:
+                page_obj.capture_patterns = []
+
+    async def login(self, page: Page, credentials: Dict[str, str]) -> None:
+        pass  # nothing behind a login on the fixture site
+
+    async def search_action(self, page: Page, search_params: Dict[str, str]) -> None:
+        await page.goto(f"{self.base_url}/jobs/search/?keywords={search_params.get('keywords')}", wait_until="domcontentloaded")
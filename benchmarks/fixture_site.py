@@ -0,0 +1,184 @@
+# benchmarks/fixture_site.py
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from string import Template
+from typing import List, Optional
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+DEFAULT_CARDS_PER_PAGE = 25
+DEFAULT_IMAGE_BYTES = 24 * 1024
+DEFAULT_DESCRIPTION_PARAGRAPHS = 30
+
+TITLES = ["Data Scientist", "Machine Learning Engineer", "Backend Engineer", "Data Engineer", "Research Scientist"]
+COMPANIES = ["Acme", "Globex", "Initech", "Umbrella", "Hooli", "Stark Industries"]
+LOCATIONS = ["Bengaluru, India", "Berlin, Germany", "Remote", "London, United Kingdom", "New York, NY"]
+
+JOB_LIST_PATH = re.compile(r"^/jobs/search/?$")
+JOB_VIEW_PATH = re.compile(r"^/jobs/view/(\d+)/?$")
+JOB_CARDS_API_PATH = re.compile(r"^/voyager/api/voyagerJobsDashJobCards$")
+JOB_POSTING_API_PATH = re.compile(r"^/voyager/api/jobs/jobPostings/(\d+)$")
+
+
+def job(job_id: int) -> dict:
+    """The fake job behind `job_id`, the same for every request"""
+    rng = random.Random(job_id)
+    return {
+        "job_id": str(job_id),
+        "title": rng.choice(TITLES),
+        "company": rng.choice(COMPANIES),
+        "location": rng.choice(LOCATIONS),
+        "applicants": rng.randint(1, 500),
+        "salary": f"${rng.randint(80, 200)}K/yr - ${rng.randint(200, 300)}K/yr",
+    }
+
+
+class FixtureSite:
+    """
+    Serves LinkedIn-like job list and detail pages, their JSON API and images from a local HTTP server.
+
+    Pages are built from the templates in `benchmarks/fixtures`, deterministic per
+    job id, so runs are comparable. `latency` delays every response to stand in
+    for the network.
+
+    Example:
+        ```python
+        with FixtureSite(latency=0.05) as site:
+            urls = site.list_urls(2) + site.detail_urls(50)
+        ```
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        cards_per_page: int = DEFAULT_CARDS_PER_PAGE,
+        image_bytes: int = DEFAULT_IMAGE_BYTES,
+    ) -> None:
+        """
+        Args:
+            host (str): Interface to listen on.
+            port (int): Port to listen on, 0 picks a free one.
+            latency (float): Seconds every response is delayed by.
+            cards_per_page (int): Job cards on a list page.
+            image_bytes (int): Size of the served images, what blocking saves.
+        """
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.cards_per_page = cards_per_page
+        self.image = b"\xff\xd8\xff\xe0" + bytes(max(image_bytes - 4, 0))
+        self.list_template = Template((FIXTURES_DIR / "job_list.html").read_text())
+        self.card_template = Template((FIXTURES_DIR / "job_card.html").read_text())
+        self.view_template = Template((FIXTURES_DIR / "job_view.html").read_text())
+        self._requests = 0  # served so far, counted by the handler threads under _requests_lock
+        self._requests_lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def __enter__(self) -> "FixtureSite":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.stop()
+
+    @property
+    def requests(self) -> int:
+        """The requests served so far"""
+        with self._requests_lock:
+            return self._requests
+
+    def count_request(self) -> None:
+        with self._requests_lock:
+            self._requests += 1
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    def start(self) -> None:
+        site = self
+
+        class Handler(_FixtureHandler):
+            fixture_site = site
+
+        self._server = ThreadingHTTPServer((self.host, self.port), Handler)
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def list_urls(self, count: int) -> List[str]:
+        return [f"{self.base_url}/jobs/search/?keywords=python&start={n * self.cards_per_page}" for n in range(count)]
+
+    def detail_urls(self, count: int, first_id: int = 4000000000) -> List[str]:
+        return [f"{self.base_url}/jobs/view/{job_id}/" for job_id in range(first_id, first_id + count)]
+
+    def render_list(self, start: int) -> str:
+        cards = "".join(
+            self.card_template.substitute(job(4000000000 + start + n))
+            for n in range(self.cards_per_page)
+        )
+        return self.list_template.substitute(cards=cards, start=start)
+
+    def render_view(self, job_id: int) -> str:
+        description = "\n".join(
+            f"        <p>Paragraph {n}: we are looking for someone who enjoys shipping reliable systems, "
+            f"reading papers and writing tests. &amp; You will work with Python, SQL and Playwright.</p>"
+            for n in range(DEFAULT_DESCRIPTION_PARAGRAPHS)
+        )
+        return self.view_template.substitute(job(job_id), description=description)
+
+    def job_cards(self, start: int) -> dict:
+        return {"paging": {"start": start, "count": self.cards_per_page},
+                "elements": [job(4000000000 + start + n) for n in range(self.cards_per_page)]}
+
+
+class _FixtureHandler(BaseHTTPRequestHandler):
+    fixture_site: FixtureSite
+
+    def do_GET(self) -> None:
+        site = self.fixture_site
+        site.count_request()
+        if site.latency:
+            time.sleep(site.latency)
+
+        path, _, query = self.path.partition("?")
+        params = dict(part.partition("=")[::2] for part in query.split("&") if part)
+        start = int(params.get("start") or 0)
+
+        if JOB_LIST_PATH.match(path):
+            self._send(200, "text/html; charset=utf-8", site.render_list(start).encode())
+        elif match := JOB_VIEW_PATH.match(path):
+            self._send(200, "text/html; charset=utf-8", site.render_view(int(match.group(1))).encode())
+        elif JOB_CARDS_API_PATH.match(path):
+            self._send(200, "application/json", json.dumps(site.job_cards(start)).encode())
+        elif match := JOB_POSTING_API_PATH.match(path):
+            self._send(200, "application/json", json.dumps(job(int(match.group(1)))).encode())
+        elif path.startswith("/media/"):
+            self._send(200, "image/jpeg", site.image)
+        else:
+            self._send(404, "text/plain", b"not found")
+
+    def _send(self, status: int, content_type: str, body: bytes) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args) -> None:
+        pass  # keep the benchmark output readable
@@ -1,4 +1,3 @@
-import copy
 import os
 from asyncio import gather
 from datetime import datetime
@@ -16,7 +15,8 @@ from src.github_utils import (
 )
 from src.repo_summarizer import LiteLLMProjectSummarizer
 from src.resume_generator import ResumeGenerator
-from steps.scrap_job_1 import scrap_linkedin
+from steps.scrap_job_1 import linkedin_session, scrap_linkedin
+from v2.core.page_archive import PageArchive
 from v2.core.page_output import PageResponse
 from v2.platforms.linkedin.linkedin_utils import (
     extract_job_id,
@@ -90,12 +90,9 @@ async def scrap_job_pages(urls: List[dict]) -> List[dict]:
         max_concurrent=loc_conf.max_concurrent,
     )
 
-    for n, page in enumerate(result_pages, 1):
-        fil = Path(
-            f'./scrapped/job_page/{datetime.now().strftime("%d-%m-%Y--%H-%M-%S %f")}-scrapped_jobs-{n}.json'
-        )
-        fil.parent.mkdir(exist_ok=True, parents=True)
-        fil.write_text(page.model_dump_json())
+    with PageArchive("./scrapped/job_page/job_pages.pages") as archive:
+        for page in result_pages:
+            await archive.aappend(page)
 
     # for page in result_pages:
     return [i.extracted_data for i in result_pages if i.extracted_data is not None]
@@ -107,38 +104,27 @@ async def scrap_linkedin_profile_info(filepath: Path = None) -> str:
     loc_conf = CONF.user_info
     credentials = get_credentials_or_throw_error()
     all_pages_results: list[PageResponse] = []
-    if loc_conf.linkedin_profile_url is not None:
-        result_page = await scrap_linkedin(
-            urls=[loc_conf.linkedin_profile_url],
-            cookie_file=COOKIE_FILE,
-            credentials=credentials,
-            headless=loc_conf.headless,
-        )
-        all_pages_results.extend(result_page)
-
-    all_pages = copy.deepcopy(all_pages_results)
+    async with linkedin_session(
+        cookie_file=COOKIE_FILE,
+        credentials=credentials,
+        headless=loc_conf.headless,
+    ) as engine:
+        if loc_conf.linkedin_profile_url is not None:
+            result_page = await engine.scrap(urls=[loc_conf.linkedin_profile_url])
+            all_pages_results.extend(result_page)
 
-    for i in all_pages_results:
-        more_links = extract_linkedin_profile_detail_links(i.html)
+        all_pages = list(all_pages_results)
 
-        if more_links:
-            result_pages = await scrap_linkedin(
-                urls=list(set(more_links)),
-                cookie_file=COOKIE_FILE,
-                credentials=credentials,
-                headless=loc_conf.headless,
-            )
-            all_pages.extend(result_pages)
+        for i in all_pages_results:
+            more_links = extract_linkedin_profile_detail_links(i.html)
 
-    filedir = loc_conf.save_dir / "saved_pages"
-    filedir.mkdir(exist_ok=True, parents=True)
+            if more_links:
+                result_pages = await engine.scrap(urls=list(set(more_links)))
+                all_pages.extend(result_pages)
 
-    for n, i in enumerate(all_pages, 1):
-        file = (
-            filedir
-            / f'{datetime.now().strftime("%d-%m-%Y--%H-%M-%S %f")} profile_page-{n}.json'
-        )
-        file.write_text(i.model_dump_json())
+    with PageArchive(loc_conf.save_dir / "saved_pages" / "profile_pages.pages") as archive:
+        for page in all_pages:
+            await archive.aappend(page)
 
     linkedin_file = loc_conf.save_dir / "linkedin_profile.txt"
 
@@ -17,6 +17,10 @@ async def scrap_linkedin(**kwargs):
 	except Exception as e:
 		print(f"Error during scraping: {e}")
 
+def linkedin_session(**kwargs):
+	"""Opens a ScraperEngine session, repeated scrap calls reuse its browser and login."""
+	return ScraperEngine.session(platform=LinkedInPlatform(), **kwargs)
+
 if __name__ == "__main__":
     
     
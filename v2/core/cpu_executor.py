@@ -0,0 +1,125 @@
+# core/cpu_executor.py
+import asyncio
+import contextvars
+import functools
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, Literal, Optional, TypeVar
+
+from pydantic import BaseModel
+
+from v2.infrastructure.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+_current_executor: contextvars.ContextVar[Optional["CpuExecutor"]] = contextvars.ContextVar(
+    "current_cpu_executor", default=None
+)
+
+
+class CpuExecutorConfig(BaseModel):
+    """
+    Where the CPU-bound page processing runs: markdownify, unescape, clean_html, html_to_text and the CSS extraction.
+
+    Threads overlap it with the browser I/O and keep the stage timings, the
+    parsers release the GIL for part of their work. Processes run it in
+    parallel at the cost of pickling the html, the functions submitted must be
+    importable. With `precompute_derived` the derived representations of the
+    capture profile are computed in the pool right after capture, instead of
+    lazily on the event loop when first accessed. Only worth it when the
+    extraction reads them, e.g. LLM strategies on the cleaned html, they are
+    otherwise computed for nothing.
+
+    Example:
+        ```python
+        engine = ScraperEngine(platform, cpu_executor=CpuExecutorConfig(kind="process", max_workers=4))
+        ```
+    """
+    kind: Literal["thread", "process"] = "thread"
+    max_workers: Optional[int] = None  # the executor's default if not given
+    precompute_derived: bool = False
+
+
+class CpuExecutor:
+    """
+    A thread or process pool running CPU-bound work off the event loop.
+
+    Code running under `use()` submits its work with `run_cpu()`, which calls
+    the function inline when no executor is in use. The pool is created on the
+    first submission.
+
+    Example:
+        ```python
+        executor = CpuExecutor(CpuExecutorConfig(max_workers=4))
+        with executor.use():
+            markdown = await run_cpu(markdownify.markdownify, raw_html)
+        executor.shutdown()
+        ```
+    """
+
+    def __init__(self, config: Optional[CpuExecutorConfig] = None) -> None:
+        """
+        Args:
+            config (Optional[CpuExecutorConfig]): The pool kind and size, a default thread pool if not given.
+        """
+        self.config = config or CpuExecutorConfig()
+        self._pool: Optional[Executor] = None
+
+    @property
+    def pool(self) -> Executor:
+        if self._pool is None:
+            if self.config.kind == "process":
+                self._pool = ProcessPoolExecutor(max_workers=self.config.max_workers)
+            else:
+                self._pool = ThreadPoolExecutor(max_workers=self.config.max_workers, thread_name_prefix="cpu")
+            logger.debug(f"Started a {self.config.kind} pool for CPU-bound work")
+        return self._pool
+
+    async def run(self, func: Callable[..., T], *args: Any) -> T:
+        """Runs `func(*args)` in the pool"""
+        loop = asyncio.get_running_loop()
+        if self.config.kind == "thread":
+            # the stage timings of the caller's trace are kept in the thread
+            call = functools.partial(contextvars.copy_context().run, func, *args)
+        else:
+            call = functools.partial(func, *args)
+        return await loop.run_in_executor(self.pool, call)
+
+    @contextmanager
+    def use(self) -> Iterator["CpuExecutor"]:
+        """`run_cpu()` submits to this executor inside the block"""
+        token = _current_executor.set(self)
+        try:
+            yield self
+        finally:
+            _current_executor.reset(token)
+
+    def shutdown(self, wait: bool = True) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=wait, cancel_futures=True)
+            self._pool = None
+
+
+def current_executor() -> Optional[CpuExecutor]:
+    """The executor in use, None if the CPU-bound work runs on the event loop"""
+    return _current_executor.get()
+
+
+@contextmanager
+def using(executor: Optional[CpuExecutor]) -> Iterator[None]:
+    """`executor.use()`, or nothing if `executor` is None"""
+    if executor is None:
+        yield
+        return
+    with executor.use():
+        yield
+
+
+async def run_cpu(func: Callable[..., T], *args: Any) -> T:
+    """Runs `func(*args)` in the executor in use, inline if there is none."""
+    executor = _current_executor.get()
+    if executor is None:
+        return func(*args)
+    return await executor.run(func, *args)
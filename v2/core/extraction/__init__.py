@@ -10,6 +10,7 @@ from .css_extraction import (
     FieldConfig,
     extract_with_strategy,
 )
+from .extraction_cache import ExtractionCache
 from .extraction import (
     ExtractionStrategyBase,
     LLMExtractionStrategyHTML,
@@ -33,5 +34,6 @@ __all__ = [
     'ExtractionConfig',
     'LLMExtractionStrategyMultiSource',
     'CSSExtractionStrategy',
+    'ExtractionCache',
 
 ]
\ No newline at end of file
@@ -14,8 +14,11 @@ from pydantic import BaseModel, field_validator
 from selectolax.parser import HTMLParser
 
 # from v2.platforms.linkedin.linkedin_platform import LinkedInPlatform
+from v2.core.cpu_executor import current_executor, run_cpu
 from v2.core.extraction.extraction import ExtractionStrategyBase
+from v2.core.extraction.extraction_cache import ExtractionCache, fingerprint
 from v2.core.page_output import PageResponse
+from v2.infrastructure.metrics.timing import span
 
 
 class ParserType(str, Enum):
@@ -67,6 +70,21 @@ class ExtractionMapping(BaseModel):
 
 
 
+async def _aextract_html(strategy: ExtractionStrategyBase, page_response: PageResponse, *args, **kwargs) -> PageResponse:
+    """Runs `strategy.extract` on the event loop, or only its html parsing in the CPU executor in use"""
+    if current_executor() is None or not page_response.html:
+        return strategy.extract(page_response, *args, **kwargs)
+    page_response.extracted_data = await run_cpu(
+        _extract_html, type(strategy), strategy.extraction_mapping, page_response.html
+    )
+    return page_response
+
+
+def _extract_html(strategy_type: Type[ExtractionStrategyBase], extraction_mapping: ExtractionMapping, raw_html: str) -> Any:
+    """The data a new `strategy_type` extracts from `raw_html`, a picklable call for process pools"""
+    return strategy_type(extraction_mapping).extract(PageResponse(html=raw_html)).extracted_data
+
+
 class TextExtractionMixin:
     """Mixin class providing common text extraction functionality."""
     
@@ -127,14 +145,19 @@ class BeautifulSoupExtractionStrategy(TextExtractionMixin, ExtractionStrategyBas
         print(extracted_response.extracted_data) # Output: {'title': 'My Title'}
         ```
     """
-    def __init__(self, extraction_mapping: ExtractionMapping):
+    def __init__(self, extraction_mapping: ExtractionMapping, cache: Optional[ExtractionCache] = None):
         """
         Initializes the extraction strategy with the given extraction mapping.
         
         Args:
             extraction_mapping (ExtractionMapping): The configuration for data extraction.
+            cache (Optional[ExtractionCache]): Returns the data extracted before from the same html.
         """
         self.extraction_mapping = extraction_mapping
+        self.cache = cache
+
+    def fingerprint(self) -> Optional[str]:
+        return fingerprint(type(self).__name__, self.extraction_mapping.model_dump(mode="json"))
 
     def extract(self, page_response: PageResponse, *args, **kwargs) -> PageResponse:
         """
@@ -162,14 +185,17 @@ class BeautifulSoupExtractionStrategy(TextExtractionMixin, ExtractionStrategyBas
             page_response.extracted_data = None
             return page_response
 
-        tree = BeautifulSoup(page_response.html, 'html.parser')
-        extracted_data = self._extract_data(tree, self.extraction_mapping.extraction_configs)
+        with span("parse"):
+            tree = BeautifulSoup(page_response.html, 'html.parser')
+        with span("select"):
+            extracted_data = self._extract_data(tree, self.extraction_mapping.extraction_configs)
         page_response.extracted_data = extracted_data
         return page_response
 
     async def aextract(self, page_response: PageResponse, *args, **kwargs) -> PageResponse:
         """
-         Asynchronously extracts data from a PageResponse. Calls the synchronous `extract` method.
+         Asynchronously extracts data from a PageResponse. Runs the synchronous `extract` in the CPU
+         executor in use, unless the cache has the data extracted from the same html.
          
          Args:
             page_response (PageResponse): The PageResponse object containing the HTML to parse.
@@ -177,7 +203,7 @@ class BeautifulSoupExtractionStrategy(TextExtractionMixin, ExtractionStrategyBas
         Returns:
              PageResponse: The same PageResponse object, but with the `extracted_data` field populated.
         """
-        return self.extract(page_response, *args, **kwargs)
+        return await self._cached(page_response, self.cache, lambda: _aextract_html(self, page_response, *args, **kwargs))
 
     def _get_direct_text(self, node: BeautifulSoup) -> str:
         """Get direct text from current node only."""
@@ -304,14 +330,19 @@ class LXMLExtractionStrategy(TextExtractionMixin, ExtractionStrategyBase):
         print(extracted_response.extracted_data) # Output: {'title': 'My Title'}
         ```
     """
-    def __init__(self, extraction_mapping: ExtractionMapping):
+    def __init__(self, extraction_mapping: ExtractionMapping, cache: Optional[ExtractionCache] = None):
         """
         Initializes the extraction strategy with the given extraction mapping.
         
         Args:
             extraction_mapping (ExtractionMapping): The configuration for data extraction.
+            cache (Optional[ExtractionCache]): Returns the data extracted before from the same html.
         """
         self.extraction_mapping = extraction_mapping
+        self.cache = cache
+
+    def fingerprint(self) -> Optional[str]:
+        return fingerprint(type(self).__name__, self.extraction_mapping.model_dump(mode="json"))
 
     def extract(self, page_response: PageResponse, *args, **kwargs) -> PageResponse:
         """
@@ -339,14 +370,17 @@ class LXMLExtractionStrategy(TextExtractionMixin, ExtractionStrategyBase):
             page_response.extracted_data = None
             return page_response
 
-        tree = html.fromstring(page_response.html)
-        extracted_data = self._extract_data(tree, self.extraction_mapping.extraction_configs)
+        with span("parse"):
+            tree = html.fromstring(page_response.html)
+        with span("select"):
+            extracted_data = self._extract_data(tree, self.extraction_mapping.extraction_configs)
         page_response.extracted_data = extracted_data
         return page_response
 
     async def aextract(self, page_response: PageResponse, *args, **kwargs) -> PageResponse:
         """
-         Asynchronously extracts data from a PageResponse. Calls the synchronous `extract` method.
+         Asynchronously extracts data from a PageResponse. Runs the synchronous `extract` in the CPU
+         executor in use, unless the cache has the data extracted from the same html.
          
          Args:
             page_response (PageResponse): The PageResponse object containing the HTML to parse.
@@ -354,7 +388,7 @@ class LXMLExtractionStrategy(TextExtractionMixin, ExtractionStrategyBase):
         Returns:
              PageResponse: The same PageResponse object, but with the `extracted_data` field populated.
         """
-        return self.extract(page_response, *args, **kwargs)
+        return await self._cached(page_response, self.cache, lambda: _aextract_html(self, page_response, *args, **kwargs))
 
     def _get_direct_text(self, node: html.HtmlElement) -> str:
         """Get direct text from current node only."""
@@ -491,14 +525,19 @@ class CSSExtractionStrategy(TextExtractionMixin, ExtractionStrategyBase):
         print(extracted_response.extracted_data) # Output: {'title': 'My Title'}
         ```
     """
-    def __init__(self, extraction_mapping: ExtractionMapping):
+    def __init__(self, extraction_mapping: ExtractionMapping, cache: Optional[ExtractionCache] = None):
         """
         Initializes the extraction strategy with the given extraction mapping.
         
         Args:
             extraction_mapping (ExtractionMapping): The configuration for data extraction.
+            cache (Optional[ExtractionCache]): Returns the data extracted before from the same html.
         """
         self.extraction_mapping = extraction_mapping
+        self.cache = cache
+
+    def fingerprint(self) -> Optional[str]:
+        return fingerprint(type(self).__name__, self.extraction_mapping.model_dump(mode="json"))
 
     def extract(self, page_response: PageResponse, *args, **kwargs) -> PageResponse:
         """Extracts data from page response using CSS selectors.
@@ -525,14 +564,17 @@ class CSSExtractionStrategy(TextExtractionMixin, ExtractionStrategyBase):
             page_response.extracted_data = None
             return page_response
 
-        tree = HTMLParser(page_response.html)
-        extracted_data = self._extract_data(tree, self.extraction_mapping.extraction_configs)
+        with span("parse"):
+            tree = HTMLParser(page_response.html)
+        with span("select"):
+            extracted_data = self._extract_data(tree, self.extraction_mapping.extraction_configs)
         page_response.extracted_data = extracted_data
         return page_response
 
     async def aextract(self, page_response: PageResponse, *args, **kwargs) -> PageResponse:
         """
-         Asynchronously extracts data from a PageResponse. Calls the synchronous `extract` method.
+         Asynchronously extracts data from a PageResponse. Runs the synchronous `extract` in the CPU
+         executor in use, unless the cache has the data extracted from the same html.
          
          Args:
             page_response (PageResponse): The PageResponse object containing the HTML to parse.
@@ -540,7 +582,7 @@ class CSSExtractionStrategy(TextExtractionMixin, ExtractionStrategyBase):
         Returns:
              PageResponse: The same PageResponse object, but with the `extracted_data` field populated.
         """
-        return self.extract(page_response, *args, **kwargs)
+        return await self._cached(page_response, self.cache, lambda: _aextract_html(self, page_response, *args, **kwargs))
 
     def _get_direct_text(self, node: HTMLParser) -> str:
         """Get direct text from current node only."""
@@ -1,6 +1,8 @@
 # core/extraction/extraction.py
+import inspect
 from abc import ABC, abstractmethod
-from typing import Callable, Literal, Optional, Protocol, Tuple, Type
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Literal, Optional, Protocol, Tuple, Type
 
 import litellm
 from litellm import acompletion, completion
@@ -8,13 +10,18 @@ from pydantic import BaseModel, ValidationError
 
 from v2.core.page_output import PageResponse
 from v2.infrastructure.logging.logger import get_logger
+from v2.infrastructure.metrics.timing import span
 
+from .extraction_cache import ExtractionCache, content_key, fingerprint
 from .extraction_utils import clean_html, get_dict, parse_image
 
 logger = get_logger(__name__)
 
 
 class ExtractionStrategyBase(Protocol):
+    needs_image: bool = False # reads page_response.screenshot_path, the engine takes screenshots only for these
+    cache: Optional[ExtractionCache] = None # consulted by aextract before extracting
+
     def extract(self, page_response: PageResponse, *args, **kwargs) -> PageResponse:
         """Extracts data from page response and sets it to page_response.extracted_data."""
         pass
@@ -23,10 +30,66 @@ class ExtractionStrategyBase(Protocol):
         """Async extracts data from page response and sets it to page_response.extracted_data."""
         pass
 
+    def fingerprint(self) -> Optional[str]:
+        """A hash of the configuration deciding the extracted data, None if the results are not cacheable."""
+        return None
+
+    def cache_key(self, page_response: PageResponse) -> Optional[str]:
+        """The cache key of the data extracted from `page_response`, None if it is not cacheable."""
+        strategy_fingerprint = self.fingerprint()
+        if strategy_fingerprint is None or not page_response.html:
+            return None
+        return content_key(strategy_fingerprint, page_response.html)
+
+    async def aextract_cached(self, page_response: PageResponse, cache: Optional[ExtractionCache], *args, **kwargs) -> PageResponse:
+        """`aextract()` returning the data cached in `cache` for the same content and configuration"""
+        return await self._cached(page_response, cache, lambda: self.aextract(page_response, *args, **kwargs))
+
+    async def _cached(self, page_response: PageResponse, cache: Optional[ExtractionCache],
+                      compute: Callable[[], PageResponse | Awaitable[PageResponse]]) -> PageResponse:
+        """Sets the data cached for `page_response`, or runs `compute` and caches what it extracted"""
+        key = self.cache_key(page_response) if cache is not None else None
+        if key is not None:
+            value = await cache.aget(key)
+            if value is not None:
+                try:
+                    page_response.extracted_data = self._from_cached(value)
+                    return page_response
+                except ValueError as e:
+                    logger.warning(f"Ignoring the cached extraction of {page_response.url}: {e}")
+        result = compute()
+        if inspect.isawaitable(result):
+            result = await result
+        if key is not None and result is not None and self._cacheable(result.extracted_data):
+            await cache.aset(key, self._to_cached(result.extracted_data))
+        return result
+
+    def _cacheable(self, extracted_data: Any) -> bool:
+        """Whether `extracted_data` is a successful extraction, failed ones are not cached"""
+        return extracted_data is not None
+
+    def _to_cached(self, extracted_data: Any) -> Any:
+        """The JSON serializable form of `extracted_data` stored in the cache"""
+        return extracted_data
+
+    def _from_cached(self, value: Any) -> Any:
+        return value
+
+
+def _screenshot(page_response: PageResponse) -> Optional[bytes]:
+    """The screenshot of `page_response`, None if it has none"""
+    path = page_response.screenshot_path
+    if not path or not Path(path).is_file():
+        return None
+    return Path(path).read_bytes()
+
+
 class LLMExtractionStrategy(ExtractionStrategyBase, ABC):
     def __init__(self, model: str, extraction_model: Type[BaseModel], api_key: str = None,
                  fallbacks=None, verbose: bool = False, validate_json: bool = True,
-                 additional_instruction: Optional[str] = None, *args, **kwargs):
+                 additional_instruction: Optional[str] = None, cache: Optional[ExtractionCache] = None,
+                 *args, **kwargs):
+        self.cache = cache
         self.additional_instruction = additional_instruction
         self.model = model
         self.__api_key = api_key
@@ -43,6 +106,23 @@ class LLMExtractionStrategy(ExtractionStrategyBase, ABC):
         """Prepare the messages and response format for the LLM."""
         pass
 
+    def fingerprint(self) -> Optional[str]:
+        return fingerprint(
+            type(self).__name__, self.model, self.model_schema, getattr(self, "extraction_prompt", None),
+            self.additional_instruction, getattr(self, "response_type", None),
+            getattr(getattr(self, "clean_html_func", None), "__qualname__", None),
+        )
+
+    def _cacheable(self, extracted_data: Any) -> bool:
+        # parse_output_to_model returns the raw reply when it does not validate
+        return isinstance(extracted_data, BaseModel)
+
+    def _to_cached(self, extracted_data: Any) -> Any:
+        return extracted_data.model_dump(mode="json")
+
+    def _from_cached(self, value: Any) -> Any:
+        return self.extraction_model.model_validate(value)
+
     def _setup_litellm(self)-> None:
         """Sets up litellm library settings."""
         litellm.enable_json_schema_validation = self.validate_json
@@ -65,17 +145,19 @@ class LLMExtractionStrategy(ExtractionStrategyBase, ABC):
 
     def extract(self, page_response: PageResponse, *args, **kwargs) -> PageResponse:
         """Extracts data using the LLM model."""
-        messages, response_format = self._preparation(page_response=page_response, *args, **kwargs)
+        with span("prepare"):
+            messages, response_format = self._preparation(page_response=page_response, *args, **kwargs)
         try:
-            response = completion(
-                model=self.model,
-                messages=messages,
-                api_key=self.__api_key,
-                response_format=response_format,
-                fallbacks=self.fallbacks,
-                stream=False,
-                **kwargs
-            )
+            with span("completion"):
+                response = completion(
+                    model=self.model,
+                    messages=messages,
+                    api_key=self.__api_key,
+                    response_format=response_format,
+                    fallbacks=self.fallbacks,
+                    stream=False,
+                    **kwargs
+                )
         except Exception as e:
             logger.error(f"Extraction failed: {e}", exc_info=True)
             response = None
@@ -86,18 +168,23 @@ class LLMExtractionStrategy(ExtractionStrategyBase, ABC):
         return page_response
 
     async def aextract(self, page_response: PageResponse, *args, **kwargs) -> PageResponse:
-        """Asynchronously extracts data using the LLM model."""
-        messages, response_format = self._preparation(page_response=page_response, *args, **kwargs)
+        """Asynchronously extracts data using the LLM model, or returns the cached data of the same content."""
+        return await self._cached(page_response, self.cache, lambda: self._aextract(page_response, *args, **kwargs))
+
+    async def _aextract(self, page_response: PageResponse, *args, **kwargs) -> PageResponse:
+        with span("prepare"):
+            messages, response_format = self._preparation(page_response=page_response, *args, **kwargs)
         try:
-            response = await acompletion(
-                model=self.model,
-                messages=messages,
-                api_key=self.__api_key,
-                response_format=response_format,
-                fallbacks=self.fallbacks,
-                stream=False,
-                **kwargs
-            )
+            with span("completion"):
+                response = await acompletion(
+                    model=self.model,
+                    messages=messages,
+                    api_key=self.__api_key,
+                    response_format=response_format,
+                    fallbacks=self.fallbacks,
+                    stream=False,
+                    **kwargs
+                )
         except Exception as e:
             logger.error(f"Async extraction failed: {e}", exc_info=True)
             response = None
@@ -135,6 +222,8 @@ You are given a HTML text, you have to extract various data fields mentioned bel
         return messages, response_format
     
 class LLMExtractionStrategyIMAGE(LLMExtractionStrategy):
+    needs_image = True
+
     def __init__(self, model: str, extraction_model: Type[BaseModel], 
                  response_type: Literal['json_schema', 'json_object'] = 'json_schema', 
                  *args, **kwargs):
@@ -156,9 +245,16 @@ You are given a screenshot of a website, you have to extract various data fields
         messages = [parse_image(image=page_response.screenshot_path, message=prompt)]
         response_format = {"type": "json_schema", "strict": True} if self.response_type == 'json_schema' else {"type": "json_object", "json_object": self.model_schema, "strict": True}
         return messages, response_format
+
+    def cache_key(self, page_response: PageResponse) -> Optional[str]:
+        """Keyed by the screenshot, the html is not sent"""
+        screenshot = _screenshot(page_response)
+        return content_key(self.fingerprint(), screenshot) if screenshot else None
     
 
 class LLMExtractionStrategyMultiSource(LLMExtractionStrategy):
+    needs_image = True
+
     def __init__(self, model: str, extraction_model: Type[BaseModel], 
                  clean_html_func: Callable[[str], str] = clean_html, 
                  *args, **kwargs):
@@ -189,4 +285,11 @@ Points to consider:
         prompt = self.extraction_prompt.format(fields_to_extract=self.model_schema, html_str=html, additional_instructions=additional_instructions)
         messages = [parse_image(image=page_response.screenshot_path, message=prompt)]
         response_format = {"type": "json_schema", "strict": True}
-        return messages, response_format
\ No newline at end of file
+        return messages, response_format
+
+    def cache_key(self, page_response: PageResponse) -> Optional[str]:
+        """Keyed by the html and the screenshot"""
+        screenshot = _screenshot(page_response)
+        if not screenshot or not page_response.html:
+            return None
+        return content_key(self.fingerprint(), page_response.html, screenshot)
@@ -0,0 +1,164 @@
+# core/extraction/extraction_cache.py
+import asyncio
+import hashlib
+import json
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
+
+from v2.infrastructure.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_CACHE_FILE = "extraction-cache.sqlite3"
+DEFAULT_MAX_ENTRIES = 10_000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS extractions (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    last_used INTEGER NOT NULL
+)
+"""
+# the clock ordering the uses, kept in the file so the processes sharing it agree, timestamps could tie
+_NEXT_USE = "(SELECT COALESCE(MAX(last_used), 0) + 1 FROM extractions)"
+
+
+def content_key(fingerprint: str, *contents: str | bytes | None) -> str:
+    """The cache key of the extraction configured by `fingerprint` from `contents`"""
+    digest = hashlib.sha256(fingerprint.encode())
+    for content in contents:
+        data = content.encode() if isinstance(content, str) else content or b""
+        digest.update(len(data).to_bytes(8, "big"))  # ("ab", "c") and ("a", "bc") differ
+        digest.update(data)
+    return digest.hexdigest()
+
+
+def fingerprint(*parts: Any) -> str:
+    """A stable hash of the configuration `parts`, JSON serializable values"""
+    return hashlib.sha256(json.dumps(parts, sort_keys=True, default=str).encode()).hexdigest()
+
+
+class ExtractionCache:
+    """
+    Persists extracted data in SQLite by a hash of the page content and of the extraction configuration.
+
+    A page seen again with the same content, in the same run or a later one, is
+    not parsed or sent to an LLM again. Changing the mapping, model or prompt
+    changes the fingerprint, so stale results are never returned. The least
+    recently used entries are evicted beyond `max_entries` or `max_bytes`, counted
+    in the file, so the bounds hold for all the processes sharing it.
+
+    Example:
+        ```python
+        cache = ExtractionCache("extraction-cache.sqlite3", max_entries=5000)
+        engine = ScraperEngine(platform, extraction_cache=cache)
+        # or for one strategy only
+        strategy = CSSExtractionStrategy(mapping, cache=cache)
+        ```
+    """
+
+    def __init__(
+        self,
+        path: str | Path = DEFAULT_CACHE_FILE,
+        max_entries: Optional[int] = DEFAULT_MAX_ENTRIES,
+        max_bytes: Optional[int] = None,
+    ) -> None:
+        """
+        Args:
+            path (str | Path): The SQLite file, created if missing.
+            max_entries (Optional[int]): Entries kept, unbounded if None.
+            max_bytes (Optional[int]): Total size of the stored values kept, unbounded if None.
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        # autocommit, the writes open their own transactions, see _write()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None, timeout=30)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(_SCHEMA)
+        self._connection.execute("CREATE INDEX IF NOT EXISTS extractions_last_used ON extractions (last_used)")
+
+    def __reduce__(self):
+        # sharded scraping sends the engine's cache to its processes, each opens the file again
+        return type(self), (self.path, self.max_entries, self.max_bytes)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM extractions").fetchone()[0]
+
+    def get(self, key: str) -> Any:
+        """The value cached under `key`, None if there is none."""
+        with self._lock:
+            row = self._connection.execute("SELECT value FROM extractions WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._connection.execute(f"UPDATE extractions SET last_used = {_NEXT_USE} WHERE key = ?", (key,))
+        return json.loads(row[0])
+
+    def set(self, key: str, value: Any) -> None:
+        """Caches `value`, a JSON serializable one, under `key` and evicts beyond the bounds."""
+        if value is None:
+            return
+        data = json.dumps(value)
+        with self._lock, self._write():
+            self._connection.execute(
+                f"INSERT OR REPLACE INTO extractions VALUES (?, ?, ?, {_NEXT_USE})", (key, data, len(data))
+            )
+            self._evict()
+
+    async def aget(self, key: str) -> Any:
+        return await asyncio.to_thread(self.get, key)
+
+    async def aset(self, key: str, value: Any) -> None:
+        await asyncio.to_thread(self.set, key, value)
+
+    def stats(self) -> Dict[str, int]:
+        """Hits and misses since this cache was opened, with the current size of the file shared by all its users."""
+        with self._lock:
+            entries, size = self._connection.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM extractions"
+            ).fetchone()
+        return {"hits": self.hits, "misses": self.misses, "entries": entries, "bytes": size}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._connection.execute("DELETE FROM extractions")
+
+    def close(self) -> None:
+        self._connection.close()
+
+    @contextmanager
+    def _write(self) -> Iterator[None]:
+        """A write transaction, taking the database lock up front so processes sharing the file count the same entries"""
+        self._connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except BaseException:
+            self._connection.execute("ROLLBACK")
+            raise
+        self._connection.execute("COMMIT")
+
+    def _evict(self) -> None:
+        """Deletes the least recently used entries beyond the bounds, in the write transaction"""
+        while True:
+            entries, size = self._connection.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM extractions"
+            ).fetchone()
+            excess = max(entries - self.max_entries, 0) if self.max_entries is not None else 0
+            if not entries or (not excess and (self.max_bytes is None or size <= self.max_bytes)):
+                return
+            keys = [key for (key,) in self._connection.execute(
+                "SELECT key FROM extractions ORDER BY last_used LIMIT ?", (max(excess, 1),)
+            )]
+            self._connection.executemany("DELETE FROM extractions WHERE key = ?", [(key,) for key in keys])
+            logger.debug(f"Evicted {len(keys)} extraction(s) from {self.path}")
@@ -0,0 +1,208 @@
+# core/list_harvest.py
+from typing import Dict, Optional
+
+from playwright.async_api import Page
+from selectolax.parser import HTMLParser
+
+from v2.core.cpu_executor import run_cpu
+from v2.core.page_output import PageResponse
+from v2.infrastructure.logging.logger import get_logger
+from v2.infrastructure.metrics.timing import span
+
+logger = get_logger(__name__)
+
+DEFAULT_HARVEST_KEY = "id"
+
+# Installs a MutationObserver keeping the outerHTML of every card matching `selector`,
+# keyed by its `key` attribute. A card rendered again keeps its longest version, an
+# occluded card emptied by the list does not replace the one rendered on screen.
+# Only the list holding the first card is observed, the body if there is none yet,
+# for added and removed nodes and changes of the key, so hover and class changes
+# elsewhere on the page do not serialize the cards again.
+HARVEST_START_SCRIPT = """
+({ selector, key }) => {
+    const cards = new Map();
+    const record = (card) => {
+        const id = card.getAttribute(key);
+        if (id === null) {
+            return;
+        }
+        const html = card.outerHTML;
+        const previous = cards.get(id);
+        if (previous === undefined || html.length > previous.length) {
+            cards.set(id, html);
+        }
+    };
+    document.querySelectorAll(selector).forEach(record);
+    const observer = new MutationObserver((mutations) => {
+        const dirty = new Set();
+        for (const mutation of mutations) {
+            const target = mutation.target.nodeType === Node.ELEMENT_NODE ? mutation.target : mutation.target.parentElement;
+            const card = target && target.closest(selector);
+            if (card) {
+                dirty.add(card);
+            }
+            for (const node of mutation.addedNodes) {
+                if (node.nodeType === Node.ELEMENT_NODE) {
+                    if (node.matches(selector)) {
+                        dirty.add(node);
+                    }
+                    node.querySelectorAll(selector).forEach((element) => dirty.add(element));
+                }
+            }
+        }
+        dirty.forEach(record);
+    });
+    const first = document.querySelector(selector);
+    const list = (first && first.parentElement) || document.body;
+    observer.observe(list, { childList: true, subtree: true, attributes: true, attributeFilter: [key] });
+    window.__listHarvest = { observer, cards, record, selector };
+}
+"""
+
+# Records the cards still in the DOM, stops the observer and returns the cards in the order first seen.
+HARVEST_COLLECT_SCRIPT = """
+() => {
+    const harvest = window.__listHarvest;
+    if (!harvest) {
+        return null;
+    }
+    delete window.__listHarvest;
+    harvest.observer.disconnect();
+    document.querySelectorAll(harvest.selector).forEach(harvest.record);
+    return Array.from(harvest.cards, ([key, html]) => ({ key, html }));
+}
+"""
+
+
+class ListHarvester:
+    """
+    Collects the cards of a virtualized list as they render, while the list is scrolled.
+
+    Lists that occlude or recycle their off-screen cards only hold part of them
+    once scrolling is done. Entered after the navigation, the harvester observes
+    the DOM in the page and keeps every card matching `selector` by its `key_attribute`.
+    `merge()` puts the union back into the snapshot of the page, in place of the
+    cards emptied and after their neighbours for the ones removed, so the
+    extraction sees the whole list. Without a selector nothing is observed.
+
+    Example:
+        ```python
+        async with ListHarvester(page, "[data-occludable-job-id]", "data-occludable-job-id") as harvester:
+            await scroll_container(page, job_list_container)
+            page_response = await harvester.merge(await parse_page_response(page))
+        ```
+    """
+
+    def __init__(self, page: Page, selector: Optional[str] = None, key_attribute: str = DEFAULT_HARVEST_KEY) -> None:
+        """
+        Args:
+            page (Page): The page holding the list, already navigated.
+            selector (Optional[str]): CSS selector of the list cards.
+            key_attribute (str): The attribute identifying a card.
+        """
+        self.page = page
+        self.selector = selector
+        self.key_attribute = key_attribute
+        self.cards: Optional[Dict[str, str]] = None  # key -> outerHTML once collected
+        self._started = False
+
+    async def __aenter__(self) -> "ListHarvester":
+        if self.selector:
+            await self.page.evaluate(HARVEST_START_SCRIPT, {"selector": self.selector, "key": self.key_attribute})
+            self._started = True
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        if self._started and self.cards is None and not self.page.is_closed():
+            try:
+                await self.page.evaluate(HARVEST_COLLECT_SCRIPT)  # disconnects the observer
+            except Exception as e:
+                logger.debug(f"Could not stop the list harvest of {self.page.url}: {e}")
+
+    async def collect(self) -> Dict[str, str]:
+        """Stops observing and returns the outerHTML of the cards seen, by key in the order first seen"""
+        if self.cards is None:
+            harvested = await self.page.evaluate(HARVEST_COLLECT_SCRIPT) if self._started else None
+            if self._started and harvested is None:
+                logger.warning(f"The list harvest of {self.page.url} was lost, the page navigated away")
+            self.cards = {card["key"]: card["html"] for card in harvested or []}
+        return self.cards
+
+    async def merge(self, page_response: PageResponse) -> PageResponse:
+        """Puts the cards collected into the html of `page_response`, collecting them first if needed"""
+        cards = await self.collect()
+        if not cards or not page_response.html:
+            return page_response
+        with span("harvest"):
+            page_response.html = await run_cpu(merge_harvested, page_response.html, self.selector, self.key_attribute, cards)
+        logger.debug(f"Merged {len(cards)} harvested card(s) into {page_response.url}")
+        return page_response
+
+
+def merge_harvested(raw_html: str, selector: str, key_attribute: str, cards: Dict[str, str]) -> str:
+    """
+    Merges the harvested `cards` into `raw_html`.
+
+    A card of the html is replaced by its harvested version when that one is
+    longer. A card missing from the html is inserted after the card harvested
+    before it, or before the first card of the html.
+    """
+    tree = HTMLParser(raw_html)
+    present = {}
+    for node in tree.css(selector):
+        key = node.attributes.get(key_attribute)
+        if key is not None:
+            present.setdefault(key, node)
+    if not present:
+        logger.debug(f"No {selector} card in the html to merge the harvested ones next to")
+        return raw_html
+
+    anchor = None  # the card the next missing one goes after
+    leading = []  # missing cards harvested before any card of the html
+    for key, card_html in cards.items():
+        node = present.get(key)
+        if node is None:
+            if anchor is None:
+                leading.append(card_html)
+            else:
+                anchor = _insert_after(anchor, card_html)
+            continue
+        for card in leading:
+            _insert_before(node, card)
+        leading = []
+        if len(card_html) > len(node.html or ""):
+            replacement = _insert_before(node, card_html)
+            if replacement is not node:
+                node.decompose()
+                node = replacement
+        anchor = node
+    if leading:
+        first = next(iter(present.values()))
+        for card in leading:
+            _insert_before(first, card)
+    return tree.html
+
+
+def _fragment(card_html: str):
+    """The root node of `card_html`, None if it does not parse to an element"""
+    body = HTMLParser(card_html).body
+    return body.child if body is not None and body.child is not None and body.child.tag != "-text" else None
+
+
+def _insert_after(node, card_html: str):
+    """Inserts `card_html` after `node` and returns the card inserted, `node` if it does not parse"""
+    card = _fragment(card_html)
+    if card is None:
+        return node
+    node.insert_after(card)  # inserts a copy
+    return node.next
+
+
+def _insert_before(node, card_html: str):
+    """Inserts `card_html` before `node` and returns the card inserted, `node` if it does not parse"""
+    card = _fragment(card_html)
+    if card is None:
+        return node
+    node.insert_before(card)
+    return node.prev
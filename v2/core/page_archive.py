@@ -0,0 +1,204 @@
+# core/page_archive.py
+import asyncio
+import gzip
+import json
+import os
+import struct
+import threading
+from pathlib import Path
+from typing import Dict, Iterator, List, Literal, Optional, Tuple
+
+from v2.core.page_output import PageResponse
+from v2.infrastructure.logging.logger import get_logger
+
+try:
+    import zstandard
+except ImportError:  # gzip only
+    zstandard = None
+
+logger = get_logger(__name__)
+
+MAGIC = b"PGAR"
+HEADER = struct.Struct(">4sBII")  # magic, codec, url length, payload length
+CODECS = {"gzip": 1, "zstd": 2}
+CODEC_NAMES = {value: name for name, value in CODECS.items()}
+DEFAULT_CODEC = "gzip" # readable everywhere, zstd is opt-in with the zstd extra
+INDEX_SUFFIX = ".idx"
+
+Codec = Literal["zstd", "gzip"]
+
+
+class PageArchive:
+    """
+    An append-only file of compressed PageResponses, one record per page, with an offset index.
+
+    Every record is compressed on its own, so a page is read back by url with one
+    seek, and iterating streams the pages one at a time instead of loading them
+    all. Derived representations not computed yet are not stored, they are
+    recomputed from the html on access. The index (`<path>.idx`) is rebuilt from
+    the records if the last writes did not reach it. A url appended again
+    replaces the previous record.
+
+    Example:
+        ```python
+        with PageArchive("scrapped/job_pages.pages") as archive:
+            for page_response in result_pages:
+                archive.append(page_response)
+
+        with PageArchive("scrapped/job_pages.pages") as archive:
+            page = archive.get("https://www.linkedin.com/jobs/view/123/")
+            for page in archive:
+                reprocess(page)
+        ```
+    """
+
+    def __init__(self, path: str | Path, codec: Codec = DEFAULT_CODEC, level: Optional[int] = None) -> None:
+        """
+        Args:
+            path (str | Path): The archive file, created with its parents if missing.
+            codec (Codec): Compression of the records appended, zstd needs the zstandard package,
+                the `zstd` extra.
+            level (Optional[int]): Compression level, the codec's default if not given.
+
+        Raises:
+            ImportError: zstd is asked for and zstandard is not installed.
+        """
+        if codec == "zstd" and zstandard is None:
+            raise ImportError("zstd archives need the zstandard package, install the zstd extra or use codec='gzip'")
+        self.path = Path(path)
+        self.index_path = self.path.with_name(self.path.name + INDEX_SUFFIX)
+        self.codec = codec
+        self.level = level
+        self.path.parent.mkdir(exist_ok=True, parents=True)
+        self._lock = threading.Lock()
+        self._index: Dict[str, Tuple[int, int]] = {}  # url -> (offset, record size)
+        self._data = open(self.path, "a+b")
+        self._index_file = open(self.index_path, "a", encoding="utf-8")
+        self._load_index()
+
+    def __enter__(self) -> "PageArchive":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, url: str) -> bool:
+        return url in self._index
+
+    def __iter__(self) -> Iterator[PageResponse]:
+        return self.iter()
+
+    def urls(self) -> List[str]:
+        """The archived urls in the order they were last written."""
+        return [url for url, _ in sorted(self._index.items(), key=lambda item: item[1][0])]
+
+    def append(self, page_response: PageResponse, url: Optional[str] = None) -> None:
+        """Appends `page_response` as the record of `url`, its own url if not given."""
+        url = url or page_response.url
+        if not url:
+            raise ValueError("A PageResponse without url needs an explicit url to be archived")
+        payload = page_response.model_dump_json(warnings=False, exclude=page_response.underived()).encode()
+        url_bytes = url.encode()
+        compressed = self._compress(payload)
+        record = HEADER.pack(MAGIC, CODECS[self.codec], len(url_bytes), len(compressed)) + url_bytes + compressed
+        with self._lock:
+            self._data.seek(0, os.SEEK_END)
+            offset = self._data.tell()
+            self._data.write(record)
+            self._data.flush()
+            self._index_file.write(json.dumps({"url": url, "offset": offset, "size": len(record)}) + "\n")
+            self._index_file.flush()
+            self._index[url] = (offset, len(record))
+
+    async def aappend(self, page_response: PageResponse, url: Optional[str] = None) -> None:
+        """`append()` off the event loop"""
+        await asyncio.to_thread(self.append, page_response, url)
+
+    def get(self, url: str) -> Optional[PageResponse]:
+        """The archived PageResponse of `url`, None if it is not archived."""
+        location = self._index.get(url)
+        if location is None:
+            return None
+        return self._read(*location)[1]
+
+    def iter(self) -> Iterator[PageResponse]:
+        """Yields the archived PageResponses one at a time, in the order they were written."""
+        locations = sorted(self._index.values())
+        for offset, size in locations:
+            yield self._read(offset, size)[1]
+
+    def close(self) -> None:
+        with self._lock:
+            if not self._data.closed:
+                self._data.close()
+            if not self._index_file.closed:
+                self._index_file.close()
+
+    def _compress(self, payload: bytes) -> bytes:
+        if self.codec == "zstd":
+            return zstandard.ZstdCompressor(level=self.level or 3).compress(payload)
+        return gzip.compress(payload, compresslevel=self.level or 6)
+
+    @staticmethod
+    def _decompress(codec: int, data: bytes) -> bytes:
+        if CODEC_NAMES.get(codec) == "zstd":
+            if zstandard is None:
+                raise ImportError("Reading zstd records needs the zstandard package")
+            return zstandard.ZstdDecompressor().decompress(data)
+        if CODEC_NAMES.get(codec) == "gzip":
+            return gzip.decompress(data)
+        raise ValueError(f"Unknown archive codec {codec}")
+
+    def _read(self, offset: int, size: int) -> Tuple[str, PageResponse]:
+        with self._lock:
+            self._data.seek(offset)
+            record = self._data.read(size)
+        magic, codec, url_length, payload_length = HEADER.unpack_from(record)
+        if magic != MAGIC:
+            raise ValueError(f"No archive record at offset {offset} of {self.path}")
+        start = HEADER.size + url_length
+        url = record[HEADER.size:start].decode()
+        payload = self._decompress(codec, record[start:start + payload_length])
+        return url, PageResponse.model_validate_json(payload)
+
+    def _load_index(self) -> None:
+        """Reads the index, then indexes the records written after its last entry"""
+        end = 0
+        if self.index_path.exists():
+            with open(self.index_path, encoding="utf-8") as index_file:
+                for line in index_file:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue  # a torn last line
+                    self._index[entry["url"]] = (entry["offset"], entry["size"])
+                    end = max(end, entry["offset"] + entry["size"])
+        size = self.path.stat().st_size
+        if end < size:
+            self._recover(end, size)
+
+    def _recover(self, offset: int, size: int) -> None:
+        """Indexes the complete records from `offset` on and truncates a torn one"""
+        recovered = 0
+        self._data.seek(offset)
+        while offset + HEADER.size <= size:
+            header = self._data.read(HEADER.size)
+            magic, _, url_length, payload_length = HEADER.unpack(header)
+            record_size = HEADER.size + url_length + payload_length
+            if magic != MAGIC or offset + record_size > size:
+                break
+            url = self._data.read(url_length).decode()
+            self._data.seek(payload_length, os.SEEK_CUR)
+            self._index[url] = (offset, record_size)
+            self._index_file.write(json.dumps({"url": url, "offset": offset, "size": record_size}) + "\n")
+            offset += record_size
+            recovered += 1
+        self._index_file.flush()
+        if offset < size:
+            logger.warning(f"Truncating a torn record at offset {offset} of {self.path}")
+            self._data.truncate(offset)
+        if recovered:
+            logger.info(f"Recovered {recovered} record(s) missing from the index of {self.path}")
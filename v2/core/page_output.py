@@ -1,18 +1,67 @@
 # core/page_output.py
+import asyncio
 import html
-import uuid
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Type
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Type
 
 import markdownify
+from v2.core.cpu_executor import run_cpu
+from v2.core.screenshots import ScreenshotStore
 from v2.core.utils.string_utils import clean_html
 from v2.infrastructure.logging.logger import get_logger
+from v2.infrastructure.metrics.timing import span
 from playwright.async_api import Page
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr, computed_field, model_validator
+from selectolax.parser import HTMLParser
 
 logger = get_logger(__name__)
 
+DERIVED_FIELDS = ("markdown", "clean_html", "clean_html2") # computed from the html on first access
+PAYLOAD_FIELDS = ("html", "text") + DERIVED_FIELDS # the heavy representations, dropped by PageResponse.release()
+
+
+class CapturedResponse(BaseModel):
+    url:str
+    status:int|None=None
+    body:Any=None # the parsed JSON body
+
+
+class CaptureProfile(BaseModel):
+    """
+    Which representations of a page `parse_page_response` collects.
+
+    The screenshot, html and text are read from the browser, the derived
+    representations are computed from the html when first accessed, so a
+    disabled one is never computed and reads as None. A screenshot left to
+    None is taken when the engine's `ScreenshotPolicy` wants it.
+
+    Example:
+        ```python
+        html_only = CaptureProfile(screenshot=False, text=False, markdown=False, clean_html=False, clean_html2=False)
+        results = await engine.scrap(urls=job_urls, capture_profile=html_only)
+        ```
+    """
+    screenshot:bool|None=None # True or False overrides the screenshot policy
+    html:bool=True # page.content(), the derived representations need it
+    text:bool=True # inner_text('body') in a browser, the visible text of the html otherwise
+    markdown:bool=True
+    clean_html:bool=True
+    clean_html2:bool=True
+
+    def derived(self) -> Set[str]:
+        """The derived representations this profile keeps"""
+        return {name for name in DERIVED_FIELDS if getattr(self, name)}
+
+
+def _derivation(name:str) -> Tuple[Callable[[str], str], str]:
+    """The function computing the derived representation `name` from the html and its timing stage"""
+    return {
+        "markdown": (markdownify.markdownify, "markdownify"),
+        "clean_html": (html.unescape, "unescape"),
+        "clean_html2": (clean_html, "clean_html"),
+    }[name]
+
 
 class PageResponse(BaseModel):
     screenshot_path:str|None=None 
@@ -21,36 +70,178 @@ class PageResponse(BaseModel):
     extracted_data:dict|Type[BaseModel]|str|None=None
     text:str|None=None
     html:str|None=None
-    markdown:str|None=None
-    clean_html:str|None=None
-    clean_html2:str|None=None
+    captured:List[CapturedResponse]|None=None # JSON responses matched by the page's capture_patterns
+    timings:Dict[str,float]|None=None # seconds spent per stage on this url
+    content_ref:str|None=None # where the released payloads are kept, e.g. the path of a PageArchive
+    _derived:Dict[str,str|None]=PrivateAttr(default_factory=dict) # derived representations computed or given so far
+    _enabled:Set[str]=PrivateAttr(default_factory=lambda: set(DERIVED_FIELDS))
     
     class Config:
         arbitrary_types_allowed=True
+
+    @model_validator(mode="wrap")
+    @classmethod
+    def _keep_given_derived(cls, data, handler):
+        """Derived representations given as input, e.g. from a saved PageResponse, are used as they are"""
+        given = {}
+        if isinstance(data, dict):
+            given = {name: data[name] for name in DERIVED_FIELDS if name in data}
+            data = {key: value for key, value in data.items() if key not in given}
+        page_response = handler(data)
+        page_response._derived.update(given)
+        return page_response
+
+    @computed_field
+    @property
+    def markdown(self) -> str|None:
+        return self._derive("markdown")
+
+    @markdown.setter
+    def markdown(self, value:str|None) -> None:
+        self._derived["markdown"] = value
+
+    @computed_field
+    @property
+    def clean_html(self) -> str|None:
+        return self._derive("clean_html")
+
+    @clean_html.setter
+    def clean_html(self, value:str|None) -> None:
+        self._derived["clean_html"] = value
+
+    @computed_field
+    @property
+    def clean_html2(self) -> str|None:
+        return self._derive("clean_html2")
+
+    @clean_html2.setter
+    def clean_html2(self, value:str|None) -> None:
+        self._derived["clean_html2"] = value
+
+    def keep_derived(self, names:Set[str]) -> None:
+        """Limits the derived representations to `names`, the others read as None"""
+        self._enabled = set(names)
+
+    def underived(self) -> Set[str]:
+        """The derived representations not computed yet, excluding them from a dump avoids computing them"""
+        return {name for name in DERIVED_FIELDS if name not in self._derived}
+
+    def release(self, names:Set[str]|None=None) -> None:
+        """Drops the representations `names`, all of PAYLOAD_FIELDS by default, they read as None afterwards"""
+        for name in PAYLOAD_FIELDS if names is None else names:
+            if name in DERIVED_FIELDS:
+                self._derived[name] = None
+            else:
+                setattr(self, name, None)
+
+    async def aderive(self, names:Set[str]|None=None) -> None:
+        """Computes the enabled derived representations `names` not computed yet, all by default, with `run_cpu`"""
+        pending = [
+            name for name in DERIVED_FIELDS
+            if (names is None or name in names) and name in self._enabled and name not in self._derived
+        ]
+        if self.html is None or not pending:
+            return
+
+        async def derive(name:str) -> None:
+            func, stage = _derivation(name)
+            with span(stage):
+                self._derived[name] = await run_cpu(func, self.html)
+
+        await asyncio.gather(*(derive(name) for name in pending))
+
+    def _derive(self, name:str) -> str|None:
+        if name in self._derived:
+            return self._derived[name]
+        if name not in self._enabled or self.html is None:
+            return None
+        func, stage = _derivation(name)
+        with span(stage):
+            value = self._derived[name] = func(self.html)
+        return value
         
     def __repr__(self):
         return f"PageResponse(url= {self.url[:100]}, kind= {self.kind})"
     
 
-async def parse_page_response(page:Page, save_dir:Path=None, **screenshot_kwargs) -> PageResponse:
-    try:
-        if not save_dir:
-            save_dir = Path.cwd()
-        save_dir = save_dir/ 'screenshots'
-        filepath = save_dir/ f'{uuid.uuid4()}.png'
-        filepath.parent.mkdir(exist_ok=True, parents=True)
-        await page.screenshot(full_page=True, path=filepath, **screenshot_kwargs)
-        
-    except Exception as e:
-        logger.error(f"error while getting the scrrreenhot, {e}",exc_info=True)
-        
-    raw_html = await page.content()
-    return PageResponse(
-        screenshot_path=filepath.absolute().as_posix(),
-        url = page.url,
-        text = await page.inner_text('body'),
-        html = raw_html,
-        markdown=markdownify.markdownify(raw_html),
-        clean_html = html.unescape(raw_html),
-        clean_html2 = clean_html(raw_html)
-    )
\ No newline at end of file
+async def parse_page_response(
+    page:Page,
+    save_dir:Path=None,
+    profile:CaptureProfile|None=None,
+    screenshots:ScreenshotStore|None=None,
+    derive:bool=False,
+    **screenshot_kwargs,
+) -> PageResponse:
+    """Reads the representations of `page` selected by `profile`, all of them by default
+
+    The screenshot is taken by `screenshots`, a store writing to `save_dir/screenshots`
+    with the default policy if not given. Left to None by the profile, it is only
+    taken if the policy's `when` is "always". With `derive` the derived representations
+    of the profile are computed right away with `run_cpu`, in the CPU executor in use.
+    """
+    profile = profile or CaptureProfile()
+    if screenshots is None:
+        screenshots = ScreenshotStore(directory=save_dir / 'screenshots' if save_dir else None)
+    take_screenshot = profile.screenshot
+    if take_screenshot is None:
+        take_screenshot = screenshots.policy.when == "always"
+    screenshot_path = await screenshots.capture(page, **screenshot_kwargs) if take_screenshot else None
+
+    raw_html = text = None
+    if profile.html:
+        with span("content"):
+            raw_html = await page.content()
+    if profile.text:
+        with span("inner_text"):
+            text = await page.inner_text('body')
+    page_response = PageResponse(
+        screenshot_path=screenshot_path,
+        url=page.url,
+        text=text,
+        html=raw_html,
+    )
+    page_response.keep_derived(profile.derived())
+    if derive:
+        await page_response.aderive()
+    return page_response
+
+
+def build_page_response(url:str, raw_html:str, text:str|None=None, screenshot_path:str|None=None, profile:CaptureProfile|None=None) -> PageResponse:
+    """Builds a PageResponse from raw html, the text is taken from the html body if not given
+
+    The derived representations are computed from the html when first accessed.
+    """
+    profile = profile or CaptureProfile()
+    if text is None and profile.text:
+        with span("html_to_text"):
+            text = html_to_text(raw_html)
+    page_response = PageResponse(
+        screenshot_path=screenshot_path,
+        url = url,
+        text = text,
+        html = raw_html if profile.html else None,
+    )
+    page_response.keep_derived(profile.derived())
+    return page_response
+
+
+async def abuild_page_response(url:str, raw_html:str, text:str|None=None, screenshot_path:str|None=None,
+                               profile:CaptureProfile|None=None, derive:bool=False) -> PageResponse:
+    """`build_page_response` with the text, and the derived representations if `derive`, computed with `run_cpu`"""
+    profile = profile or CaptureProfile()
+    if text is None and profile.text:
+        with span("html_to_text"):
+            text = await run_cpu(html_to_text, raw_html)
+    page_response = build_page_response(url, raw_html, text=text, screenshot_path=screenshot_path, profile=profile)
+    if derive:
+        await page_response.aderive()
+    return page_response
+
+
+def html_to_text(raw_html:str) -> str:
+    """The visible text of the html body, close to what `inner_text('body')` returns in a browser"""
+    tree = HTMLParser(raw_html)
+    tree.strip_tags(["script", "style", "noscript", "template"])
+    if tree.body is None:
+        return ""
+    return tree.body.text(separator="\n", strip=True)
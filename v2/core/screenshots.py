@@ -0,0 +1,181 @@
+# core/screenshots.py
+import asyncio
+import hashlib
+import io
+import os
+import re
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Literal, Optional
+
+from playwright.async_api import Page
+from pydantic import BaseModel, model_validator
+
+from v2.infrastructure.logging.logger import get_logger
+from v2.infrastructure.metrics.timing import span
+
+logger = get_logger(__name__)
+
+DEFAULT_SCREENSHOT_DIR = "screenshots"
+DEFAULT_QUALITY = 80
+SCREENSHOT_NAME = re.compile(r"[0-9a-f]{32}\.(png|jpeg|webp)") # the files a store names by content hash, the only ones pruned
+
+
+class ScreenshotPolicy(BaseModel):
+    """
+    When screenshots are taken, of what area, in which format and how many are kept.
+
+    With `when="needed"` only pages whose extraction strategy reads the image
+    are captured. `on_failure` additionally captures pages that failed or were
+    not ready in time, for debugging. Files are named by their content hash, so
+    identical screenshots are stored once. Retention is opt-in, with `max_files`
+    or `max_bytes` the least recently written of the content hash named files are
+    deleted beyond them, other files of the directory are left alone. Mind that
+    `PageResponse.screenshot_path` values kept elsewhere, e.g. in checkpoints,
+    may point to a pruned file. WebP needs Pillow.
+
+    Example:
+        ```python
+        debug_only = ScreenshotPolicy(when="never", on_failure=True, area="viewport", format="webp", quality=60)
+        engine = ScraperEngine(platform, screenshot_policy=debug_only)
+        ```
+    """
+    when: Literal["always", "needed", "never"] = "needed"
+    on_failure: bool = False
+    area: Literal["full_page", "viewport", "clip"] = "full_page"
+    clip: Optional[Dict[str, float]] = None  # x, y, width and height in CSS pixels, for area="clip"
+    format: Literal["png", "jpeg", "webp"] = "jpeg"
+    quality: int = DEFAULT_QUALITY  # 0-100, ignored for png
+    directory: Optional[Path] = None  # cwd/screenshots if not given
+    max_files: Optional[int] = None  # screenshots kept, unbounded if None
+    max_bytes: Optional[int] = None  # total size of the screenshots kept, unbounded if None
+
+    @model_validator(mode="after")
+    def check_clip(self) -> "ScreenshotPolicy":
+        if self.area == "clip" and not self.clip:
+            raise ValueError("clip is required when area is clip")
+        return self
+
+    def wants(self, needs_image: bool) -> bool:
+        """Whether a page is captured when it did not fail, `needs_image` telling if its extraction reads the image"""
+        return self.when == "always" or (self.when == "needed" and needs_image)
+
+
+class ScreenshotStore:
+    """
+    Takes screenshots as a `ScreenshotPolicy` says and writes them off the event loop.
+
+    The browser renders the image, encoding to WebP, hashing, writing and
+    pruning the directory run in a worker thread.
+
+    Example:
+        ```python
+        store = ScreenshotStore(ScreenshotPolicy(format="jpeg", quality=70, max_files=500))
+        path = await store.capture(page)
+        ```
+    """
+
+    def __init__(self, policy: Optional[ScreenshotPolicy] = None, directory: Optional[Path] = None) -> None:
+        """
+        Args:
+            policy (Optional[ScreenshotPolicy]): The policy, the defaults if not given.
+            directory (Optional[Path]): Overrides the policy's directory.
+
+        Raises:
+            ImportError: The policy asks for WebP and Pillow is not installed.
+        """
+        self.policy = policy or ScreenshotPolicy()
+        self.directory = Path(directory or self.policy.directory or Path.cwd() / DEFAULT_SCREENSHOT_DIR)
+        if self.policy.format == "webp":
+            _pillow()
+        self._lock = threading.Lock()
+        # path -> size of the screenshots in the directory, least recently written first, listed on the first write
+        self._files: Optional[OrderedDict[str, int]] = None
+        self._bytes = 0
+
+    async def capture(self, page: Page, **screenshot_kwargs) -> Optional[str]:
+        """Screenshots `page` and returns the file path, None if it failed."""
+        try:
+            with span("screenshot"):
+                data = await page.screenshot(**{**self._screenshot_options(), **screenshot_kwargs})
+            path = await asyncio.to_thread(self._write, data)
+        except Exception as e:
+            logger.error(f"Error while taking the screenshot of {page.url}: {e}", exc_info=True)
+            return None
+        return path.absolute().as_posix()
+
+    def _screenshot_options(self) -> dict:
+        policy = self.policy
+        # webp is encoded from a lossless png, the browser only renders png and jpeg
+        options = {"type": "jpeg" if policy.format == "jpeg" else "png"}
+        if policy.format == "jpeg":
+            options["quality"] = policy.quality
+        if policy.area == "full_page":
+            options["full_page"] = True
+        elif policy.area == "clip":
+            options["clip"] = policy.clip
+        return options
+
+    def _write(self, data: bytes) -> Path:
+        if self.policy.format == "webp":
+            data = _to_webp(data, self.policy.quality)
+        digest = hashlib.sha256(data).hexdigest()[:32]
+        path = self.directory / f"{digest}.{self.policy.format}"
+        with self._lock:
+            if path.exists():
+                os.utime(path)  # a duplicate, kept as recently used
+                if self._files is not None and path.name in self._files:
+                    self._files.move_to_end(path.name)
+                return path
+            self.directory.mkdir(exist_ok=True, parents=True)
+            tmp = path.with_name(f".{path.name}.tmp")
+            tmp.write_bytes(data)
+            os.replace(tmp, path)
+            if self.policy.max_files is not None or self.policy.max_bytes is not None:
+                self._track(path.name, len(data))
+        return path
+
+    def _track(self, name: str, size: int) -> None:
+        """Counts a new screenshot and deletes the least recently written beyond the retention caps"""
+        if self._files is None:
+            self._files = self._screenshots()
+            self._bytes = sum(self._files.values())
+        else:
+            self._files[name] = size
+            self._bytes += size
+        max_files = self.policy.max_files
+        max_bytes = self.policy.max_bytes
+        while self._files and (
+            (max_files is not None and len(self._files) > max_files)
+            or (max_bytes is not None and self._bytes > max_bytes)
+        ):
+            oldest, oldest_size = self._files.popitem(last=False)
+            self._bytes -= oldest_size
+            try:
+                os.remove(self.directory / oldest)
+            except FileNotFoundError:
+                pass
+
+    def _screenshots(self) -> "OrderedDict[str, int]":
+        """The sizes of the content hash named screenshots in the directory, least recently written first"""
+        entries = []
+        for entry in os.scandir(self.directory):
+            if SCREENSHOT_NAME.fullmatch(entry.name) and entry.is_file():
+                stat = entry.stat()
+                entries.append((stat.st_mtime, entry.name, stat.st_size))
+        return OrderedDict((name, size) for _, name, size in sorted(entries))
+
+
+def _pillow():
+    try:
+        from PIL import Image
+    except ImportError as e:
+        raise ImportError("WebP screenshots need Pillow, install it or use format='jpeg'") from e
+    return Image
+
+
+def _to_webp(data: bytes, quality: int) -> bytes:
+    buffer = io.BytesIO()
+    _pillow().open(io.BytesIO(data)).save(buffer, format="WEBP", quality=quality)
+    return buffer.getvalue()
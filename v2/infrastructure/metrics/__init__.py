@@ -0,0 +1,4 @@
+# infrastructure/metrics/__init__.py
+from .timing import Histogram, StageTimings, span
+
+__all__ = ['Histogram', 'StageTimings', 'span']
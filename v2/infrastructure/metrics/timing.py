@@ -0,0 +1,185 @@
+# infrastructure/metrics/timing.py
+import json
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+DEFAULT_METRIC_NAME = "scraper_stage_duration_seconds"
+UNKNOWN_PAGE_TYPE = "unknown"
+
+
+class Histogram:
+    """Cumulative-bucket histogram of durations in seconds, the Prometheus way."""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)  # the last one is +Inf
+        self.count = 0
+        self.sum = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+    def observe(self, seconds: float) -> None:
+        self.counts[bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+        self.min = seconds if self.min is None else min(self.min, seconds)
+        self.max = seconds if self.max is None else max(self.max, seconds)
+
+    def cumulative(self) -> List[Tuple[float, int]]:
+        """(upper bound, observations <= bound) pairs, ending with +Inf."""
+        total, pairs = 0, []
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            total += count
+            pairs.append((bound, total))
+        return pairs
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimates the q-quantile by linear interpolation inside its bucket."""
+        if not self.count:
+            return None
+        rank = q * self.count
+        lower, seen = 0.0, 0
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            if count and seen + count >= rank:
+                if bound == float("inf"):
+                    return self.max
+                estimate = lower + (bound - lower) * (rank - seen) / count
+                return min(max(estimate, self.min), self.max)
+            seen += count
+            lower = bound
+        return self.max
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "sum": round(self.sum, 6),
+            "min": self.min,
+            "max": self.max,
+            "mean": self.sum / self.count if self.count else None,
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "buckets": {_format_bound(bound): count for bound, count in self.cumulative()},
+        }
+
+
+class _Trace:
+    """The page type and per-url stage totals of the spans opened in one context"""
+
+    def __init__(self, timings: "StageTimings", page_type: str, stages: Dict[str, float]) -> None:
+        self.timings = timings
+        self.page_type = page_type
+        self.stages = stages
+
+
+_current_trace: ContextVar[Optional[_Trace]] = ContextVar("current_trace", default=None)
+
+
+class StageTimings:
+    """
+    Per-stage duration histograms, one per `PageBase` type.
+
+    The engine opens a `trace` for every url it processes, the code it calls
+    marks its stages with `span`, which records into the trace of the current
+    context and is a no-op outside of one. The per-url totals are kept in the
+    `stages` dict the trace yields.
+
+    Example:
+        ```python
+        timings = StageTimings()
+        with timings.trace("JobDetailPage") as stages:
+            with span("navigate"):
+                await page.goto(url)
+        print(stages)  # {'navigate': 0.41}
+        print(timings.to_prometheus())
+        ```
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        """
+        Args:
+            buckets (Sequence[float]): Histogram bucket upper bounds in seconds.
+        """
+        self.buckets = tuple(buckets)
+        self._histograms: Dict[Tuple[str, str], Histogram] = {}
+        self._lock = threading.Lock()  # spans may close in executor threads
+
+    @contextmanager
+    def trace(self, page_type: str, stages: Optional[Dict[str, float]] = None) -> Iterator[Dict[str, float]]:
+        """Makes this registry and `page_type` the target of the spans opened in the current context.
+
+        Args:
+            page_type (str): The histogram label, usually the page object's class name.
+            stages (Optional[Dict[str, float]]): Per-url totals to add to, a new dict if not given.
+        """
+        stages = {} if stages is None else stages
+        token = _current_trace.set(_Trace(self, page_type, stages))
+        try:
+            yield stages
+        finally:
+            _current_trace.reset(token)
+
+    def observe(self, page_type: str, stage: str, seconds: float) -> None:
+        with self._lock:
+            histogram = self._histograms.get((page_type, stage))
+            if histogram is None:
+                histogram = self._histograms[(page_type, stage)] = Histogram(self.buckets)
+            histogram.observe(seconds)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms.clear()
+
+    def to_dict(self) -> Dict[str, Dict[str, dict]]:
+        """{page type: {stage: histogram summary}}"""
+        with self._lock:
+            result: Dict[str, Dict[str, dict]] = {}
+            for (page_type, stage), histogram in sorted(self._histograms.items()):
+                result.setdefault(page_type, {})[stage] = histogram.to_dict()
+            return result
+
+    def to_json(self, **kwargs) -> str:
+        return json.dumps(self.to_dict(), **kwargs)
+
+    def to_prometheus(self, metric: str = DEFAULT_METRIC_NAME) -> str:
+        """The histograms in the Prometheus text exposition format."""
+        lines = [
+            f"# HELP {metric} Time spent per scraping stage and page type.",
+            f"# TYPE {metric} histogram",
+        ]
+        with self._lock:
+            for (page_type, stage), histogram in sorted(self._histograms.items()):
+                labels = f'page_type="{_escape(page_type)}",stage="{_escape(stage)}"'
+                for bound, count in histogram.cumulative():
+                    lines.append(f'{metric}_bucket{{{labels},le="{_format_bound(bound)}"}} {count}')
+                lines.append(f"{metric}_sum{{{labels}}} {histogram.sum}")
+                lines.append(f"{metric}_count{{{labels}}} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+
+@contextmanager
+def span(stage: str) -> Iterator[None]:
+    """Times the block as `stage` of the current trace, does nothing outside of a trace."""
+    trace = _current_trace.get()
+    if trace is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        trace.stages[stage] = trace.stages.get(stage, 0.0) + elapsed
+        trace.timings.observe(trace.page_type, stage, elapsed)
+
+
+def _format_bound(bound: float) -> str:
+    return "+Inf" if bound == float("inf") else repr(float(bound))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
@@ -1,203 +1,363 @@
 # scrapper/action_handler.py
+import asyncio
 import logging
-import re
-from typing import Callable
+from typing import Awaitable, Callable, Literal, Optional, Sequence
 
 from playwright.async_api import ElementHandle, Locator, Page, TimeoutError
+from pydantic import BaseModel
 
-from v2.core.page_output import PageResponse, parse_page_response
+from v2.core.list_harvest import DEFAULT_HARVEST_KEY, ListHarvester
+from v2.core.page_output import CaptureProfile, PageResponse, parse_page_response
+from v2.core.screenshots import ScreenshotStore
 from v2.infrastructure.logging.logger import get_logger
 
 logger = get_logger(__name__)
 
+DEFAULT_READY_TIMEOUT = 10.0  # seconds a page may take to show its required content
+DEFAULT_SCROLL_STEP = 300  # pixels
+DEFAULT_SCROLL_DELAY_MS = 50
+DEFAULT_SCROLL_IDLE_MS = 500  # the content is complete once its height stayed the same this long at the bottom
+DEFAULT_SCROLL_DEADLINE_MS = 15_000
+DEFAULT_EXPAND_TEXT = r"\b(Show more|See more|Expand|View more)\b"  # a JavaScript regex, matched case insensitively
+DEFAULT_EXPAND_IDLE_MS = 200  # the expanded content has rendered once the DOM stayed the same this long
+DEFAULT_EXPAND_TIMEOUT_MS = 3_000
+
+
+async def wait_for_selectors(page: Page, selectors: Sequence[str], timeout: float = DEFAULT_READY_TIMEOUT) -> bool:
+    """
+    Waits until every selector is attached to the DOM, all against one deadline.
+
+    The waits are event driven and run concurrently, so this returns as soon as the
+    last selector shows up instead of after a fixed delay.
+
+    Args:
+        page (Page): The page to wait on.
+        selectors (Sequence[str]): CSS selectors that must all be present, nothing to wait for if empty.
+        timeout (float): Seconds before giving up.
+
+    Returns:
+        bool: True if all selectors are present, False if the deadline passed first.
+    """
+    selectors = [selector for selector in selectors if selector]
+    if not selectors:
+        return True
+    results = await asyncio.gather(
+        *(page.wait_for_selector(selector, state="attached", timeout=timeout * 1000) for selector in selectors),
+        return_exceptions=True,
+    )
+    missing = [selector for selector, result in zip(selectors, results) if isinstance(result, Exception)]
+    if missing:
+        logger.warning(f"{page.url} not ready after {timeout}s, missing {missing}")
+        return False
+    return True
+
+
+class ScrollStats(BaseModel):
+    reason: Literal["end", "target", "deadline", "max_steps", "missing"]  # why the scrolling stopped
+    steps: int  # scroll steps taken
+    height: int  # scroll height of the container or document at the end, in pixels
+    elapsed_ms: float
+
+
+# Runs in the page, scrolls the container, or the document without one, by `step` pixels
+# every `delayMs` until the target shows up, or the bottom is reached and the height has
+# not changed for `idleMs`, or `deadlineMs` passed.
+SCROLL_SCRIPT = """
+async ({ container, target, step, delayMs, idleMs, deadlineMs, maxSteps }) => {
+    const start = performance.now();
+    const sleep = (ms) => new Promise((resolve) => setTimeout(resolve, ms));
+    const root = container ? document.querySelector(container) : (document.scrollingElement || document.documentElement);
+    let steps = 0;
+    const stats = (reason) => ({
+        reason, steps, height: root ? root.scrollHeight : 0, elapsed_ms: performance.now() - start,
+    });
+    if (!root) {
+        return stats("missing");
+    }
+    let lastHeight = root.scrollHeight;
+    let stableSince = performance.now();
+    let atBottom = false;
+    while (true) {
+        if (target) {
+            const element = document.querySelector(target);
+            if (element) {
+                element.scrollIntoView({ block: "center" });
+                return stats("target");
+            }
+        }
+        const now = performance.now();
+        if (now - start >= deadlineMs) {
+            return stats("deadline");
+        }
+        if (root.scrollHeight !== lastHeight) {
+            lastHeight = root.scrollHeight;
+            stableSince = now;
+        }
+        if (root.scrollTop + root.clientHeight >= root.scrollHeight - 1) {
+            if (!atBottom) {
+                // content loaded by reaching the bottom gets idleMs to show up
+                atBottom = true;
+                stableSince = now;
+            } else if (now - stableSince >= idleMs) {
+                return stats("end");
+            }
+        } else {
+            if (maxSteps !== null && steps >= maxSteps) {
+                return stats("max_steps");
+            }
+            root.scrollBy(0, step);
+            steps += 1;
+            atBottom = false;
+            stableSince = performance.now();
+        }
+        await sleep(delayMs);
+    }
+}
+"""
+
+
+async def scroll_in_page(
+    page: Page,
+    container_selector: Optional[str] = None,
+    target_selector: Optional[str] = None,
+    step: int = DEFAULT_SCROLL_STEP,
+    step_delay_ms: int = DEFAULT_SCROLL_DELAY_MS,
+    idle_ms: int = DEFAULT_SCROLL_IDLE_MS,
+    deadline_ms: int = DEFAULT_SCROLL_DEADLINE_MS,
+    max_steps: Optional[int] = None,
+) -> ScrollStats:
+    """
+    Scrolls a container or the document in the browser, in a single round trip.
+
+    The whole loop runs in the page, the selectors are passed as arguments instead of
+    being interpolated into the script. It stops when `target_selector` is in the
+    DOM (scrolled into view), or once the bottom is reached and the content height
+    stayed the same for `idle_ms`, lazily loaded content included, or after `deadline_ms`.
+
+    Args:
+        page (Page): The page to scroll.
+        container_selector (Optional[str]): The scrollable element, the document if not given.
+        target_selector (Optional[str]): Stop as soon as this selector is present.
+        step (int): Pixels per scroll step.
+        step_delay_ms (int): Milliseconds between two steps.
+        idle_ms (int): Milliseconds the height must stay the same at the bottom.
+        deadline_ms (int): Milliseconds before giving up.
+        max_steps (Optional[int]): Scroll steps before giving up, unbounded if None.
+
+    Returns:
+        ScrollStats: Why it stopped, the steps taken, the final scroll height and the time spent.
+    """
+    stats = await page.evaluate(
+        SCROLL_SCRIPT,
+        {
+            "container": container_selector,
+            "target": target_selector,
+            "step": step,
+            "delayMs": step_delay_ms,
+            "idleMs": idle_ms,
+            "deadlineMs": deadline_ms,
+            "maxSteps": max_steps,
+        },
+    )
+    return ScrollStats(**stats)
+
+
+# Runs in the page, clicks every visible control matching `selector`, and `text` if given,
+# that is not aria-expanded, then waits until the DOM did not change for `idleMs`, at most `timeoutMs`.
+EXPAND_SCRIPT = """
+async ({ selector, text, idleMs, timeoutMs }) => {
+    const pattern = text ? new RegExp(text, "i") : null;
+    let expanded = 0;
+    for (const control of document.querySelectorAll(selector)) {
+        if ((control.getAttribute("aria-expanded") || "").toLowerCase() === "true" || control.disabled) {
+            continue;
+        }
+        if (control.getClientRects().length === 0) {
+            continue;  // hidden
+        }
+        if (pattern && !pattern.test(control.innerText || control.textContent || "")) {
+            continue;
+        }
+        control.click();
+        expanded += 1;
+    }
+    if (expanded > 0) {
+        await new Promise((resolve) => {
+            let idle;
+            const observer = new MutationObserver(() => {
+                clearTimeout(idle);
+                idle = setTimeout(done, idleMs);
+            });
+            const deadline = setTimeout(done, timeoutMs);
+            function done() {
+                observer.disconnect();
+                clearTimeout(idle);
+                clearTimeout(deadline);
+                resolve();
+            }
+            observer.observe(document.documentElement, { childList: true, subtree: true, characterData: true });
+            idle = setTimeout(done, idleMs);
+        });
+    }
+    return expanded;
+}
+"""
+
+
+async def expand_in_page(
+    page: Page,
+    selector: str = "button",
+    text_pattern: Optional[str] = None,
+    idle_ms: int = DEFAULT_EXPAND_IDLE_MS,
+    timeout_ms: int = DEFAULT_EXPAND_TIMEOUT_MS,
+) -> int:
+    """
+    Expands every collapsed control of the page in a single round trip.
+
+    The controls are found and clicked in the page, those with `aria-expanded="true"`,
+    disabled or hidden are skipped. The page is then waited for once, until the DOM
+    stayed unchanged for `idle_ms`, instead of after each click.
+
+    Args:
+        page (Page): The page to expand.
+        selector (str): CSS selector of the controls, passed to the page as an argument.
+        text_pattern (Optional[str]): Regex their text must match, case insensitive, any text if None.
+        idle_ms (int): Milliseconds without DOM changes after which the page has settled.
+        timeout_ms (int): Milliseconds to wait at most for the page to settle.
+
+    Returns:
+        int: The number of controls clicked.
+    """
+    expanded = await page.evaluate(
+        EXPAND_SCRIPT,
+        {"selector": selector, "text": text_pattern, "idleMs": idle_ms, "timeoutMs": timeout_ms},
+    )
+    logger.debug(f"Expanded {expanded} control(s) matching {selector} on {page.url}")
+    return expanded
+
+
 async def rolldown_next_button(page: Page, next_button_func:Callable[[Page], Locator | ElementHandle| None], action:Callable[[Page],None], current_depth: int = 1,
-                                max_depth: int = 10, timeout:int=1) -> list[PageResponse]:
+                                max_depth: int = 10, harvest_selector: Optional[str] = None,
+                                harvest_key: str = DEFAULT_HARVEST_KEY,
+                                throttle: Optional[Callable[[str], Awaitable[None]]] = None,
+                                screenshots: Optional[ScreenshotStore] = None,
+                                capture_profile: Optional[CaptureProfile] = None) -> list[PageResponse]:
     """
-    Handle pagination and content collection
+    Handle pagination and content collection, by clicking the next page button in a loop
     
     Args:            
         page:Page = a playwright page instance
         next_button_func:Callable[[Page], Locator | ElementHandle| None] = a function that returns the next page button locator
         action:Callable[[Page],None] = a function that performs the action on the page
-        current_depth:int = the current depth of the recursion
-        max_depth:int = the maximum depth of the recursion
-        timeout:int = the timeout for the action(miliseconds)
+        current_depth:int = the depth of the current page
+        max_depth:int = the depth of the last page, -1 for no limit
+        harvest_selector:Optional[str] = the cards of a virtualized list collected while `action` runs, see ListHarvester
+        harvest_key:str = the attribute identifying a card
+        throttle:Optional[Callable[[str], Awaitable[None]]] = awaited with the page url before each click, e.g. DomainScheduler.wait
+        screenshots:Optional[ScreenshotStore] = the store taking the screenshots, e.g. the engine's
+        capture_profile:Optional[CaptureProfile] = the representations parsed from each page, all of them if not given
 
     Returns:
             list[PageResponse]: a list of PageResponse objects
     """
     content = []
-
-    try:
-        await action(page)
-        await page.wait_for_timeout(timeout=timeout) 
-        page_res = await parse_page_response(page)
-        content.append(page_res)
-
-        if next_button_func:
+    depth = current_depth
+
+    while True:
+        parsed = False
+        try:
+            async with ListHarvester(page, harvest_selector, harvest_key) as harvester:
+                await action(page)
+                content.append(await harvester.merge(
+                    await parse_page_response(page, profile=capture_profile, screenshots=screenshots)
+                ))
+            parsed = True
+
+            if not next_button_func or not (max_depth == -1 or depth < max_depth):
+                break
             next_page_button = await next_button_func(page)
+            if not next_page_button:
+                break
+            if not (await next_page_button.is_visible()):
+                await next_page_button.scroll_into_view_if_needed()
+            if throttle is not None:
+                await throttle(page.url)  # the click loads the next result page
+            await next_page_button.click()
+            await page.wait_for_url("**/**/*", wait_until="domcontentloaded")
+        except Exception as e:
+            logger.error(f"Error in rolldown_next_button at depth {depth}, {page.url}: {e}")
+            if not parsed:
+                content.append(await parse_page_response(page, profile=capture_profile, screenshots=screenshots))
+            break
+        depth += 1
 
-            if next_page_button and (max_depth == -1 or current_depth < max_depth):
-                if not (await next_page_button.is_visible()):
-                    await next_page_button.scroll_into_view_if_needed()
-                await next_page_button.click()
-                await page.wait_for_url("**/**/*", wait_until="domcontentloaded")
-
-                next_content = await rolldown_next_button(
-                    page=page, next_button_func=next_button_func, action=action,
-                    current_depth=current_depth + 1, max_depth=max_depth, timeout=timeout
-                )
-                content.extend(next_content)
-    except Exception as e:
-        logger.error(f"Error in rolldown_next_button at depth {current_depth}, {page.url}: {e}")
-        content.append(await parse_page_response(page))
-                
     return content
 
 
-async def scroll_to(page:Page, selector:str, timeout:int=1)->None:
+async def scroll_to(page:Page, selector:str, timeout:int=5000)->None:
+    """Scrolls `selector` into view, waiting up to `timeout` milliseconds for it to show up"""
     try: 
         await page.locator(selector=selector).scroll_into_view_if_needed(timeout=timeout)
     except TimeoutError:
         logger.error("Timeout while scrolling to element.")
-    await page.wait_for_timeout(timeout=timeout)
     
-async def scroll_container(page: Page, container_selector: str, scroll_step:int=300,  delay:int=1):
+async def scroll_container(page: Page, container_selector: str, scroll_step:int=300,  delay:int=1) -> ScrollStats | None:
     """
-    Scrolls the container to the bottom of the page.
+    Scrolls the container to the bottom, until its content stops growing.
     
     :param page: Playwright page object.
     :param container_selector: CSS selector of the container to scroll.
     :param scroll_step: Number of pixels to scroll down per step.
     :param delay: Delay in milliseconds between scroll steps.
+    :return: The scroll statistics, None if the container did not show up.
     """
     
     try:
         # Wait for the container to be available
         container = await page.wait_for_selector(container_selector)
-        
-        # Check if the container exists
         if not container:
-            print("Container not found!")
-            return
-
-        logger.debug("Container found. Starting to scroll...")
-
-        # Get the container's bounding box for reference
-        bounding_box = await container.bounding_box()
-        if not bounding_box:
-            logger.error("Failed to get bounding box of the container!")
-            return
-
-        # Scroll the container slowly to the end
-        while True:
-            # Evaluate the current scroll position and height of the container
-            scroll_position = await page.evaluate(
-                f"""() => {{
-                    const container = document.querySelector("{container_selector}");
-                    if (container) {{
-                        return {{ top: container.scrollTop, height: container.scrollHeight, offset: container.offsetHeight }};
-                    }}
-                    return null;
-                }}"""
-            )
-            
-            if not scroll_position:
-                logger.error("Failed to retrieve scroll position!")
-                break
-
-            
-            current_top = scroll_position["top"]
-            scroll_height = scroll_position["height"]
-            offset_height = scroll_position["offset"]
-
-            # If already at the bottom, stop scrolling
-            if current_top + offset_height >= scroll_height:
-                logger.info("Reached the end of the container.")
-                break
-
-            # Scroll by step
-            await page.evaluate(
-                f"""() => {{
-                    const container = document.querySelector("{container_selector}");
-                    if (container) {{
-                        container.scrollBy(0, {scroll_step});
-                    }}
-                }}"""
-            )
-            await page.wait_for_timeout(delay)
+            logger.error(f"Container {container_selector} not found!")
+            return None
 
+        stats = await scroll_in_page(page, container_selector=container_selector, step=scroll_step, step_delay_ms=delay)
+        logger.debug(f"Scrolled {container_selector}: {stats}")
+        return stats
     except Exception as e:
         logger.exception("Scolling error ", exc_info=e)
+        return None
 
-async def expand_all_buttons(page: Page, timeout:int=1):
+async def expand_all_buttons(page: Page, timeout:int=DEFAULT_EXPAND_TIMEOUT_MS) -> int:
     """
-    Finds and clicks all expandable buttons on the page that have text like 'Show more' or 'See more'.
+    Clicks all the collapsed buttons on the page with text like 'Show more' or 'See more', in one round trip.
     
     :param page: Playwright page object.
+    :param timeout: Milliseconds to wait at most for the page to settle after the clicks.
+    :return: The number of buttons clicked.
     """
     try:
-        # Locate all buttons with text 'Show more', 'See more', or similar
-        expandable_buttons = page.locator("button").filter(
-            has_text=re.compile(r"\b(Show more|See more|Expand|View more)\b", re.IGNORECASE)
-        )
-        # Count all matched buttons
-        button_count = await expandable_buttons.count()
-        if button_count == 0:
-            logger.debug("No expandable buttons found.")
-            return
-
-        logger.debug(f"Found {button_count} expandable button(s). Clicking them now...")
-        for i in range(button_count):
-            button = expandable_buttons.nth(i)
-            is_expanded = await button.get_attribute("aria-expanded", timeout=timeout)
-
-            # If the button is not expanded, click it
-            if is_expanded != "true":
-                try: 
-                    logger.debug(f"Clicking button {i+1} with text: {await button.inner_text()}")
-                    await button.click(timeout=timeout)
-                except TimeoutError:
-                    logger.error("Timeout while clicking button.")
-            else:
-                logger.debug(f"Button {i+1} is already expanded.")
-    except TimeoutError as e:
+        return await expand_in_page(page, "button", text_pattern=DEFAULT_EXPAND_TEXT, timeout_ms=timeout)
+    except Exception as e:
         logger.error(f"An error occurred while expanding buttons: {e}")
+        return 0
         
 
-async def expand_buttons_by_selector(page: Page, selector: str, timeout:int=1):
+async def expand_buttons_by_selector(page: Page, selector: str, timeout:int=DEFAULT_EXPAND_TIMEOUT_MS) -> int:
     """
-    Finds and clicks all buttons matching a specific CSS selector to expand their content.
+    Clicks all the collapsed buttons matching a specific CSS selector to expand their content, in one round trip.
 
     Args:
         page (Page): The Playwright page instance to operate on.
         selector (str): The CSS selector to locate the buttons to be expanded.
+        timeout (int): Milliseconds to wait at most for the page to settle after the clicks.
+
+    Returns:
+        int: The number of buttons clicked.
     """
     try:
-        # Locate all buttons matching the provided selector
-        expandable_buttons = page.locator(selector)
-        
-        # Count all matched buttons
-        button_count = await expandable_buttons.count()
-        if button_count == 0:
-            print(f"No buttons found matching selector: {selector}")
-            return
-
-        print(f"Found {button_count} button(s) matching the selector. Clicking them now...")
-
-        for i in range(button_count):
-            button = expandable_buttons.nth(i)
-            is_expanded = await button.get_attribute("aria-expanded")
-
-            # If the button is not already expanded, click it
-            if is_expanded is None or is_expanded.lower() != "true":
-                print(f"Clicking button {i+1} with text: {await button.inner_text()}")
-                await button.click(timeout=timeout)
-                await page.wait_for_timeout(timeout=timeout)  # Allow time for content to expand
-            else:
-                print(f"Button {i+1} is already expanded.")
+        return await expand_in_page(page, selector, timeout_ms=timeout)
     except Exception as e:
-        print(f"An error occurred while expanding buttons: {e}")
+        logger.error(f"An error occurred while expanding buttons: {e}")
+        return 0
 
 
 async def scroll_to_element(
@@ -207,7 +367,7 @@ async def scroll_to_element(
     step_size: int = 300,
     delay_ms: int = 1,
     max_attempts: int = 50  # Maximum number of scroll attempts to prevent infinite loops
-) -> None:
+) -> ScrollStats:
     """
     Scrolls to a specific element or to the bottom of the page using Playwright.
 
@@ -215,57 +375,28 @@ async def scroll_to_element(
         page (Page): The Playwright page instance to operate on.
         selector (str, optional): The CSS selector of the element to scroll to. Defaults to None.
         scroll_to_end (bool, optional): If True, scrolls to the bottom of the page. Defaults to False.
-        step_size (int, optional): The amount of pixels to scroll per step. Defaults to 100.
-        delay_ms (int, optional): Delay in milliseconds between scroll steps. Defaults to 200.
-        max_attempts (int, optional): The maximum number of scroll attempts to prevent infinite loops. Defaults to 50.
+        step_size (int, optional): The amount of pixels to scroll per step. Defaults to 300.
+        delay_ms (int, optional): Delay in milliseconds between scroll steps. Defaults to 1.
+        max_attempts (int, optional): The maximum number of scroll steps to prevent infinite loops. Defaults to 50.
+
+    Returns:
+        ScrollStats: The scroll statistics.
+
+    Raises:
+        ValueError: Neither a selector nor scroll_to_end is given, or the element never showed up.
     """
-    if scroll_to_end:
-        # Retrieve the current scroll position and height
-        previous_height = await page.evaluate("window.scrollY")
-        scroll_height = await page.evaluate("document.body.scrollHeight")
-        attempts = 0
-
-        while previous_height < scroll_height and attempts < max_attempts:
-            # Scroll down by step_size
-            await page.evaluate(f"window.scrollBy(0, {step_size})")
-
-            # Wait between steps
-            await page.wait_for_timeout(delay_ms)
-
-            # Update the current scroll position
-            previous_height = await page.evaluate("window.scrollY")
-            scroll_height = await page.evaluate("document.body.scrollHeight")
-            attempts += 1
-
-        if attempts >= max_attempts:
-            print("Reached maximum scroll attempts. Stopping to avoid infinite loop.")
-
-    elif selector:
-        # Scroll to the specified element in increments
-        element_position = await page.evaluate(
-            f"(() => {{ const el = document.querySelector('{selector}'); return el ? el.getBoundingClientRect().top + window.scrollY : null; }})()"
-        )
-        if element_position is None:
-            raise ValueError(f"Element with selector '{selector}' not found.")
-
-        current_position = await page.evaluate("window.scrollY")
-        attempts = 0
-
-        while current_position < element_position and attempts < max_attempts:
-            # Scroll down by step_size
-            await page.evaluate(f"window.scrollBy(0, {step_size})")
-
-            # Wait between steps
-            await page.wait_for_timeout(delay_ms)
-
-            # Update the current scroll position
-            current_position = await page.evaluate("window.scrollY")
-            attempts += 1
-
-        if attempts >= max_attempts:
-            print("Reached maximum scroll attempts while scrolling to element. Stopping to avoid infinite loop.")
-        else:
-            # Ensure the element is fully in view
-            await page.locator(selector).scroll_into_view_if_needed()
-    else:
-        raise ValueError("Either a selector must be provided or scroll_to_end must be True.")
\ No newline at end of file
+    if not scroll_to_end and not selector:
+        raise ValueError("Either a selector must be provided or scroll_to_end must be True.")
+
+    stats = await scroll_in_page(
+        page,
+        target_selector=None if scroll_to_end else selector,
+        step=step_size,
+        step_delay_ms=delay_ms,
+        max_steps=max_attempts,
+    )
+    if stats.reason == "max_steps":
+        logger.warning("Reached maximum scroll attempts. Stopping to avoid infinite loop.")
+    elif not scroll_to_end and stats.reason != "target":
+        raise ValueError(f"Element with selector '{selector}' not found.")
+    return stats
@@ -1,13 +1,18 @@
 # platforms/base_platform.py
+import math
 import re
 from abc import ABC, abstractmethod
 from typing import Dict, List, Optional, Type
+from urllib.parse import parse_qs, urlencode, urlsplit, urlunsplit
 
 from playwright.async_api import Page, Locator, ElementHandle
 from pydantic import BaseModel
 
 from v2.core.extraction import ExtractionStrategyBase
+from v2.core.list_harvest import DEFAULT_HARVEST_KEY
+from v2.core.page_output import CapturedResponse, CaptureProfile
 from v2.infrastructure.logging import get_logger
+from v2.platforms.action_utils import DEFAULT_READY_TIMEOUT
 
 logger = get_logger(__name__)
 
@@ -16,12 +21,44 @@ class PageBase(ABC):
     extraction_model: Type[BaseModel] | None = None
     extraction_strategy: Optional[ExtractionStrategyBase] = None
     url_pattern: str | None = None
+    # capture mode, JSON responses whose url matches one of these regexes are attached to the PageResponse
+    capture_patterns: List[str] = []
+    capture_only: bool = False # skip the screenshot and DOM serialization when something was captured
+    capture_profile: CaptureProfile | None = None # representations collected from the page, None for all of them
+    browserless: bool = False # fetch with the session's HTTP client instead of a tab, for pages that need no JavaScript
+    # readiness, the engine waits for these selectors after navigating, None for the extraction mapping's top-level selectors
+    ready_selectors: List[str] | None = None
+    ready_timeout: float = DEFAULT_READY_TIMEOUT # seconds, the page is parsed as it is once they pass
+    # virtualized lists, cards matching harvest_selector are collected while page_action runs, see ListHarvester
+    harvest_selector: str | None = None # None parses the list as the DOM holds it at the end
+    harvest_key: str = DEFAULT_HARVEST_KEY # the attribute identifying a card
 
     def url_match(self, url: str) -> bool:
         if not self.url_pattern:
             return False
         return bool(re.search(self.url_pattern, url))
 
+    def readiness_selectors(self) -> List[str]:
+        """Selectors that must all be present before the page is worked on.
+
+        By default a page is ready once any top-level field of its extraction
+        mapping is in the DOM, pages without a mapping are ready on load.
+        """
+        if self.ready_selectors is not None:
+            return list(self.ready_selectors)
+        mapping = getattr(self.extraction_strategy, "extraction_mapping", None)
+        if mapping is None:
+            return []
+        selectors = [config.selector for config in mapping.extraction_configs.values() if config.selector]
+        return [", ".join(selectors)] if selectors else []
+
+    def parse_captured(self, captured: List[CapturedResponse]) -> dict | None:
+        """Builds the extracted data from the captured JSON responses.
+
+        Returning None, the default, leaves the extraction to the extraction strategy.
+        """
+        return None
+
     @abstractmethod
     async def page_action(self, page: Page):
         pass
@@ -31,6 +68,18 @@ class WebsitePlatform(ABC):
     base_url = 'https://example.com'
     login_url = 'https://example.com/login/'
     dummy_page:PageBase = None #fallback page for cases where the website doesnt have a login page
+    # politeness per domain, see v2.scraper.scheduler.DomainScheduler
+    rate_limit: float | None = None # requests per second, None for no limit
+    rate_burst: int = 1 # requests allowed back to back before rate_limit applies
+    min_delay: float = 0.0 # seconds between two requests to the same domain
+    login_wall_pattern: str | None = None # regex of the url a logged out request is redirected to
+    blocked_url_patterns: List[str] = [] # url regexes blocked on top of the engine's BlockingRules
+    session_cookie: str | None = None # auth cookie, a restored session holding it unexpired is trusted without navigating
+    session_check_url: str | None = None # light page opened to check a restored session with is_logged_in when the cookie cannot tell, None always logs in
+    # url pagination, result pages are fetched concurrently by url instead of clicking next, see result_page_urls
+    pagination_param: str | None = None # query parameter of the result offset, None to click through the pages
+    pagination_step: int = 1 # offset between two result pages, e.g. the results per page
+    max_result_pages: int | None = None # result pages the site serves at most, what max_depth=-1 fetches by url
     
     @property
     @abstractmethod
@@ -43,6 +92,10 @@ class WebsitePlatform(ABC):
         """Logs in to the website, imitate your login action as you are in a login page, you are in login page, now what will you do?"""
         pass
 
+    async def is_logged_in(self, page: Page) -> bool:
+        """Checks whether `page`, opened on `session_check_url`, belongs to a logged in session"""
+        return False
+
     @abstractmethod
     async def search_action(self, page: Page, search_params: Dict[str, str]) -> None:
         """Navigates to search page with the params given, implement search action, something like, click on search icon then type ,then press enter """
@@ -60,6 +113,44 @@ class WebsitePlatform(ABC):
         """
         pass
 
+    async def result_count(self, page: Page) -> Optional[int]:
+        """The number of results of the search open on `page`, None if unknown.
+
+        Bounds the result pages fetched by url, a search whose count is unknown
+        is clicked through by `after_search_action` instead.
+        """
+        return None
+
+    def result_page_urls(self, url: str, max_depth: int, result_count: Optional[int] = None) -> List[str]:
+        """The urls of the result pages following `url`, up to `max_depth` pages in all.
+
+        Built by offsetting `pagination_param` by `pagination_step` per page, no
+        further than the pages holding `result_count` results when given. Empty
+        without a `pagination_param`, with `max_depth=-1` and no `max_result_pages`,
+        or when the offset of `url` is not a number, the pages are then reached by
+        clicking next in `after_search_action`.
+        """
+        if not self.pagination_param:
+            return []
+        pages = self.max_result_pages if max_depth == -1 else max_depth
+        if not pages or pages <= 1:
+            return []
+        parts = urlsplit(url)
+        query = parse_qs(parts.query, keep_blank_values=True)
+        try:
+            first = int((query.get(self.pagination_param) or ["0"])[0] or 0)
+        except ValueError:
+            logger.warning(f"Not paginating {url} by url, its {self.pagination_param} is not a number")
+            return []
+        if result_count is not None:
+            pages = min(pages, math.ceil((result_count - first) / self.pagination_step))
+        return [
+            urlunsplit(parts._replace(query=urlencode(
+                {**query, self.pagination_param: [str(first + n * self.pagination_step)]}, doseq=True
+            )))
+            for n in range(1, pages)
+        ]
+
     @abstractmethod
     async def after_search_action(self, page: Page, *args, **kwargs)->None:
         """Handles results after search, what will you do after the search"""
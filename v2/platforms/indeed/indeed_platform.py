@@ -6,11 +6,14 @@ from v2.core.utils.file_utils import save_json
 from v2.infrastructure.logging.logger import get_logger
 from v2.platforms.base_platform import WebsitePlatform
 from playwright.async_api import Page
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
 from v2.platforms.action_utils import scroll_to_element
 
 logger = get_logger(__name__)
 
+DEFAULT_LOGIN_TIMEOUT = 30_000 # milliseconds to wait for the redirect away from the login page
+
 
 class IndeedPlatform(WebsitePlatform):
     name = 'Indeed'
@@ -24,4 +27,7 @@ class IndeedPlatform(WebsitePlatform):
         await page.fill("#login-email-input", credentials.get('email'))
         await page.fill("#login-password-input", credentials.get('password'))
         await page.click("#login-submit-button")
-        await page.wait_for_timeout(5000)
\ No newline at end of file
+        try:
+            await page.wait_for_url(lambda url: "/account/login" not in url, wait_until="domcontentloaded", timeout=DEFAULT_LOGIN_TIMEOUT)
+        except PlaywrightTimeoutError:
+            logger.error(f"Still on the Indeed login page after {DEFAULT_LOGIN_TIMEOUT}ms")
\ No newline at end of file
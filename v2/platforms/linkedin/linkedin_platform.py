@@ -1,6 +1,6 @@
 # platforms/linkedin/linkedin_platform.py
 from functools import partial
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 from playwright.async_api import ElementHandle, Locator, Page
 
@@ -11,14 +11,22 @@ from v2.platforms.action_utils import (
     # expand_all_buttons,
     rolldown_next_button,
     scroll_container,
+    scroll_to,
     scroll_to_element,
+    wait_for_selectors,
 )
 from v2.platforms.base_platform import PageBase, WebsitePlatform
 from v2.platforms.linkedin.linkedin_objects import (
     JobDescription,
     JobListing,
 )
-from v2.platforms.linkedin.linkedin_utils import perform_login, set_filters
+from v2.platforms.linkedin.linkedin_utils import (
+    LOGIN_WALL_PATTERN,
+    get_result_count,
+    is_logged_in,
+    perform_login,
+    set_filters,
+)
 
 from .linkedin_extraction import (
     get_job_description_mapping,
@@ -32,10 +40,13 @@ logger = get_logger(__name__)
 # Constants
 job_list_container = "#main > div > div.scaffold-layout__list-detail-inner.scaffold-layout__list-detail-inner--grow > div.scaffold-layout__list > div"
 job_detail_container = "#main > div > div.scaffold-layout__list-detail-inner.scaffold-layout__list-detail-inner--grow > div.scaffold-layout__detail.overflow-x-hidden.jobs-search__job-details > div"
+job_company_section = "section.jobs-company"
 
 
 class LinkedInJobListPage(PageBase):
     url_pattern = r"linkedin\.com/jobs/search/.*"
+    harvest_selector = "[data-occludable-job-id]" # the list empties the cards scrolled past
+    harvest_key = "data-occludable-job-id"
     extraction_model = JobListing
     extraction_strategy = CSSExtractionStrategy(
         extraction_mapping=get_job_listings_mapping()
@@ -64,12 +75,13 @@ class LinkedInJobDetailPage(PageBase):
     )
 
     async def page_action(self, page: Page):
-        """Handle actions for job detail page"""
+        """Handle actions for job detail page, the engine already waited for the job details
+
+        Only the company section, the last one the mapping reads, is scrolled into view
+        so it renders, instead of scrolling through the whole document.
+        """
         try:
-            await scroll_to_element(
-                page,
-                scroll_to_end=True,
-            )
+            await scroll_to(page, job_company_section)
             # await expand_all_buttons(page)
         except Exception as e:
             logger.exception("Failed to perform job detail page action", exc_info=e)
@@ -118,6 +130,24 @@ class LinkedInPlatform(WebsitePlatform):
     login_url = "https://www.linkedin.com/login"
     dummy_page = LinkedInDummyPage() # fallback page
     pages = [LinkedInJobListPage(), LinkedInJobDetailPage()]
+    rate_limit = 1.0
+    rate_burst = 5
+    min_delay = 0.2
+    login_wall_pattern = LOGIN_WALL_PATTERN
+    blocked_url_patterns = [r"media\.licdn\.com/(dms/image|playlist)/"] # images and videos without an extension
+    session_cookie = "li_at"
+    session_check_url = "https://www.linkedin.com/psettings/" # lighter than the feed, logged out sessions are sent to the login wall
+    pagination_param = "start" # job search pages are offset by &start=
+    pagination_step = 25
+    max_result_pages = 40 # LinkedIn serves the first 1000 results
+
+    async def is_logged_in(self, page: Page) -> bool:
+        """Checks the page for the signed in navigation, logged out sessions are redirected away from it"""
+        return await is_logged_in(page, self.login_wall_pattern)
+
+    async def result_count(self, page: Page) -> Optional[int]:
+        """Reads the result count above the job list"""
+        return await get_result_count(page)
 
     async def login(self, page: Page, credentials: Dict[str, str]) -> None:
         """Logs in to LinkedIn"""
@@ -163,17 +193,28 @@ class LinkedInPlatform(WebsitePlatform):
     async def after_search_action(
         self, page: Page, **kwargs
     ) -> List[PageResponse]:
-        """Handles result pages for LinkedIn"""
+        """Handles result pages for LinkedIn by clicking through them, the engine fetches them by url when it can"""
         content = []
         max_depth = kwargs.pop("max_depth", 1)
 
+        page_obj = self.get_page_object_from_url(page.url)
+
+        async def action(page: Page) -> None:
+            await wait_for_selectors(page, page_obj.readiness_selectors(), timeout=page_obj.ready_timeout)
+            await page_obj.page_action(page)
+
         try:
             result = await rolldown_next_button(
                 page=page,
                 next_button_func=self._has_next_page,
-                action=self.get_page_object_from_url(page.url).page_action,
+                action=action,
                 current_depth=1,
                 max_depth=max_depth,
+                harvest_selector=page_obj.harvest_selector,
+                harvest_key=page_obj.harvest_key,
+                throttle=kwargs.get("throttle"),
+                screenshots=kwargs.get("screenshots"),
+                capture_profile=kwargs.get("capture_profile"),
             )
             content.extend(result)
         except Exception as e:
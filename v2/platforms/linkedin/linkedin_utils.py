@@ -1,6 +1,5 @@
 
 # scrapper/filter_handler.py
-import asyncio
 import re
 from logging import getLogger
 from typing import Any, Dict, List
@@ -12,6 +11,12 @@ from v2.infrastructure.logging.logger import get_logger
 
 logger = get_logger(__name__)
 
+DEFAULT_LOGIN_TIMEOUT = 30_000 # milliseconds to wait for the signed in navigation after submitting the login
+signed_in_nav = ".global-nav__primary-link-me-menu-trigger"
+LOGIN_WALL_PATTERN = r"linkedin\.com/(authwall|login|checkpoint|uas/login)" # where logged out sessions are sent
+DEFAULT_RESULT_COUNT_TIMEOUT = 5_000 # milliseconds to wait for the result count of a job search
+result_count_subtitle = ".jobs-search-results-list__subtitle" # "1,234 results" above the job list
+
 def extract_job_id(url: str) -> str:
     """
     Extracts the job ID from a LinkedIn job URL.
@@ -42,12 +47,13 @@ def extract_linkedin_profile_detail_links(html_content: str) -> List[str]:
 
 
 
-async def set_filters(page:Page, filters:dict, reset:bool=False, timeout:int=100):
+async def set_filters(page:Page, filters:dict, reset:bool=False, timeout:int=5000):
     """
     Handles label interception issue while interacting with filters.
 
     :param page: Playwright page object.
     :param filters: Dictionary of filter labels and their respective values.
+    :param timeout: Milliseconds to wait for the filter dialog to open or close.
     """
     filters = {k:v for k,v in filters.items() if len(v)>0}
 
@@ -58,11 +64,12 @@ async def set_filters(page:Page, filters:dict, reset:bool=False, timeout:int=100
     # Open the filter modal
     filter_button = page.get_by_role('button', name='Show all filters')
     await filter_button.click()
-    await page.wait_for_timeout(timeout=timeout)
-
-
 
     dialog = page.get_by_role('dialog')
+    try:
+        await dialog.wait_for(state='visible', timeout=timeout)
+    except PlaywrightTimeoutError:
+        pass
     if not await dialog.is_visible():
         logger.info("Dialog not visible.")
         return
@@ -70,8 +77,7 @@ async def set_filters(page:Page, filters:dict, reset:bool=False, timeout:int=100
     await dialog.hover()
 
     if reset:
-        dialog.get_by_role('button', name='Reset').click()
-        await page.wait_for_timeout(timeout=timeout)
+        await dialog.get_by_role('button', name='Reset').click()
         logger.debug('Filters reset')
 
 
@@ -113,7 +119,10 @@ async def set_filters(page:Page, filters:dict, reset:bool=False, timeout:int=100
     # Submit the filters
     show_results_button = page.get_by_role('button', name='Show results')
     await show_results_button.click()
-    await page.wait_for_timeout(timeout=timeout)
+    try:
+        await dialog.wait_for(state='hidden', timeout=timeout)
+    except PlaywrightTimeoutError:
+        logger.info("Filter dialog still open after showing the results.")
     
 
 
@@ -177,19 +186,45 @@ async def perform_login(page: Page, email: str='username', password: str='passwo
         logged_in= await is_logged_in(page)
         print('Login: ',logged_in)
 
-async def is_logged_in(page: Page) -> bool:
+async def get_result_count(page: Page, timeout: int = DEFAULT_RESULT_COUNT_TIMEOUT) -> int | None:
+    """
+    Reads the number of results of the job search open on the page.
+
+    Args:
+        page (Page): Playwright page object.
+        timeout (int): Milliseconds to wait for the result count to show up.
+
+    Returns:
+        int | None: The number of results, None if the page does not show it.
+    """
+    try:
+        subtitle = await page.wait_for_selector(result_count_subtitle, timeout=timeout)
+        text = await subtitle.inner_text() if subtitle else ""
+    except PlaywrightTimeoutError:
+        return None
+    match = re.search(r"(\d[\d,.]*)\s*results?", text)
+    if not match:
+        logger.debug(f"No result count in {text!r}")
+        return None
+    return int(re.sub(r"\D", "", match.group(1)))
+
+async def is_logged_in(page: Page, login_wall_pattern: str = LOGIN_WALL_PATTERN) -> bool:
     """
     Check if the user is already logged in.
 
     Args:
         page (Page): Playwright page object.
+        login_wall_pattern (str): Regex of the urls logged out sessions are sent to.
 
     Returns:
         bool: True if the user is logged in, False otherwise.
     """
     try:
-        
-        profile_button = page.locator('global-nav__content').get_by_role("button").filter(has=page.locator("global-nav__primary-link-me-menu-trigger"))
+        # logged out sessions are sent to the login page or the auth wall
+        if re.search(login_wall_pattern, page.url):
+            return False
+
+        profile_button = page.locator('.global-nav__content').get_by_role("button").filter(has=page.locator(signed_in_nav))
 
         if await profile_button.count() > 0:
             logger.info('isloggin said true')
@@ -202,7 +237,7 @@ async def is_logged_in(page: Page) -> bool:
 
         # Also check common logged-in URLs
         url = page.url
-        if "linkedin.com/feed" in url or "linkedin.com/messaging" in url:
+        if re.search(r"linkedin\.com/(feed|messaging|psettings|mypreferences)", url):
             return True
     except Exception as e:
         logger.debug(f"Error checking login status: {e}")
@@ -214,9 +249,9 @@ async def is_logged_in(page: Page) -> bool:
 async def popup_login(page: Page, email: str, password: str, *args, **kwargs):
     try: 
         await page.click(popup_signin_button)
-        await asyncio.sleep(2)
 
         email_selector = "#base-sign-in-modal_session_key"
+        await page.wait_for_selector(email_selector, timeout=5000)
         if await page.query_selector(email_selector):
             await page.fill(email_selector, email)
 
@@ -226,7 +261,7 @@ async def popup_login(page: Page, email: str, password: str, *args, **kwargs):
 
         signin_button_selector = "#base-sign-in-modal > div > section > div > div > form > div.flex.justify-between.sign-in-form__footer--full-width > button"
         await page.click(signin_button_selector)
-        await asyncio.sleep(10)
+        await wait_for_login(page)
         logger.debug("Login via popup completed.")
         
     except Exception as e:
@@ -269,10 +304,17 @@ async def standard_login(page: Page, email: str, password: str, *args, **kwargs)
             print('Keep me logged in check no found')
             
         await page.get_by_label("Sign in", exact=True).click()
-
- 
-        await page.wait_for_timeout(10*1000)
+        await wait_for_login(page)
         print("Login via standard flow completed.")
     except Exception as e:
         print(f"An error occurred during standard login: {e}")
 
+
+async def wait_for_login(page: Page, timeout: int = DEFAULT_LOGIN_TIMEOUT) -> bool:
+    """Waits for the signed in navigation after a login was submitted, False if it did not show up in `timeout` milliseconds"""
+    try:
+        await page.wait_for_selector(signed_in_nav, state="attached", timeout=timeout)
+        return True
+    except PlaywrightTimeoutError:
+        logger.warning(f"No signed in navigation after {timeout}ms on {page.url}, a checkpoint may need attention")
+        return False
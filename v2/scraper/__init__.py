@@ -1,4 +1,5 @@
 # scrapper/__init__.py
+from .browser_session import BrowserSession
 from .scraper_engine import ScraperEngine
 
-__all__ = ['ScraperEngine']
+__all__ = ['ScraperEngine', 'BrowserSession']
@@ -0,0 +1,254 @@
+# scraper/browser_session.py
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import AsyncIterator, Dict, List, Optional
+
+from playwright.async_api import Browser, BrowserContext, Playwright, async_playwright
+
+from v2.infrastructure.logging.logger import get_logger
+from v2.platforms.base_platform import WebsitePlatform
+from v2.scraper.http_fetcher import HttpFetcher
+from v2.scraper.page_pool import DEFAULT_MAX_PAGE_USES, DEFAULT_MAX_PAGES, PagePool
+from v2.scraper.resource_blocking import ResourceBlocker
+from v2.scraper.scheduler import DomainScheduler
+from v2.scraper.scraper_utils import read_cookies, save_cookies
+
+logger = get_logger(__name__)
+
+DEFAULT_POOL_SIZE = 1
+
+
+class BrowserSession:
+    """
+    Keeps one browser and a pool of authenticated contexts warm across scrap calls.
+
+    The browser is launched, cookies are loaded and the login runs once when the
+    session starts. Every context in the pool shares the resulting storage state,
+    so borrowing a context afterwards only costs a queue lookup.
+
+    Example:
+        ```python
+        async with BrowserSession(platform, credentials=creds) as session:
+            async with session.context() as context:
+                page = await context.new_page()
+        ```
+    """
+
+    def __init__(
+        self,
+        platform: WebsitePlatform,
+        credentials: Optional[Dict] = None,
+        cookie_file: Optional[str | Path] = None,
+        headless: bool = False,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        max_pages: int = DEFAULT_MAX_PAGES,
+        max_page_uses: int = DEFAULT_MAX_PAGE_USES,
+        resource_blocker: Optional[ResourceBlocker] = None,
+        persist_cookies: bool = True,
+        scheduler: Optional[DomainScheduler] = None,
+    ) -> None:
+        """
+        Args:
+            platform (WebsitePlatform): The platform the contexts are logged in to.
+            credentials (Optional[Dict]): Login credentials, login is skipped if not given.
+            cookie_file (Optional[str | Path]): File to read cookies from and save them to.
+            headless (bool): Launch the browser headless.
+            pool_size (int): Number of browser contexts kept warm.
+            max_pages (int): Maximum number of pooled tabs per context.
+            max_page_uses (int): Number of URLs a pooled tab serves before it is replaced.
+            resource_blocker (Optional[ResourceBlocker]): Blocking rules routed on every context.
+            persist_cookies (bool): Save cookies to the cookie file, off for sessions
+                that only read a cookie file shared with others.
+            scheduler (Optional[DomainScheduler]): Holds the login and session check
+                navigations to the platform's rate, e.g. the engine's.
+        """
+        if pool_size < 1:
+            raise ValueError("pool_size must be at least 1")
+
+        self.platform = platform
+        self.credentials = credentials
+        self.cookie_file = cookie_file or f"{platform.name}-cookies.jsonl"
+        self.headless = headless
+        self.pool_size = pool_size
+        self.max_pages = max_pages
+        self.max_page_uses = max_page_uses
+        self.resource_blocker = resource_blocker
+        self.persist_cookies = persist_cookies
+        self.scheduler = scheduler
+
+        self._playwright: Optional[Playwright] = None
+        self._browser: Optional[Browser] = None
+        self._contexts: List[BrowserContext] = []
+        self._idle: Optional[asyncio.Queue] = None
+        self._page_pools: Dict[BrowserContext, PagePool] = {}
+        self._http_fetcher: Optional[HttpFetcher] = None
+        self._http_fetcher_lock = asyncio.Lock()
+
+    async def __aenter__(self) -> "BrowserSession":
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    @property
+    def is_started(self) -> bool:
+        return self._browser is not None
+
+    async def start(self) -> None:
+        """Launches the browser, restores the saved session, logs in if it is no longer valid and fills the context pool."""
+        if self.is_started:
+            return
+
+        logger.info(f"Browser launching headless: {self.headless}")
+        self._playwright = await async_playwright().start()
+        self._browser = await self._playwright.chromium.launch(headless=self.headless)
+
+        saved_state = await read_cookies(cookie_file=self.cookie_file)
+        if isinstance(saved_state, dict):
+            # a full storage state, cookies and local storage
+            context = await self._new_context(storage_state=saved_state)
+        else:
+            context = await self._new_context()
+            if saved_state:
+                await context.add_cookies(cookies=saved_state)
+
+        if self.credentials:
+            if saved_state and await self._is_session_valid(context, saved_state):
+                logger.info("Restored session is still logged in, skipping login")
+            else:
+                await self._login(context)
+        self._contexts.append(context)
+
+        if self.pool_size > 1:
+            # share the authenticated state instead of logging in once per context
+            storage_state = await context.storage_state()
+            for _ in range(self.pool_size - 1):
+                self._contexts.append(await self._new_context(storage_state=storage_state))
+
+        self._idle = asyncio.Queue()
+        for context in self._contexts:
+            self._page_pools[context] = PagePool(
+                context, max_pages=self.max_pages, max_uses=self.max_page_uses
+            )
+            self._idle.put_nowait(context)
+        logger.debug(f"Browser session ready with {len(self._contexts)} context(s)")
+
+    async def _new_context(self, **kwargs) -> BrowserContext:
+        context = await self._browser.new_context(**kwargs)
+        if self.resource_blocker is not None:
+            await self.resource_blocker.apply(context)
+        return context
+
+    async def _is_session_valid(self, context: BrowserContext, saved_state: Dict | List[Dict]) -> bool:
+        """Checks the restored state by the platform's `session_cookie`, then with `is_logged_in` on its `session_check_url`
+
+        Only a state the cookie cannot tell about is checked by navigating.
+        """
+        restored = self._session_cookie_valid(saved_state)
+        if restored is not None:
+            logger.debug(f"Restored session cookie {self.platform.session_cookie} is {'valid' if restored else 'missing or expired'}")
+            return restored
+        if not self.platform.session_check_url:
+            return False
+
+        page = await context.new_page()
+        try:
+            await self._wait(self.platform.session_check_url)
+            await page.goto(self.platform.session_check_url, wait_until="domcontentloaded")
+            return await self.platform.is_logged_in(page) is True
+        except Exception as e:
+            logger.debug(f"Could not check the session, logging in: {e}")
+            return False
+        finally:
+            await page.close()
+
+    def _session_cookie_valid(self, saved_state: Dict | List[Dict]) -> Optional[bool]:
+        """Whether the saved state holds the platform's `session_cookie` unexpired, None without a `session_cookie`"""
+        name = getattr(self.platform, "session_cookie", None)
+        if not isinstance(name, str):
+            return None
+        cookies = saved_state.get("cookies", []) if isinstance(saved_state, dict) else saved_state
+        for cookie in cookies:
+            if cookie.get("name") == name and cookie.get("value"):
+                expires = cookie.get("expires", -1)
+                # -1 is a cookie of the browser session, kept until the state is discarded
+                if expires is None or expires < 0 or expires > time.time():
+                    return True
+        return False
+
+    async def _wait(self, url: str) -> None:
+        """Waits for the scheduler to allow a request to `url`"""
+        if self.scheduler is not None:
+            await self.scheduler.wait(url)
+
+    async def _login(self, context: BrowserContext) -> None:
+        login_page = await context.new_page()
+        await self._wait(self.platform.login_url)
+        await login_page.goto(self.platform.login_url, wait_until="commit")
+        try:
+            await self.platform.login(page=login_page, credentials=self.credentials)
+        except Exception as e:
+            logger.error(f"Error while logging in: {e}", exc_info=True)
+        await login_page.close()
+
+    @asynccontextmanager
+    async def context(self) -> AsyncIterator[BrowserContext]:
+        """Borrows a warm context from the pool and returns it when done."""
+        if not self.is_started:
+            raise RuntimeError("Browser session is not started")
+
+        context = await self._idle.get()
+        try:
+            yield context
+        finally:
+            self._idle.put_nowait(context)
+
+    def page_pool(self, context: BrowserContext) -> PagePool:
+        """Returns the page pool of a context borrowed from this session."""
+        return self._page_pools[context]
+
+    async def http_fetcher(self) -> HttpFetcher:
+        """Returns the session's HTTP client, started on first use with the cookies of the pool."""
+        if not self.is_started:
+            raise RuntimeError("Browser session is not started")
+
+        async with self._http_fetcher_lock:
+            if self._http_fetcher is None:
+                fetcher = HttpFetcher(cookies=await self._contexts[0].cookies())
+                await fetcher.start()
+                self._http_fetcher = fetcher
+        return self._http_fetcher
+
+    async def save_cookies(self) -> None:
+        """Saves the storage state of the pool, cookies and local storage, to the cookie file."""
+        if not self._contexts or not self.persist_cookies:
+            return
+        storage_state = await self._contexts[0].storage_state()
+        await save_cookies(content=storage_state, cookie_file=self.cookie_file)
+
+    async def close(self) -> None:
+        """Saves cookies and tears down the contexts, the browser and playwright."""
+        if not self.is_started:
+            return
+        try:
+            await self.save_cookies()
+        except Exception as e:
+            logger.error(f"Error while saving cookies: {e}", exc_info=True)
+
+        if self._http_fetcher is not None:
+            await self._http_fetcher.close()
+            self._http_fetcher = None
+        for context in self._contexts:
+            await self._page_pools[context].close()
+            await context.close()
+        await self._browser.close()
+        await self._playwright.stop()
+
+        self._contexts = []
+        self._page_pools = {}
+        self._idle = None
+        self._browser = None
+        self._playwright = None
@@ -0,0 +1,73 @@
+# scraper/capture.py
+import asyncio
+import re
+from typing import List, Optional, Sequence
+
+from playwright.async_api import Page, Response
+
+from v2.core.page_output import CapturedResponse
+from v2.infrastructure.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+CAPTURED_RESOURCE_TYPES = {"xhr", "fetch", "document"}
+
+
+class ResponseCapture:
+    """
+    Collects the JSON bodies of the responses a page receives whose url matches a pattern.
+
+    Listening starts on entering, so the capture has to wrap the navigation.
+    Bodies are read as the responses arrive and `collect()` waits for the reads
+    still running. Without patterns nothing is listened to.
+
+    Example:
+        ```python
+        async with ResponseCapture(page, [r"/voyager/api/jobs/jobPostings/"]) as capture:
+            await page.goto(url)
+            captured = await capture.collect()
+        ```
+    """
+
+    def __init__(self, page: Page, patterns: Optional[Sequence[str]] = None) -> None:
+        """
+        Args:
+            page (Page): The page to listen on.
+            patterns (Optional[Sequence[str]]): Regexes searched in the response urls.
+        """
+        self.page = page
+        self.patterns = [re.compile(pattern) for pattern in patterns or []]
+        self.captured: List[CapturedResponse] = []
+        self._reads: List[asyncio.Task] = []
+
+    async def __aenter__(self) -> "ResponseCapture":
+        if self.patterns:
+            self.page.on("response", self._on_response)
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        if self.patterns:
+            self.page.remove_listener("response", self._on_response)
+        for read in self._reads:
+            read.cancel()
+
+    def matches(self, url: str) -> bool:
+        return any(pattern.search(url) for pattern in self.patterns)
+
+    def _on_response(self, response: Response) -> None:
+        if response.request.resource_type in CAPTURED_RESOURCE_TYPES and self.matches(response.url):
+            self._reads.append(asyncio.create_task(self._read(response)))
+
+    async def _read(self, response: Response) -> None:
+        try:
+            body = await response.json()
+        except Exception as e:
+            logger.debug(f"Skipping non JSON response {response.url}: {e}")
+            return
+        self.captured.append(CapturedResponse(url=response.url, status=response.status, body=body))
+
+    async def collect(self) -> List[CapturedResponse]:
+        """Waits for the pending body reads and returns the captured responses."""
+        await asyncio.gather(*self._reads, return_exceptions=True)
+        self._reads = []
+        return list(self.captured)
@@ -0,0 +1,113 @@
+# scraper/checkpoint.py
+import asyncio
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+
+from v2.core.page_output import PageResponse
+from v2.infrastructure.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_CHECKPOINT_FILE = "scrap-checkpoints.sqlite3"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS checkpoints (
+    run_id TEXT NOT NULL,
+    url TEXT NOT NULL,
+    page_response TEXT NOT NULL,
+    completed_at REAL NOT NULL,
+    PRIMARY KEY (run_id, url)
+)
+"""
+
+
+class CheckpointStore:
+    """
+    Records the PageResponses of a scrap run in SQLite as they complete.
+
+    A run is identified by a run ID chosen by the caller. Running the same urls
+    again with the same run ID skips the completed ones, so a crashed or killed
+    run resumes where it stopped. Every write is committed on its own, in WAL
+    mode, from a worker thread.
+
+    Example:
+        ```python
+        store = CheckpointStore("jobs.sqlite3")
+        results = await engine.scrap(urls=job_urls, checkpoint=store, run_id="jobs-2024-06-01")
+        ```
+    """
+
+    def __init__(self, path: str | Path = DEFAULT_CHECKPOINT_FILE) -> None:
+        """
+        Args:
+            path (str | Path): The SQLite file, created if missing.
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(_SCHEMA)
+        self._connection.commit()
+
+    def completed(self, run_id: str) -> Set[str]:
+        """Returns the urls completed in `run_id`."""
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT url FROM checkpoints WHERE run_id = ?", (run_id,)
+            ).fetchall()
+        return {url for (url,) in rows}
+
+    def pending(self, run_id: str, urls: Iterable[str]) -> List[str]:
+        """Returns the urls of `urls` not completed in `run_id`, in their order."""
+        completed = self.completed(run_id)
+        if completed:
+            logger.info(f"Resuming run {run_id}, {len(completed)} url(s) already completed")
+        return [url for url in urls if url not in completed]
+
+    def save(self, run_id: str, page_response: PageResponse, url: Optional[str] = None) -> None:
+        """Records `page_response` as the result of `url`, its own url if not given."""
+        # derived representations not computed yet are recomputed from the html on load
+        data = page_response.model_dump_json(warnings=False, exclude=page_response.underived())
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO checkpoints VALUES (?, ?, ?, ?)",
+                (run_id, url or page_response.url, data, time.time()),
+            )
+            self._connection.commit()
+
+    async def asave(self, run_id: str, page_response: PageResponse, url: Optional[str] = None) -> None:
+        await asyncio.to_thread(self.save, run_id, page_response, url)
+
+    def load(self, run_id: str, urls: Optional[Iterable[str]] = None) -> List[PageResponse]:
+        """
+        Returns the PageResponses of `run_id`.
+
+        Args:
+            run_id (str): The run to load.
+            urls (Optional[Iterable[str]]): Return the responses in the order of these
+                urls, skipping missing ones. In completion order if not given.
+        """
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT url, page_response FROM checkpoints WHERE run_id = ? ORDER BY completed_at",
+                (run_id,),
+            ).fetchall()
+        responses: Dict[str, PageResponse] = {
+            url: PageResponse.model_validate_json(data) for url, data in rows
+        }
+        if urls is None:
+            return list(responses.values())
+        return [responses[url] for url in urls if url in responses]
+
+    def clear(self, run_id: str) -> None:
+        """Forgets `run_id`, the next run with this ID starts from scratch."""
+        with self._lock:
+            self._connection.execute("DELETE FROM checkpoints WHERE run_id = ?", (run_id,))
+            self._connection.commit()
+
+    def close(self) -> None:
+        self._connection.close()
@@ -0,0 +1,195 @@
+# scraper/concurrency.py
+import asyncio
+import math
+import statistics
+import time
+from collections import deque
+from typing import Deque, List, Optional, Set
+
+from pydantic import BaseModel
+
+from v2.infrastructure.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_MIN_LIMIT = 1
+DEFAULT_MAX_LIMIT = 10
+DEFAULT_WINDOW = 10
+DEFAULT_ERROR_THRESHOLD = 0.2
+DEFAULT_LATENCY_TOLERANCE = 2.0
+DEFAULT_DECREASE_FACTOR = 0.5
+DEFAULT_THROTTLE_COOLDOWN = 5.0
+THROTTLE_STATUSES = {429, 999}  # 999 is LinkedIn's "request denied"
+
+
+class LimitChange(BaseModel):
+    timestamp: float
+    limit: int
+    reason: str
+
+
+class Outcome(BaseModel):
+    latency: float
+    status: Optional[int] = None
+    error: bool = False
+
+
+class AdaptiveLimiter:
+    """
+    A concurrency limiter whose limit follows the observed health of the site.
+
+    It is used like a semaphore (`async with limiter:`), and every navigation
+    reports its outcome with `record()`. The limit grows by one after a window
+    of healthy navigations, and shrinks multiplicatively when the window shows
+    too many errors, a median latency well above the best seen so far, or
+    right away on a throttling status such as 429 or LinkedIn's 999.
+
+    Example:
+        ```python
+        limiter = AdaptiveLimiter(initial_limit=5)
+        async with limiter:
+            start = time.monotonic()
+            response = await page.goto(url)
+            limiter.record(time.monotonic() - start, status=response.status)
+        print(limiter.metrics())
+        ```
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 5,
+        min_limit: int = DEFAULT_MIN_LIMIT,
+        max_limit: int = DEFAULT_MAX_LIMIT,
+        window: int = DEFAULT_WINDOW,
+        error_threshold: float = DEFAULT_ERROR_THRESHOLD,
+        latency_tolerance: float = DEFAULT_LATENCY_TOLERANCE,
+        decrease_factor: float = DEFAULT_DECREASE_FACTOR,
+        throttle_cooldown: float = DEFAULT_THROTTLE_COOLDOWN,
+        throttle_statuses: Set[int] = THROTTLE_STATUSES,
+    ) -> None:
+        """
+        Args:
+            initial_limit (int): Number of in-flight pages allowed at start.
+            min_limit (int): The limit never goes below this.
+            max_limit (int): The limit never goes above this.
+            window (int): Number of outcomes judged together before adjusting.
+            error_threshold (float): Error rate in a window that triggers a decrease.
+            latency_tolerance (float): Median latency over the best median seen, as a
+                multiple, that triggers a decrease.
+            decrease_factor (float): Multiplier applied to the limit on a decrease.
+            throttle_cooldown (float): Seconds during which further throttling
+                responses do not shrink the limit again.
+            throttle_statuses (Set[int]): HTTP statuses treated as throttling.
+        """
+        if not 1 <= min_limit <= max_limit:
+            raise ValueError("Expected 1 <= min_limit <= max_limit")
+
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.window = window
+        self.error_threshold = error_threshold
+        self.latency_tolerance = latency_tolerance
+        self.decrease_factor = decrease_factor
+        self.throttle_cooldown = throttle_cooldown
+        self.throttle_statuses = throttle_statuses
+
+        self._limit = self._clamp(initial_limit)
+        self._in_flight = 0
+        self._condition = asyncio.Condition()
+        self._outcomes: Deque[Outcome] = deque(maxlen=window)
+        self._best_latency: Optional[float] = None
+        self._last_throttle = -math.inf
+        self.history: List[LimitChange] = [
+            LimitChange(timestamp=time.time(), limit=self._limit, reason="initial")
+        ]
+        self.counts = {"success": 0, "error": 0, "throttled": 0}
+
+    @property
+    def limit(self) -> int:
+        return self._limit
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def _clamp(self, limit: int) -> int:
+        return max(self.min_limit, min(self.max_limit, limit))
+
+    async def acquire(self) -> None:
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight < self._limit)
+            self._in_flight += 1
+
+    async def release(self) -> None:
+        async with self._condition:
+            self._in_flight -= 1
+            self._condition.notify_all()
+
+    async def __aenter__(self) -> "AdaptiveLimiter":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.release()
+
+    def record(self, latency: float, status: Optional[int] = None, error: bool = False) -> None:
+        """
+        Reports the outcome of one navigation.
+
+        Args:
+            latency (float): Navigation time in seconds.
+            status (Optional[int]): HTTP status of the main response, if any.
+            error (bool): True if the navigation failed.
+        """
+        if status in self.throttle_statuses:
+            self.counts["throttled"] += 1
+            now = time.monotonic()
+            if now - self._last_throttle >= self.throttle_cooldown:
+                self._last_throttle = now
+                self._set_limit(math.floor(self._limit * self.decrease_factor), f"throttled ({status})")
+            return
+
+        self.counts["error" if error else "success"] += 1
+        self._outcomes.append(Outcome(latency=latency, status=status, error=error))
+        if len(self._outcomes) < self.window:
+            return
+
+        error_rate = sum(o.error for o in self._outcomes) / len(self._outcomes)
+        latencies = [o.latency for o in self._outcomes if not o.error]
+        median_latency = statistics.median(latencies) if latencies else None
+
+        if error_rate > self.error_threshold:
+            self._set_limit(math.floor(self._limit * self.decrease_factor), f"error rate {error_rate:.0%}")
+        elif (
+            median_latency is not None
+            and self._best_latency is not None
+            and median_latency > self._best_latency * self.latency_tolerance
+        ):
+            self._set_limit(math.floor(self._limit * self.decrease_factor), f"latency {median_latency:.2f}s")
+        else:
+            self._set_limit(self._limit + 1, "healthy window")
+
+        if median_latency is not None:
+            self._best_latency = min(self._best_latency or median_latency, median_latency)
+        self._outcomes.clear()
+
+    def _set_limit(self, limit: int, reason: str) -> None:
+        limit = self._clamp(limit)
+        if limit == self._limit:
+            return
+        logger.debug(f"Concurrency limit {self._limit} -> {limit}: {reason}")
+        self._limit = limit
+        self.history.append(LimitChange(timestamp=time.time(), limit=limit, reason=reason))
+        # a grown limit is picked up by waiters on the next release()
+
+    def metrics(self) -> dict:
+        """Returns the current limit, in-flight count, outcome counts and limit history."""
+        return {
+            "limit": self._limit,
+            "in_flight": self._in_flight,
+            "min_limit": self.min_limit,
+            "max_limit": self.max_limit,
+            "best_latency": self._best_latency,
+            "counts": dict(self.counts),
+            "history": [change.model_dump() for change in self.history],
+        }
@@ -0,0 +1,112 @@
+# scraper/http_fetcher.py
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import httpx
+
+from v2.infrastructure.logging.logger import get_logger
+from v2.scraper.scraper_utils import read_cookies
+
+logger = get_logger(__name__)
+
+DEFAULT_MAX_CONNECTIONS = 20
+DEFAULT_TIMEOUT = 30.0
+DEFAULT_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
+    ),
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9",
+}
+
+
+def to_httpx_cookies(cookies: Optional[List[Dict] | Dict]) -> httpx.Cookies:
+    """Converts Playwright cookies or a storage state, as stored by `save_cookies`, to an httpx cookie jar."""
+    if isinstance(cookies, dict):
+        cookies = cookies.get("cookies")
+    jar = httpx.Cookies()
+    for cookie in cookies or []:
+        try:
+            jar.set(
+                cookie["name"],
+                cookie["value"],
+                domain=cookie.get("domain", ""),
+                path=cookie.get("path", "/"),
+            )
+        except (KeyError, TypeError) as e:
+            logger.debug(f"Skipping malformed cookie {cookie}: {e}")
+    return jar
+
+
+class HttpFetcher:
+    """
+    A pooled async HTTP client for pages that need no JavaScript.
+
+    It carries the same cookies as the browser, so a logged in session stays
+    logged in, and keeps its connections alive across requests.
+
+    Example:
+        ```python
+        async with HttpFetcher(cookie_file="linkedin-cookies.jsonl") as fetcher:
+            response = await fetcher.fetch("https://www.linkedin.com/jobs/view/123")
+        ```
+    """
+
+    def __init__(
+        self,
+        cookies: Optional[List[Dict]] = None,
+        cookie_file: Optional[str | Path] = None,
+        headers: Optional[Dict[str, str]] = None,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        timeout: float = DEFAULT_TIMEOUT,
+    ) -> None:
+        """
+        Args:
+            cookies (Optional[List[Dict]]): Playwright cookies, e.g. from `context.cookies()`.
+            cookie_file (Optional[str | Path]): Cookie file read on start when `cookies` are not given.
+            headers (Optional[Dict[str, str]]): Request headers, browser-like defaults if not given.
+            max_connections (int): Size of the connection pool.
+            timeout (float): Seconds before a request times out.
+        """
+        self.cookies = cookies
+        self.cookie_file = cookie_file
+        self.headers = headers or DEFAULT_HEADERS
+        self.max_connections = max_connections
+        self.timeout = timeout
+        self._client: Optional[httpx.AsyncClient] = None
+
+    async def __aenter__(self) -> "HttpFetcher":
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    async def start(self) -> None:
+        if self._client is not None:
+            return
+        cookies = self.cookies
+        if cookies is None and self.cookie_file:
+            cookies = await read_cookies(cookie_file=self.cookie_file)
+        self._client = httpx.AsyncClient(
+            cookies=to_httpx_cookies(cookies),
+            headers=self.headers,
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_connections,
+            ),
+            timeout=self.timeout,
+            follow_redirects=True,
+        )
+
+    async def fetch(self, url: str) -> httpx.Response:
+        """GETs `url` following redirects, the caller checks the status."""
+        if self._client is None:
+            raise RuntimeError("HttpFetcher is not started")
+        return await self._client.get(url)
+
+    async def close(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
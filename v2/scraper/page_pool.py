@@ -0,0 +1,119 @@
+# scraper/page_pool.py
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, List
+
+from playwright.async_api import BrowserContext, Page
+
+from v2.infrastructure.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_MAX_PAGES = 10
+DEFAULT_MAX_PAGE_USES = 20
+
+
+class PagePool:
+    """
+    A bounded pool of tabs for one browser context.
+
+    Pages are recycled across URLs instead of being opened and closed for each one.
+    A page is replaced once it has served `max_uses` URLs, or when the code using
+    it raised, so a misbehaving tab never leaks into the next URL.
+
+    Example:
+        ```python
+        pool = PagePool(context, max_pages=5)
+        async with pool.page() as page:
+            await page.goto(url)
+        await pool.close()
+        ```
+    """
+
+    def __init__(
+        self,
+        context: BrowserContext,
+        max_pages: int = DEFAULT_MAX_PAGES,
+        max_uses: int = DEFAULT_MAX_PAGE_USES,
+    ) -> None:
+        """
+        Args:
+            context (BrowserContext): The context the pages are opened in.
+            max_pages (int): Maximum number of tabs open at once.
+            max_uses (int): Number of URLs a tab serves before it is replaced.
+        """
+        if max_pages < 1 or max_uses < 1:
+            raise ValueError("max_pages and max_uses must be at least 1")
+
+        self.context = context
+        self.max_pages = max_pages
+        self.max_uses = max_uses
+        self._slots = asyncio.Semaphore(max_pages)
+        self._idle: List[Page] = []
+        self._uses: Dict[Page, int] = {}
+        self._closed = False
+
+    @property
+    def open_pages(self) -> int:
+        return len(self._uses)
+
+    @asynccontextmanager
+    async def page(self) -> AsyncIterator[Page]:
+        """Borrows a page, waiting for a free slot when all pages are in use."""
+        async with self._slots:
+            page = await self._checkout()
+            healthy = False
+            try:
+                yield page
+                healthy = True
+            finally:
+                await self._checkin(page, healthy)
+
+    async def _checkout(self) -> Page:
+        while self._idle:
+            page = self._idle.pop()
+            if not page.is_closed():
+                self._uses[page] += 1
+                return page
+            self._uses.pop(page, None)
+
+        page = await self.context.new_page()
+        self._uses[page] = 1
+        return page
+
+    async def _checkin(self, page: Page, healthy: bool) -> None:
+        if (
+            self._closed
+            or not healthy
+            or self._uses[page] >= self.max_uses
+            or page.is_closed()
+        ):
+            await self._discard(page)
+            return
+
+        try:
+            await self._reset(page)
+        except Exception as e:
+            logger.debug(f"Could not reset page, replacing it: {e}")
+            await self._discard(page)
+            return
+        self._idle.append(page)
+
+    async def _reset(self, page: Page) -> None:
+        """Drops per-URL state without a navigation, the next goto replaces the document."""
+        await page.unroute_all(behavior="ignoreErrors")
+
+    async def _discard(self, page: Page) -> None:
+        self._uses.pop(page, None)
+        try:
+            if not page.is_closed():
+                await page.close()
+        except Exception as e:
+            logger.debug(f"Error while closing page: {e}")
+
+    async def close(self) -> None:
+        """Closes all idle pages, pages still borrowed are closed on return."""
+        self._closed = True
+        idle, self._idle = self._idle, []
+        for page in idle:
+            await self._discard(page)
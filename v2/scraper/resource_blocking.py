@@ -0,0 +1,166 @@
+# scraper/resource_blocking.py
+import re
+from collections import Counter
+from typing import Dict, List, Optional, Pattern, Set
+
+from playwright.async_api import BrowserContext, Request, Route
+from pydantic import BaseModel
+
+from v2.infrastructure.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_BLOCKED_RESOURCES = {
+    "image", "media",
+    "font",
+    # "stylesheet","other", "manifest", "texttrack"
+}
+
+# analytics, ads and session recording hosts, a request to any subdomain is blocked too
+TRACKER_DOMAINS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "googleadservices.com",
+    "googlesyndication.com",
+    "doubleclick.net",
+    "adservice.google.com",
+    "connect.facebook.net",
+    "facebook.com/tr",
+    "bat.bing.com",
+    "clarity.ms",
+    "hotjar.com",
+    "segment.io",
+    "segment.com",
+    "mixpanel.com",
+    "amplitude.com",
+    "fullstory.com",
+    "scorecardresearch.com",
+    "quantserve.com",
+    "criteo.com",
+    "taboola.com",
+    "outbrain.com",
+    "adsrvr.org",
+    "nr-data.net",
+    "px.ads.linkedin.com",
+    "snap.licdn.com",
+)
+
+# file extensions that identify a resource type from its url, so the type can be
+# matched by a url pattern instead of a Python callback per request
+RESOURCE_TYPE_EXTENSIONS: Dict[str, tuple] = {
+    "image": ("png", "jpg", "jpeg", "gif", "webp", "avif", "svg", "ico", "bmp"),
+    "media": ("mp4", "webm", "m4a", "mp3", "ogg", "wav", "mov", "m3u8"),
+    "font": ("woff", "woff2", "ttf", "otf", "eot"),
+    "stylesheet": ("css",),
+}
+
+# rough transfer sizes used to estimate the bytes an aborted request would have cost
+ESTIMATED_BYTES: Dict[str, int] = {
+    "image": 40_000,
+    "media": 500_000,
+    "font": 30_000,
+    "stylesheet": 20_000,
+    "script": 30_000,
+    "xhr": 5_000,
+    "fetch": 5_000,
+    "ping": 500,
+}
+DEFAULT_ESTIMATED_BYTES = 5_000
+
+
+class BlockingRules(BaseModel):
+    """
+    Declarative rules for the requests a browser context aborts.
+
+    Resource types with a known file extension, url regexes and tracker domains
+    are merged into a single url pattern, which Playwright matches itself.
+    `strict_resource_types`, on by default, adds a catch-all route checking the
+    resource type of every request, so images, media and fonts served without
+    an extension are blocked too. Turned off, requests that are not blocked never
+    reach Python, but such resources load unless a url regex covers them.
+    """
+    resource_types: Set[str] = DEFAULT_BLOCKED_RESOURCES
+    url_globs: List[str] = []  # e.g. "**/*.pdf"
+    url_regexes: List[str] = []  # e.g. r"media\.licdn\.com/dms/image/"
+    block_trackers: bool = True
+    tracker_domains: List[str] = list(TRACKER_DOMAINS)
+    strict_resource_types: bool = True
+
+    def url_pattern(self) -> Optional[Pattern]:
+        """Returns one regex matching every url blocked by extension, regex or tracker domain."""
+        alternatives = list(self.url_regexes)
+
+        extensions = [
+            extension
+            for resource_type in sorted(self.resource_types)
+            for extension in RESOURCE_TYPE_EXTENSIONS.get(resource_type, ())
+        ]
+        if extensions:
+            alternatives.append(rf"^[^?#]*\.(?:{'|'.join(extensions)})(?:[?#].*)?$")
+
+        if self.block_trackers and self.tracker_domains:
+            domains = "|".join(re.escape(domain) for domain in self.tracker_domains)
+            alternatives.append(rf"^https?://(?:[^/?#]*\.)?(?:{domains})(?:[:/?#]|$)")
+
+        if not alternatives:
+            return None
+        return re.compile("|".join(f"(?:{alternative})" for alternative in alternatives), re.IGNORECASE)
+
+
+class ResourceBlocker:
+    """
+    Applies BlockingRules to browser contexts and counts what they block.
+
+    Routes are registered on the context, so every page of it, pooled tabs
+    included, is covered from its first request.
+
+    Example:
+        ```python
+        blocker = ResourceBlocker(BlockingRules(url_globs=["**/*.pdf"]))
+        await blocker.apply(context)
+        ...
+        print(blocker.metrics())
+        ```
+    """
+
+    def __init__(self, rules: Optional[BlockingRules] = None, stats: Optional[Counter] = None) -> None:
+        """
+        Args:
+            rules (Optional[BlockingRules]): The rules to apply, the defaults if not given.
+            stats (Optional[Counter]): Blocked request counts per resource type, pass the
+                counter of another blocker to report both together.
+        """
+        self.rules = rules or BlockingRules()
+        self.stats: Counter = stats if stats is not None else Counter()
+
+    async def apply(self, context: BrowserContext) -> None:
+        """Registers the routes of the rules on `context`."""
+        url_pattern = self.rules.url_pattern()
+        if url_pattern is not None:
+            await context.route(url_pattern, self._abort)
+        for glob in self.rules.url_globs:
+            await context.route(glob, self._abort)
+        if self.rules.strict_resource_types and self.rules.resource_types:
+            await context.route("**/*", self._abort_by_type)
+
+    async def _abort(self, route: Route, request: Request) -> None:
+        self.stats[request.resource_type] += 1
+        await route.abort("blockedbyclient")
+
+    async def _abort_by_type(self, route: Route, request: Request) -> None:
+        if request.resource_type in self.rules.resource_types:
+            await self._abort(route, request)
+        else:
+            await route.fallback()
+
+    def metrics(self) -> dict:
+        """Returns the blocked requests per resource type and an estimate of the bytes saved."""
+        bytes_saved = sum(
+            ESTIMATED_BYTES.get(resource_type, DEFAULT_ESTIMATED_BYTES) * count
+            for resource_type, count in self.stats.items()
+        )
+        return {
+            "blocked": sum(self.stats.values()),
+            "by_type": dict(self.stats),
+            "estimated_bytes_saved": bytes_saved,
+        }
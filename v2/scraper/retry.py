@@ -0,0 +1,230 @@
+# scraper/retry.py
+import asyncio
+import random
+import time
+from collections import deque
+from enum import Enum
+from typing import Deque, Set
+
+import httpx
+from playwright.async_api import Error as PlaywrightError
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+from pydantic import BaseModel
+
+from v2.infrastructure.logging.logger import get_logger
+from v2.scraper.concurrency import THROTTLE_STATUSES
+
+logger = get_logger(__name__)
+
+
+class ScrapError(Exception):
+    """Base class for failures raised while processing a url."""
+
+
+class PageStatusError(ScrapError):
+    def __init__(self, url: str, status: int) -> None:
+        super().__init__(f"{url} responded with status {status}")
+        self.url = url
+        self.status = status
+
+
+class LoginRequiredError(ScrapError):
+    def __init__(self, url: str, landed_on: str) -> None:
+        super().__init__(f"{url} redirected to a login wall: {landed_on}")
+        self.url = url
+        self.landed_on = landed_on
+
+
+class FailureKind(str, Enum):
+    TIMEOUT = "timeout"
+    THROTTLED = "throttled"
+    SERVER_ERROR = "server_error"
+    NETWORK = "network"
+    TARGET_CLOSED = "target_closed"
+    NOT_FOUND = "not_found"
+    CLIENT_ERROR = "client_error"
+    INVALID_URL = "invalid_url"
+    LOGIN_REQUIRED = "login_required"
+    UNKNOWN = "unknown"
+
+
+# failures that say something about the health of the site, not about one url
+HEALTH_FAILURES = {
+    FailureKind.TIMEOUT,
+    FailureKind.THROTTLED,
+    FailureKind.SERVER_ERROR,
+    FailureKind.NETWORK,
+    FailureKind.LOGIN_REQUIRED,
+    FailureKind.UNKNOWN,
+}
+
+PERMANENT_NETWORK_ERRORS = ("net::ERR_NAME_NOT_RESOLVED", "net::ERR_INVALID_URL", "net::ERR_UNKNOWN_URL_SCHEME")
+
+
+def classify_failure(error: BaseException) -> FailureKind:
+    """
+    Maps an exception raised while processing a url to a FailureKind.
+
+    Args:
+        error (BaseException): The exception to classify.
+
+    Returns:
+        FailureKind: The failure class, UNKNOWN if nothing matched.
+    """
+    if isinstance(error, PageStatusError):
+        if error.status in THROTTLE_STATUSES:
+            return FailureKind.THROTTLED
+        if error.status in (404, 410):
+            return FailureKind.NOT_FOUND
+        if error.status >= 500:
+            return FailureKind.SERVER_ERROR
+        return FailureKind.CLIENT_ERROR
+    if isinstance(error, LoginRequiredError):
+        return FailureKind.LOGIN_REQUIRED
+    if isinstance(error, (PlaywrightTimeoutError, asyncio.TimeoutError, httpx.TimeoutException)):
+        return FailureKind.TIMEOUT
+    if isinstance(error, (httpx.InvalidURL, httpx.UnsupportedProtocol)):
+        return FailureKind.INVALID_URL
+    if isinstance(error, httpx.TransportError):
+        return FailureKind.NETWORK
+    if isinstance(error, PlaywrightError):
+        message = str(error)
+        if "has been closed" in message or "Target closed" in message:
+            return FailureKind.TARGET_CLOSED
+        if any(code in message for code in PERMANENT_NETWORK_ERRORS):
+            return FailureKind.INVALID_URL
+        if "net::ERR_" in message:
+            return FailureKind.NETWORK
+    return FailureKind.UNKNOWN
+
+
+class RetryPolicy(BaseModel):
+    """
+    Which failures are retried and how long to back off before the next attempt.
+
+    The delay is exponential with full jitter, a throttled response backs off
+    `throttle_multiplier` times longer.
+    """
+    base_delay: float = 1.0
+    max_delay: float = 30.0
+    multiplier: float = 2.0
+    throttle_multiplier: float = 4.0
+    retryable: Set[FailureKind] = {
+        FailureKind.TIMEOUT,
+        FailureKind.THROTTLED,
+        FailureKind.SERVER_ERROR,
+        FailureKind.NETWORK,
+        FailureKind.TARGET_CLOSED,
+        FailureKind.UNKNOWN,
+    }
+
+    def should_retry(self, kind: FailureKind) -> bool:
+        return kind in self.retryable
+
+    def backoff(self, attempt: int, kind: FailureKind) -> float:
+        """Returns the seconds to wait before retry number `attempt` (1 for the first retry)."""
+        ceiling = self.base_delay * self.multiplier ** (attempt - 1)
+        if kind == FailureKind.THROTTLED:
+            ceiling *= self.throttle_multiplier
+        return random.uniform(0, min(self.max_delay, ceiling))
+
+
+class CircuitState(str, Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Pauses scheduling for a platform when its failure rate spikes.
+
+    Once `failure_threshold` of the last `window` outcomes are failures the
+    circuit opens and `wait()` blocks for `cooldown` seconds. After that a single
+    probe is let through, its success closes the circuit and its failure opens
+    it again. A probe that never reports back is replaced after another cooldown.
+
+    Example:
+        ```python
+        breaker = CircuitBreaker(cooldown=60.0)
+        await breaker.wait()
+        try:
+            await page.goto(url)
+            breaker.record(True)
+        except Exception:
+            breaker.record(False)
+        ```
+    """
+
+    def __init__(
+        self,
+        window: int = 20,
+        min_calls: int = 10,
+        failure_threshold: float = 0.5,
+        cooldown: float = 30.0,
+    ) -> None:
+        self.window = window
+        self.min_calls = min_calls
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+
+        self.state = CircuitState.CLOSED
+        self.times_opened = 0
+        self._outcomes: Deque[bool] = deque(maxlen=window)
+        self._opened_at = 0.0
+        self._probe_started = 0.0
+        self._probe_in_flight = False
+        self._changed = asyncio.Event()
+
+    def _transition(self, state: CircuitState) -> None:
+        if state == self.state:
+            return
+        logger.info(f"Circuit breaker {self.state.value} -> {state.value}")
+        self.state = state
+        if state == CircuitState.OPEN:
+            self._opened_at = time.monotonic()
+            self.times_opened += 1
+            self._outcomes.clear()
+        self._probe_in_flight = False
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    async def wait(self) -> None:
+        """Returns once a call may go ahead."""
+        while True:
+            if self.state == CircuitState.CLOSED:
+                return
+            if self.state == CircuitState.OPEN:
+                remaining = self._opened_at + self.cooldown - time.monotonic()
+                if remaining > 0:
+                    await asyncio.sleep(remaining)
+                    continue
+                self._transition(CircuitState.HALF_OPEN)
+            now = time.monotonic()
+            if not self._probe_in_flight or now - self._probe_started >= self.cooldown:
+                self._probe_in_flight = True
+                self._probe_started = now
+                return
+            try:
+                await asyncio.wait_for(
+                    self._changed.wait(), self._probe_started + self.cooldown - now
+                )
+            except asyncio.TimeoutError:
+                pass
+
+    def record(self, success: bool) -> None:
+        """Reports the outcome of a call."""
+        if self.state == CircuitState.HALF_OPEN:
+            self._transition(CircuitState.CLOSED if success else CircuitState.OPEN)
+            return
+
+        self._outcomes.append(success)
+        if len(self._outcomes) < self.min_calls:
+            return
+        failure_rate = self._outcomes.count(False) / len(self._outcomes)
+        if failure_rate >= self.failure_threshold:
+            self._transition(CircuitState.OPEN)
+
+    def metrics(self) -> dict:
+        return {"state": self.state.value, "times_opened": self.times_opened}
+
@@ -0,0 +1,169 @@
+# scraper/scheduler.py
+import asyncio
+import math
+import time
+from collections import OrderedDict, deque
+from typing import Deque, Dict, Generic, Iterable, Optional, Tuple, TypeVar
+from urllib.parse import urlparse
+
+from v2.infrastructure.logging.logger import get_logger
+from v2.platforms.base_platform import WebsitePlatform
+
+logger = get_logger(__name__)
+
+T = TypeVar('T')
+
+
+def get_domain(url: str) -> str:
+    return urlparse(url).hostname or ""
+
+
+class TokenBucket:
+    """
+    A token bucket that hands out reservations instead of blocking.
+
+    `reserve()` takes a token now or in the future and returns how long the
+    caller has to wait for it, so choosing and reserving is a single synchronous
+    step and concurrent callers never race for the same token.
+    """
+
+    def __init__(self, rate: Optional[float] = None, burst: int = 1, min_delay: float = 0.0) -> None:
+        """
+        Args:
+            rate (Optional[float]): Tokens added per second, None for no rate limit.
+            burst (int): Bucket size, the number of requests allowed back to back.
+            min_delay (float): Minimum seconds between two granted tokens.
+        """
+        if rate is not None and rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.min_delay = min_delay
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._last_grant = -math.inf
+
+    def _tokens_at(self, at: float) -> float:
+        if self.rate is None:
+            return float(self.burst)
+        # `at` may lie before `_updated` when tokens are already reserved ahead
+        return min(self.burst, self._tokens + (at - self._updated) * self.rate)
+
+    def ready_at(self, now: Optional[float] = None) -> float:
+        """Returns the monotonic time at which the next token is available."""
+        now = time.monotonic() if now is None else now
+        tokens = self._tokens_at(now)
+        at = now if tokens >= 1 else now + (1 - tokens) / self.rate
+        return max(at, self._last_grant + self.min_delay)
+
+    def reserve(self, now: Optional[float] = None) -> float:
+        """Reserves the next token and returns the seconds to wait before using it."""
+        now = time.monotonic() if now is None else now
+        at = self.ready_at(now)
+        self._tokens = self._tokens_at(at) - 1
+        self._updated = at
+        self._last_grant = at
+        return at - now
+
+
+class DomainQueue(Generic[T]):
+    """
+    The items of one scrap call grouped per domain.
+
+    `next()` hands out the item of the domain whose bucket frees up first, so a
+    slow domain does not hold back the others.
+    """
+
+    def __init__(self, scheduler: "DomainScheduler") -> None:
+        self.scheduler = scheduler
+        self._pending: Dict[str, Deque[T]] = OrderedDict()
+
+    def add(self, item: T, url: str) -> None:
+        self._pending.setdefault(get_domain(url), deque()).append(item)
+
+    def __len__(self) -> int:
+        return sum(len(items) for items in self._pending.values())
+
+    async def next(self) -> Optional[T]:
+        """Waits for a politeness slot and returns the next item, None when empty."""
+        if not self._pending:
+            return None
+
+        now = time.monotonic()
+        domain = min(self._pending, key=lambda d: self.scheduler.bucket(d).ready_at(now))
+        items = self._pending[domain]
+        item = items.popleft()
+        if not items:
+            del self._pending[domain]
+
+        delay = self.scheduler.reserve(domain, now)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return item
+
+
+class DomainScheduler:
+    """
+    Per-domain politeness for a platform: a token bucket and a minimum delay per host.
+
+    The buckets live as long as the scheduler, so the rate also holds across
+    successive scrap calls of an engine.
+
+    Example:
+        ```python
+        scheduler = DomainScheduler(rate_limit=1.0, burst=3)
+        queue = scheduler.queue((url, url) for url in urls)
+        while (url := await queue.next()) is not None:
+            await page.goto(url)
+        ```
+    """
+
+    def __init__(self, rate_limit: Optional[float] = None, burst: int = 1, min_delay: float = 0.0) -> None:
+        """
+        Args:
+            rate_limit (Optional[float]): Requests per second per domain, None for no limit.
+            burst (int): Requests allowed back to back before the rate applies.
+            min_delay (float): Minimum seconds between two requests to the same domain.
+        """
+        self.rate_limit = rate_limit
+        self.burst = burst
+        self.min_delay = min_delay
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._stats: Dict[str, Dict[str, float]] = {}
+
+    @classmethod
+    def from_platform(cls, platform: WebsitePlatform) -> "DomainScheduler":
+        return cls(
+            rate_limit=platform.rate_limit,
+            burst=platform.rate_burst,
+            min_delay=platform.min_delay,
+        )
+
+    def bucket(self, domain: str) -> TokenBucket:
+        if domain not in self._buckets:
+            self._buckets[domain] = TokenBucket(self.rate_limit, self.burst, self.min_delay)
+            self._stats[domain] = {"requests": 0, "waited": 0.0}
+        return self._buckets[domain]
+
+    def reserve(self, domain: str, now: Optional[float] = None) -> float:
+        delay = self.bucket(domain).reserve(now)
+        self._stats[domain]["requests"] += 1
+        self._stats[domain]["waited"] += delay
+        return delay
+
+    async def wait(self, url: str) -> None:
+        """Waits until a request to the domain of `url` is allowed."""
+        delay = self.reserve(get_domain(url))
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def queue(self, items: Iterable[Tuple[T, str]]) -> DomainQueue[T]:
+        """Groups `(item, url)` pairs per domain into a queue for one scrap call."""
+        domain_queue = DomainQueue(self)
+        for item, url in items:
+            domain_queue.add(item, url)
+        return domain_queue
+
+    def metrics(self) -> dict:
+        """Returns the number of requests and seconds waited per domain."""
+        return {domain: dict(stats) for domain, stats in self._stats.items()}
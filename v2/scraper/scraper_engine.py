@@ -1,36 +1,261 @@
 # scraper/scraper_engine.py
-from asyncio import Semaphore, gather
+import multiprocessing
+import re
+import time
+from asyncio import Queue, create_task, gather, sleep
+from collections import Counter
+from contextlib import asynccontextmanager
 from pathlib import Path
 from pickle import FALSE
-from typing import Dict, List, Optional, Set
+from typing import AsyncIterator, Dict, List, Optional, Set, Tuple
 
-from playwright.async_api import BrowserContext, Page, Request, Route, async_playwright
+from playwright.async_api import Page, Response
 
-from v2.core.page_output import PageResponse, parse_page_response
+from v2.core.extraction.extraction_cache import ExtractionCache
+from v2.core.cpu_executor import CpuExecutor, CpuExecutorConfig, using
+from v2.core.list_harvest import DEFAULT_HARVEST_KEY, ListHarvester
+from v2.core.page_archive import PageArchive
+from v2.core.page_output import CaptureProfile, PageResponse, abuild_page_response, parse_page_response
+from v2.core.screenshots import ScreenshotPolicy, ScreenshotStore
 from v2.infrastructure.logging.logger import get_logger
+from v2.infrastructure.metrics.timing import UNKNOWN_PAGE_TYPE, StageTimings, span
+from v2.platforms.action_utils import wait_for_selectors
 from v2.platforms.base_platform import WebsitePlatform
-from v2.scraper.scraper_utils import read_cookies, save_cookies
+from v2.scraper.browser_session import DEFAULT_POOL_SIZE, BrowserSession
+from v2.scraper.capture import ResponseCapture
+from v2.scraper.http_fetcher import HttpFetcher
+from v2.scraper.checkpoint import CheckpointStore
+from v2.scraper.concurrency import DEFAULT_MAX_LIMIT, AdaptiveLimiter
+from v2.scraper.page_pool import DEFAULT_MAX_PAGE_USES, DEFAULT_MAX_PAGES, PagePool
+from v2.scraper.resource_blocking import BlockingRules, ResourceBlocker
+from v2.scraper.retry import (
+    HEALTH_FAILURES,
+    CircuitBreaker,
+    LoginRequiredError,
+    PageStatusError,
+    RetryPolicy,
+    classify_failure,
+)
+from v2.scraper.scheduler import DomainScheduler
+from v2.scraper.sharding import merge_results, run_shard, split_urls
 
 logger = get_logger(__name__)
 
 DEFAULT_MAX_CONCURRENT = 5
 DEFAULT_MAX_DEPTH = 0
 DEFAULT_MAX_RETRIES = 2
-DEFAULT_BLOCKED_RESOURCES = {
-    "image", "media", 
-    "font", 
-    # "stylesheet","other", "manifest", "texttrack"
-}
+DEFAULT_STREAM_BUFFER = 10
+
+_DONE = object()  # end of stream marker for the url pipeline queues
 
 
 class ScraperEngine:
 
-    def __init__(self, platform: WebsitePlatform) -> None:
-        """Initialise the scrapper engine"""
+    def __init__(
+        self,
+        platform: WebsitePlatform,
+        adaptive_concurrency: bool = True,
+        max_concurrent_limit: int = DEFAULT_MAX_LIMIT,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        blocking_rules: Optional[BlockingRules] = None,
+        screenshot_policy: Optional[ScreenshotPolicy] = None,
+        extraction_cache: Optional[ExtractionCache] = None,
+        release_payloads: bool = False,
+        content_store: Optional[PageArchive] = None,
+        cpu_executor: Optional[CpuExecutorConfig] = None,
+    ) -> None:
+        """Initialise the scrapper engine
+
+        Args:
+            platform (WebsitePlatform): The platform to scrap.
+            adaptive_concurrency (bool): Let the number of in-flight pages follow the
+                observed latency, errors and throttling, starting at `max_concurrent`.
+            max_concurrent_limit (int): Upper bound for the adaptive limit.
+            retry_policy (Optional[RetryPolicy]): Which failures are retried and the backoff between attempts.
+            circuit_breaker (Optional[CircuitBreaker]): Pauses scheduling while the platform keeps failing.
+            blocking_rules (Optional[BlockingRules]): Requests aborted by every browser context,
+                the platform's `blocked_url_patterns` are added to them.
+            screenshot_policy (Optional[ScreenshotPolicy]): Which pages are screenshotted and how,
+                by default only those whose extraction strategy needs the image.
+            extraction_cache (Optional[ExtractionCache]): Returns the data extracted before from the same
+                content with the same strategy configuration, for strategies without a cache of their own.
+            release_payloads (bool): Drop the html, text and derived representations of a page once its
+                data is extracted, so large batches hold little more than the extracted data.
+            content_store (Optional[PageArchive]): Where the released pages are archived first, their
+                `content_ref` is the archive path.
+            cpu_executor (Optional[CpuExecutorConfig]): The thread or process pool running the html
+                post-processing and CSS extraction, on the event loop if not given.
+        """
         self.platform = platform
+        self.adaptive_concurrency = adaptive_concurrency
+        self.max_concurrent_limit = max_concurrent_limit
+        self.browser_session: Optional[BrowserSession] = None
+        self.scheduler = DomainScheduler.from_platform(platform)
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.circuit_breaker = circuit_breaker or CircuitBreaker()
+        self.outcomes: Counter = Counter()  # processed urls per outcome class
+        self.timings = StageTimings()  # stage durations per page object type
+        self.blocking_rules = blocking_rules or BlockingRules()
+        self.resource_blocker = ResourceBlocker(
+            self.blocking_rules.model_copy(
+                update={"url_regexes": self.blocking_rules.url_regexes + list(platform.blocked_url_patterns)}
+            )
+        )
+        self.screenshots = ScreenshotStore(screenshot_policy)
+        self.extraction_cache = extraction_cache
+        self.release_payloads = release_payloads
+        self.content_store = content_store
+        self.cpu_executor = CpuExecutor(cpu_executor) if cpu_executor is not None else None
+        self.set_semaphore(DEFAULT_MAX_CONCURRENT)
+
+    async def __aenter__(self) -> "ScraperEngine":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Shuts down the CPU executor's pool, it starts again if the engine is used afterwards"""
+        if self.cpu_executor is not None:
+            self.cpu_executor.shutdown(wait=False)
+
+    def _end_run(self) -> None:
+        """Releases what a top-level run started, an open session keeps its pool until it closes"""
+        if self.browser_session is None:
+            self.close()
+
+    @classmethod
+    @asynccontextmanager
+    async def session(
+        cls,
+        platform: WebsitePlatform,
+        credentials: Optional[Dict] = None,
+        cookie_file: Optional[str | Path] = None,
+        headless: bool = False,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        max_pages: int = DEFAULT_MAX_PAGES,
+        max_page_uses: int = DEFAULT_MAX_PAGE_USES,
+        blocking_rules: Optional[BlockingRules] = None,
+        cpu_executor: Optional[CpuExecutorConfig] = None,
+    ) -> AsyncIterator["ScraperEngine"]:
+        """
+        Opens a long-lived engine that keeps the browser and logged in contexts warm.
+
+        Every `scrap()` call made on the yielded engine reuses the session, so only
+        the first one pays for the browser launch, cookies and login. `max_pages`
+        caps the pooled tabs per context, so it also caps `max_concurrent`.
+
+        Example:
+            ```python
+            async with ScraperEngine.session(platform, credentials=creds) as engine:
+                listings = await engine.scrap(search_params=params)
+                details = await engine.scrap(urls=job_urls)
+            ```
+        """
+        engine = cls(platform, blocking_rules=blocking_rules, cpu_executor=cpu_executor)
+        async with BrowserSession(
+            platform,
+            credentials=credentials,
+            cookie_file=cookie_file,
+            headless=headless,
+            pool_size=pool_size,
+            max_pages=max_pages,
+            max_page_uses=max_page_uses,
+            resource_blocker=engine.resource_blocker,
+            scheduler=engine.scheduler,
+        ) as browser_session:
+            engine.browser_session = browser_session
+            try:
+                yield engine
+            finally:
+                engine.browser_session = None
+                engine.close()
+
+    @asynccontextmanager
+    async def _browser_session(
+        self,
+        credentials: Optional[Dict] = None,
+        cookie_file: Optional[str | Path] = None,
+        headless: bool = False,
+        max_pages: int = DEFAULT_MAX_PAGES,
+        blocked_resources: Optional[Set[str]] = None,
+    ) -> AsyncIterator[BrowserSession]:
+        """Yields the engine's open session, or a one-off session for this call.
+
+        `blocked_resources` replaces the resource types of the engine's blocking
+        rules for a one-off session, an open session keeps the rules it started with.
+        """
+        if self.browser_session is not None:
+            yield self.browser_session
+            return
 
-    def set_semaphore(self, max_concurrent: int = 5) -> None:
-        self.semaphore = Semaphore(max_concurrent)
+        resource_blocker = self.resource_blocker
+        if blocked_resources is not None:
+            resource_blocker = ResourceBlocker(
+                self.resource_blocker.rules.model_copy(update={"resource_types": set(blocked_resources)}),
+                stats=self.resource_blocker.stats,
+            )
+        async with BrowserSession(
+            self.platform,
+            credentials=credentials,
+            cookie_file=cookie_file,
+            headless=headless,
+            max_pages=max_pages,
+            resource_blocker=resource_blocker,
+            scheduler=self.scheduler,
+        ) as browser_session:
+            yield browser_session
+
+    def set_semaphore(
+        self, max_concurrent: int = DEFAULT_MAX_CONCURRENT, max_limit: Optional[int] = None
+    ) -> None:
+        """Sets the concurrency limiter, `max_concurrent` is its starting limit.
+
+        With adaptive concurrency the limit moves up to `max_concurrent_limit`,
+        otherwise it stays fixed. `max_limit` caps both, e.g. the tabs a session allows.
+        """
+        max_concurrent = max_concurrent or DEFAULT_MAX_CONCURRENT
+        upper = max(max_concurrent, self.max_concurrent_limit) if self.adaptive_concurrency else max_concurrent
+        if max_limit:
+            upper = min(upper, max_limit)
+        initial = min(max_concurrent, upper)
+        min_limit = 1 if self.adaptive_concurrency else initial
+        self.semaphore = AdaptiveLimiter(initial_limit=initial, min_limit=min_limit, max_limit=upper)
+
+    def concurrency_metrics(self) -> dict:
+        """Returns the current concurrency limit and its history for the last scrap call."""
+        return self.semaphore.metrics()
+
+    def retry_metrics(self) -> dict:
+        """Returns the attempts per outcome class and the circuit breaker state."""
+        return {"outcomes": dict(self.outcomes), "circuit_breaker": self.circuit_breaker.metrics()}
+
+    def blocking_metrics(self) -> dict:
+        """Returns the requests blocked by the contexts of this engine and the bytes saved."""
+        return self.resource_blocker.metrics()
+
+    def timing_metrics(self) -> dict:
+        """Returns the stage duration histograms per page object type since the engine was created."""
+        return self.timings.to_dict()
+
+    def export_timings(self, path: str | Path) -> Path:
+        """Writes the stage duration histograms to `path`, in the Prometheus text
+        format for a `.prom` suffix and as JSON otherwise."""
+        path = Path(path)
+        path.parent.mkdir(exist_ok=True, parents=True)
+        if path.suffix == ".prom":
+            path.write_text(self.timings.to_prometheus())
+        else:
+            path.write_text(self.timings.to_json(indent=2))
+        return path
+
+    def _max_pages(self, max_concurrent: Optional[int]) -> int:
+        """Tabs a one-off session needs so the limiter can reach its upper bound"""
+        max_concurrent = max_concurrent or DEFAULT_MAX_CONCURRENT
+        if self.adaptive_concurrency:
+            return max(max_concurrent, self.max_concurrent_limit)
+        return max_concurrent
 
     async def scrap(
         self,
@@ -43,164 +268,783 @@ class ScraperEngine:
         max_concurrent: Optional[int] = DEFAULT_MAX_CONCURRENT,
         max_depth: Optional[int] = DEFAULT_MAX_DEPTH,
         max_retries: Optional[int] = DEFAULT_MAX_RETRIES,
-        blocked_resources: Optional[Set[str]] = DEFAULT_BLOCKED_RESOURCES,
+        blocked_resources: Optional[Set[str]] = None,
+        processes: int = 1,
+        checkpoint: Optional[CheckpointStore] = None,
+        run_id: Optional[str] = None,
+        capture_profile: Optional[CaptureProfile] = None,
         *args,  # Consider adding typing if the purpose is known
         **kwargs,    ) -> List[PageResponse]:
-        """Main method to scrap the website"""
+        """Main method to scrap the website
+
+        Inside `ScraperEngine.session()` the open browser session is reused and
+        `credentials`, `cookie_file`, `headless` and the blocking rules are taken
+        from the session. Otherwise `blocked_resources` overrides the resource
+        types of the engine's blocking rules. With `processes` above 1, `urls`
+        are scraped by `scrap_sharded()` and search params and filters are ignored.
+
+        With a `checkpoint` store every url result is recorded under `run_id` as
+        it completes, urls already completed in that run are not scraped again
+        and their stored results are returned along with the new ones.
+
+        `capture_profile` selects the representations collected from every url of
+        this call, by default each page object's own `capture_profile` applies.
+        """
         if urls is None and search_params is None:
             raise ValueError("Provide urls or search params")
+        if checkpoint is not None and not run_id:
+            raise ValueError("Provide a run_id to checkpoint")
+
+        all_urls = urls
+        if urls and checkpoint is not None:
+            urls = checkpoint.pending(run_id, urls)
+            if not urls:
+                return checkpoint.load(run_id, all_urls)
         
         results = []
-        cookie_file = cookie_file or f"{self.platform.name}-cookies.jsonl"
-        logger.info(f"Browser launching headless: {headless}")
-        
-        self.set_semaphore(max_concurrent)
+        if urls and processes > 1:
+            try:
+                async for _, page_response in self._checkpointed(
+                    self._scrap_sharded(
+                        urls,
+                        processes=processes,
+                        credentials=credentials,
+                        cookie_file=cookie_file,
+                        headless=headless,
+                        max_concurrent=max_concurrent,
+                        max_retries=max_retries,
+                        blocked_resources=blocked_resources,
+                        capture_profile=capture_profile,
+                    ),
+                    urls,
+                    checkpoint,
+                    run_id,
+                ):
+                    results.append(page_response)
+            except Exception as e:
+                logger.error(f"Error while sharded scraping: {e}", exc_info=True)
+            if checkpoint is not None:
+                return checkpoint.load(run_id, all_urls)
+            return results
+
         try:
-            async with async_playwright() as p:
-                browser = await p.chromium.launch(headless=headless)
-                context = await browser.new_context()
-
-                cookies = await read_cookies(cookie_file=cookie_file)
-                if cookies:
-                    await context.add_cookies(cookies=cookies)
-
-                if credentials:
-                    login_page = await context.new_page()
-                    await login_page.goto(self.platform.login_url, wait_until="commit")
-                    try:
-                        await self.platform.login(
-                            page=login_page, credentials=credentials
-                        )
-                    except Exception as e:
-                        logger.error(f"Error while logging in: {e}", exc_info=True)
-                    await login_page.close()
+            async with self._browser_session(
+                credentials=credentials,
+                cookie_file=cookie_file,
+                headless=headless,
+                max_pages=self._max_pages(max_concurrent),
+                blocked_resources=blocked_resources,
+            ) as browser_session:
+                self.set_semaphore(max_concurrent, max_limit=browser_session.max_pages)
+                async with browser_session.context() as context:
+                    page_pool = browser_session.page_pool(context)
+                    page = await context.new_page()
 
-                page = await context.new_page()
+                    if search_params:
+                        try:
+                            await self.scheduler.wait(self.platform.base_url)  # the search opens on the platform
+                            await self.platform.search_action(
+                                page, search_params=search_params
+                            )
+                        except Exception as e:
+                            logger.error(
+                                f"Error while in search action: {e}", exc_info=True
+                            )
 
-                if blocked_resources:
-                        await page.route("**/**", lambda route, request: self._block_resources(route, request, blocked_resources))
+                    if filters:
+                        try:
+                            await self.platform.apply_filters(page, filters=filters)
+                        except Exception as e:
+                            logger.error(
+                                f"Error while applying filters: {e}", exc_info=True
+                            )
 
-                if search_params:
-                    try:
-                        await self.platform.search_action(
-                            page, search_params=search_params
-                        )
-                    except Exception as e:
-                        logger.error(
-                            f"Error while in search action: {e}", exc_info=True
-                        )
+                    if urls:
+                        indexed_results = [
+                            item
+                            async for item in self._checkpointed(
+                                self._stream_urls(
+                                    page_pool,
+                                    urls,
+                                    max_retries=max_retries,
+                                    workers=max_concurrent or DEFAULT_MAX_CONCURRENT,
+                                    fetcher=await self._http_fetcher(browser_session),
+                                    capture_profile=capture_profile,
+                                ),
+                                urls,
+                                checkpoint,
+                                run_id,
+                            )
+                        ]
+                        # keep the order of `urls`, the pipeline yields in completion order
+                        indexed_results.sort(key=lambda item: item[0])
+                        results = [page_response for _, page_response in indexed_results]
+                        if checkpoint is not None:
+                            results = checkpoint.load(run_id, all_urls)
 
-                if filters:
-                    try:
-                        await self.platform.apply_filters(page, filters=filters)
-                    except Exception as e:
-                        logger.error(
-                            f"Error while applying filters: {e}", exc_info=True
+                    else:
+                        results = await self._search_results(
+                            page,
+                            page_pool,
+                            max_depth=max_depth,
+                            max_retries=max_retries,
+                            workers=max_concurrent or DEFAULT_MAX_CONCURRENT,
+                            capture_profile=capture_profile,
+                            **kwargs,
                         )
 
-                if urls:
-                    tasks = [
-                        self._process_url_with_semaphore(
-                            context, url, max_retries=max_retries
-                        )
-                        for url in urls
-                    ]
-                    results = await gather(*tasks)
-                    results = [
-                        item for sublist in results if sublist for item in sublist
-                    ]  # flatten the list
+                    await page.close()
+                if self.browser_session is not None:
+                    # one-off sessions save their cookies on close
+                    await browser_session.save_cookies()
+        finally:
+            self._end_run()
+            return results
 
-                else:
-                    try:
-                        results = await self.platform.after_search_action(
-                            page=page, max_depth=max_depth, **kwargs
-                        )
-                    except Exception as e:
-                        logger.error(
-                            f"Error while after search action: {e}", exc_info=True
-                        )
+    async def _search_results(
+        self,
+        page: Page,
+        page_pool: PagePool,
+        max_depth: Optional[int],
+        max_retries: Optional[int],
+        workers: int = DEFAULT_MAX_CONCURRENT,
+        capture_profile: Optional[CaptureProfile] = None,
+        **kwargs,
+    ) -> List[PageResponse]:
+        """
+        Collects and extracts the result pages of the search open on `page`.
+
+        When the platform builds the urls of the following result pages, only the
+        first one is handled by `after_search_action` and the others go through the
+        url pipeline concurrently. Otherwise `after_search_action` clicks through them.
+        Either way the pages are captured with the engine's screenshot store and the
+        capture profile of the search page object.
+        """
+        page_urls = await self._result_page_urls(page, max_depth if max_depth is not None else DEFAULT_MAX_DEPTH)
+        results = []
+        try:
+            results = await self.platform.after_search_action(
+                page=page,
+                max_depth=1 if page_urls is not None else max_depth,
+                throttle=self.scheduler.wait,
+                screenshots=self.screenshots,
+                capture_profile=self._page_profile(self.platform.get_page_object_from_url(page.url), capture_profile),
+                **kwargs,
+            )
+        except Exception as e:
+            logger.error(
+                f"Error while after search action: {e}", exc_info=True
+            )
 
-                logger.debug(f"Extracting data...{len(results)}")
-                results = await self._extract_data(results)
-                logger.debug(f"Extracted data...{len(results)}")
+        logger.debug(f"Extracting data...{len(results)}")
+        results = await self._extract_data(results)
+        logger.debug(f"Extracted data...{len(results)}")
 
-                cookie_content = await context.cookies()
-                await save_cookies(content=cookie_content, cookie_file=cookie_file)
-                await page.close()
-                await context.close()
-                await browser.close()
-        finally:
-            return results
+        if page_urls:
+            logger.debug(f"Fetching {len(page_urls)} more result page(s) by url")
+            indexed_results = [
+                item
+                async for item in self._stream_urls(
+                    page_pool, page_urls, max_retries=max_retries, workers=workers, capture_profile=capture_profile
+                )
+            ]
+            indexed_results.sort(key=lambda item: item[0])
+            results.extend(page_response for _, page_response in indexed_results)
+        return results
+
+    async def _result_page_urls(self, page: Page, max_depth: int) -> Optional[List[str]]:
+        """The urls of the result pages after the one open on `page`, bounded by the result count of the search.
+
+        None when the pages are clicked through instead, the platform does not paginate
+        by url or does not know how many results the search has.
+        """
+        if not self.platform.pagination_param:
+            return None
+        try:
+            result_count = await self.platform.result_count(page)
+        except Exception as e:
+            logger.warning(f"Could not read the result count of {page.url}: {e}")
+            result_count = None
+        if result_count is None:
+            logger.debug(f"Unknown result count on {page.url}, clicking through the result pages")
+            return None
+        page_urls = self.platform.result_page_urls(page.url, max_depth, result_count=result_count)
+        if not page_urls and result_count > self.platform.pagination_step:
+            return None  # more pages than the urls cover, e.g. an offset that is not a number
+        logger.debug(f"{result_count} result(s) on {page.url}, {len(page_urls)} more page(s) to fetch by url")
+        return page_urls
 
     async def _process_url_with_semaphore(
-        self, context: BrowserContext, url: str, max_retries: int
+        self,
+        page_pool: PagePool,
+        url: str,
+        max_retries: int,
+        fetcher: Optional[HttpFetcher] = None,
+        capture_profile: Optional[CaptureProfile] = None,
     ) -> List[PageResponse]:
         """
-        Processes a single URL, navigates to it, and then extracts data. Uses semaphore.
+        Processes a single URL on a pooled page, navigates to it, and then extracts data. Uses semaphore.
+        Urls of browserless page objects are fetched with `fetcher` instead, when given.
+
+        Failures are classified, permanent ones (e.g. 404, login wall) are not
+        retried, the others back off with jitter outside the concurrency slot.
+        Every attempt waits for the circuit breaker first.
         """
-        async with self.semaphore:
-            page = await context.new_page()
-            results = await self._process_url(page, url, max_retries)
-            await page.close()
+        max_retries = max(1, max_retries or 1)
+        for attempt in range(max_retries):
+            await self.circuit_breaker.wait()
+            try:
+                async with self.semaphore:
+                    if fetcher is not None and self._is_browserless(url):
+                        results = await self._fetch_url(fetcher, url, capture_profile)
+                    else:
+                        async with page_pool.page() as page:
+                            results = await self._process_url(page, url, capture_profile)
+            except Exception as e:
+                kind = classify_failure(e)
+                self.outcomes[kind.value] += 1
+                # a 404 says nothing about the health of the platform
+                self.circuit_breaker.record(kind not in HEALTH_FAILURES)
+                logger.error(
+                    f"Attempt {attempt + 1}: Error processing URL {url} ({kind.value}): {e}",
+                    exc_info=True,
+                )
+                if not self.retry_policy.should_retry(kind):
+                    logger.error(f"Not retrying URL {url}, {kind.value} is permanent")
+                    return []
+                if attempt == max_retries - 1:
+                    logger.error(f"Max retries reached for URL {url}")
+                    return []
+                await sleep(self.retry_policy.backoff(attempt + 1, kind))
+                await self.scheduler.wait(url)  # a retry is one more request to the host
+                continue
+
+            self.outcomes["success"] += 1
+            self.circuit_breaker.record(True)
             return results
+        return []
+
+    async def scrap_stream(
+        self,
+        urls: List[str],
+        credentials: Optional[Dict] = None,
+        cookie_file: Optional[str | Path] = None,
+        headless: bool = False,
+        max_concurrent: Optional[int] = DEFAULT_MAX_CONCURRENT,
+        max_retries: Optional[int] = DEFAULT_MAX_RETRIES,
+        buffer_size: int = DEFAULT_STREAM_BUFFER,
+        blocked_resources: Optional[Set[str]] = None,
+        checkpoint: Optional[CheckpointStore] = None,
+        run_id: Optional[str] = None,
+        capture_profile: Optional[CaptureProfile] = None,
+    ) -> AsyncIterator[PageResponse]:
+        """
+        Scraps `urls` and yields each extracted PageResponse as soon as it is ready.
+
+        Navigation and extraction run as a pipeline over bounded queues of
+        `buffer_size`, so when the consumer is slow no new navigations start and
+        memory stays bounded instead of growing with the batch. With a
+        `checkpoint` store, urls completed in `run_id` are skipped and only the
+        new results are yielded, each recorded before it is yielded.
+
+        Example:
+            ```python
+            async for page_response in engine.scrap_stream(urls=job_urls):
+                save(page_response)
+            ```
+        """
+        if checkpoint is not None:
+            if not run_id:
+                raise ValueError("Provide a run_id to checkpoint")
+            urls = checkpoint.pending(run_id, urls)
+        if not urls:
+            return
+
+        try:
+            async with self._browser_session(
+                credentials=credentials,
+                cookie_file=cookie_file,
+                headless=headless,
+                max_pages=self._max_pages(max_concurrent),
+                blocked_resources=blocked_resources,
+            ) as browser_session:
+                self.set_semaphore(max_concurrent, max_limit=browser_session.max_pages)
+                async with browser_session.context() as context:
+                    page_pool = browser_session.page_pool(context)
+                    async for _, page_response in self._checkpointed(
+                        self._stream_urls(
+                            page_pool,
+                            urls,
+                            max_retries=max_retries,
+                            workers=max_concurrent or DEFAULT_MAX_CONCURRENT,
+                            buffer_size=buffer_size,
+                            fetcher=await self._http_fetcher(browser_session),
+                            capture_profile=capture_profile,
+                        ),
+                        urls,
+                        checkpoint,
+                        run_id,
+                    ):
+                        yield page_response
+                if self.browser_session is not None:
+                    await browser_session.save_cookies()
+        finally:
+            self._end_run()
+
+    async def scrap_sharded(
+        self,
+        urls: List[str],
+        processes: int = 2,
+        ordered: bool = True,
+        credentials: Optional[Dict] = None,
+        cookie_file: Optional[str | Path] = None,
+        headless: bool = True,
+        max_concurrent: Optional[int] = DEFAULT_MAX_CONCURRENT,
+        max_retries: Optional[int] = DEFAULT_MAX_RETRIES,
+        blocked_resources: Optional[Set[str]] = None,
+        capture_profile: Optional[CaptureProfile] = None,
+    ) -> AsyncIterator[PageResponse]:
+        """
+        Splits `urls` over `processes` worker processes and yields their PageResponses.
+
+        Each worker runs its own browser and event loop, so navigation and the
+        CPU heavy post-processing spread over cores. The cookie file is brought up
+        to date once (logging in if `credentials` are given) and shared read only,
+        the platform's rate limit is divided between the workers. Results arrive
+        in the order of `urls` with `ordered`, otherwise as soon as they are done.
+        The platform class must be constructible without arguments.
+
+        Example:
+            ```python
+            async for page_response in engine.scrap_sharded(job_urls, processes=4, ordered=False):
+                save(page_response)
+            ```
+        """
+        async for _, page_response in self._scrap_sharded(
+            urls,
+            processes=processes,
+            ordered=ordered,
+            credentials=credentials,
+            cookie_file=cookie_file,
+            headless=headless,
+            max_concurrent=max_concurrent,
+            max_retries=max_retries,
+            blocked_resources=blocked_resources,
+            capture_profile=capture_profile,
+        ):
+            yield page_response
+
+    async def _scrap_sharded(
+        self,
+        urls: List[str],
+        processes: int = 2,
+        ordered: bool = True,
+        credentials: Optional[Dict] = None,
+        cookie_file: Optional[str | Path] = None,
+        headless: bool = True,
+        max_concurrent: Optional[int] = DEFAULT_MAX_CONCURRENT,
+        max_retries: Optional[int] = DEFAULT_MAX_RETRIES,
+        blocked_resources: Optional[Set[str]] = None,
+        capture_profile: Optional[CaptureProfile] = None,
+    ) -> AsyncIterator[Tuple[int, PageResponse]]:
+        """`scrap_sharded()` yielding `(url index, PageResponse)`"""
+        if not urls:
+            return
+
+        cookie_file = await self._share_cookies(credentials, cookie_file, headless)
+        blocking_rules = self.blocking_rules
+        if blocked_resources is not None:
+            blocking_rules = blocking_rules.model_copy(update={"resource_types": set(blocked_resources)})
+        engine_kwargs = dict(
+            adaptive_concurrency=self.adaptive_concurrency,
+            max_concurrent_limit=self.max_concurrent_limit,
+            retry_policy=self.retry_policy,
+            blocking_rules=blocking_rules,
+            screenshot_policy=self.screenshots.policy,
+            extraction_cache=self.extraction_cache,
+            # the shards would append to the same archive, their results are released here instead
+            release_payloads=self.release_payloads and self.content_store is None,
+            cpu_executor=self.cpu_executor.config if self.cpu_executor is not None else None,
+        )
+        scrap_kwargs = dict(
+            cookie_file=cookie_file,
+            headless=headless,
+            max_concurrent=max_concurrent,
+            max_retries=max_retries,
+            capture_profile=capture_profile,
+        )
+
+        shards = split_urls(urls, processes)
+        # spawn, a forked child would inherit the parent's event loop and playwright state
+        mp_context = multiprocessing.get_context("spawn")
+        result_queue = mp_context.Queue()
+        workers = [
+            mp_context.Process(
+                target=run_shard,
+                args=(shard_id, type(self.platform), shard, engine_kwargs, scrap_kwargs, len(shards), result_queue),
+                daemon=True,
+            )
+            for shard_id, shard in enumerate(shards)
+        ]
+        for worker in workers:
+            worker.start()
+        logger.info(f"Scraping {len(urls)} urls with {len(workers)} processes")
+
+        try:
+            async for index, resp in merge_results(result_queue, workers, ordered=ordered):
+                if resp is not None and resp.timings:
+                    # the shards time their urls in their own process
+                    page_type = _page_type(self.platform.get_page_object_from_url(resp.url))
+                    for stage, seconds in resp.timings.items():
+                        self.timings.observe(page_type, stage, seconds)
+                if resp is not None and self.content_store is not None:
+                    await self._release(resp)
+                yield index, resp
+        finally:
+            for worker in workers:
+                if worker.is_alive():
+                    worker.terminate()
+                worker.join()
+            self._end_run()
+
+    async def _share_cookies(
+        self,
+        credentials: Optional[Dict] = None,
+        cookie_file: Optional[str | Path] = None,
+        headless: bool = True,
+    ) -> str | Path:
+        """Brings the cookie file up to date for other processes and returns its path"""
+        if self.browser_session is not None:
+            await self.browser_session.save_cookies()
+            return self.browser_session.cookie_file
+
+        browser_session = BrowserSession(
+            self.platform, credentials=credentials, cookie_file=cookie_file, headless=headless,
+            scheduler=self.scheduler,
+        )
+        if credentials:
+            async with browser_session:
+                pass  # logs in once, the cookies are saved on close
+        return browser_session.cookie_file
+
+    async def _checkpointed(
+        self,
+        items: AsyncIterator[Tuple[int, PageResponse]],
+        urls: List[str],
+        checkpoint: Optional[CheckpointStore],
+        run_id: Optional[str],
+    ) -> AsyncIterator[Tuple[int, PageResponse]]:
+        """Passes `(url index, PageResponse)` items through, recording each under its requested url"""
+        async for index, page_response in items:
+            if checkpoint is not None:
+                try:
+                    await checkpoint.asave(run_id, page_response, url=urls[index])
+                except Exception as e:
+                    logger.error(f"Error while checkpointing {urls[index]}: {e}", exc_info=True)
+            yield index, page_response
+
+    async def _stream_urls(
+        self,
+        page_pool: PagePool,
+        urls: List[str],
+        max_retries: int,
+        workers: int = DEFAULT_MAX_CONCURRENT,
+        buffer_size: int = DEFAULT_STREAM_BUFFER,
+        include_failures: bool = False,
+        fetcher: Optional[HttpFetcher] = None,
+        capture_profile: Optional[CaptureProfile] = None,
+    ) -> AsyncIterator[Tuple[int, Optional[PageResponse]]]:
+        """
+        Runs the navigation -> extraction pipeline and yields `(url index, PageResponse)`.
+
+        Navigation workers take urls from the domain scheduler, which holds each host
+        to the platform's rate, and put raw responses on `navigated`. Extraction
+        workers move them to `extracted`. Both queues are bounded, a full queue
+        blocks its producers. With `include_failures` a failed url is yielded as
+        `(url index, None)`, so every url is reported. `fetcher` serves the urls
+        of browserless page objects.
+
+        There is a navigation worker per slot the concurrency limiter may grow
+        to, the limiter decides how many of them navigate at once. `workers` is
+        the number of extraction workers.
+        """
+        pending = self.scheduler.queue(((index, url), url) for index, url in enumerate(urls))
+        navigated: Queue = Queue(maxsize=buffer_size)
+        extracted: Queue = Queue(maxsize=buffer_size)
+        navigators = max(1, min(max(workers, self.semaphore.max_limit), len(urls)))
+        workers = max(1, min(workers, len(urls)))
+
+        async def navigate() -> None:
+            # the politeness wait happens before taking a concurrency slot, so a
+            # throttled domain does not block pages of other domains
+            while (item := await pending.next()) is not None:
+                index, url = item
+                try:
+                    page_responses = await self._process_url_with_semaphore(
+                        page_pool, url, max_retries=max_retries, fetcher=fetcher, capture_profile=capture_profile
+                    )
+                except Exception as e:
+                    logger.error(f"Error while processing {url}: {e}", exc_info=True)
+                    page_responses = []
+                if not page_responses and include_failures:
+                    await extracted.put((index, None))
+                for page_response in page_responses:
+                    await navigated.put((index, page_response))
+
+        async def extract() -> None:
+            while (item := await navigated.get()) is not _DONE:
+                index, page_response = item
+                page_response = await self._extract_single(page_response)
+                if page_response or include_failures:
+                    await extracted.put((index, page_response))
+
+        # the end markers are sent on errors too, but not on cancellation, where
+        # nobody is left to drain the queues
+        async def run_navigators() -> None:
+            try:
+                await gather(*(navigate() for _ in range(navigators)))
+            except Exception as e:
+                logger.error(f"Error in navigation workers: {e}", exc_info=True)
+            for _ in range(workers):
+                await navigated.put(_DONE)
+
+        async def run_extractors() -> None:
+            try:
+                await gather(*(extract() for _ in range(workers)))
+            except Exception as e:
+                logger.error(f"Error in extraction workers: {e}", exc_info=True)
+            await extracted.put(_DONE)
+
+        tasks = [create_task(run_navigators()), create_task(run_extractors())]
+        try:
+            while (item := await extracted.get()) is not _DONE:
+                yield item
+        finally:
+            for task in tasks:
+                task.cancel()
+            await gather(*tasks, return_exceptions=True)
 
     async def _process_url(
-        self, page: Page, url: str, max_retries: int = 3
+        self, page: Page, url: str, capture_profile: Optional[CaptureProfile] = None
     ) -> List[PageResponse]:
-        results = []
-        for attempt in range(max_retries):
+        """Navigates to `url`, waits for its readiness selectors, runs its page action and parses it, raising on any failure
+
+        JSON responses matching the page object's `capture_patterns` are attached
+        to the PageResponse. With `capture_only` and something captured the DOM is
+        not serialized at all. The cards of a page object with a `harvest_selector`
+        are collected while its page action runs and merged into the html, see ListHarvester.
+        `capture_profile` overrides the page object's one.
+        """
+        page_obj = self.platform.get_page_object_from_url(url)
+        capture_patterns = list(page_obj.capture_patterns) if page_obj else []
+        failure_screenshot = None
+
+        with self.timings.trace(_page_type(page_obj)) as stages, using(self.cpu_executor):
             try:
-                await page.reload()
-                await page.goto(url, wait_until="domcontentloaded")
+                async with ResponseCapture(page, capture_patterns) as capture:
+                    with span("navigate"):
+                        await self._navigate(page, url)
+                    if page_obj:
+                        with span("ready"):
+                            ready = await wait_for_selectors(
+                                page, page_obj.readiness_selectors(), timeout=page_obj.ready_timeout
+                            )
+                        if not ready:
+                            failure_screenshot = await self._failure_screenshot(page, url, "not ready")
+                    async with ListHarvester(page, *self._harvest(page_obj)) as harvester:
+                        if page_obj:
+                            with span("page_action"):
+                                await page_obj.page_action(page)
+                        with span("capture"):
+                            captured = await capture.collect()
 
-                page_obj = self.platform.get_page_object_from_url(url)
-                if page_obj:
-                    await page_obj.page_action(page)
+                        if captured and page_obj.capture_only:
+                            logger.debug(f"Captured {len(captured)} response(s) for {url}, skipping the DOM")
+                            return [PageResponse(url=page.url, captured=captured, timings=stages, screenshot_path=failure_screenshot)]
 
-                page_res = await parse_page_response(page)
-                results.append(page_res)
-                break  # Exit retry loop on success
+                        page_res = await harvester.merge(await parse_page_response(
+                            page,
+                            profile=self._page_profile(page_obj, capture_profile),
+                            screenshots=self.screenshots,
+                        ))
+                if self._precompute_derived():
+                    await page_res.aderive()
+            except Exception as e:
+                await self._failure_screenshot(page, url, e)
+                raise
+        page_res.screenshot_path = page_res.screenshot_path or failure_screenshot
+        page_res.captured = captured or None
+        page_res.timings = stages
+        return [page_res]
+
+    @staticmethod
+    def _harvest(page_obj) -> Tuple[Optional[str], str]:
+        """The card selector and key of the virtualized list `page_obj` harvests, no selector if it does not"""
+        selector = getattr(page_obj, "harvest_selector", None)
+        if not isinstance(selector, str):
+            return None, DEFAULT_HARVEST_KEY
+        return selector, page_obj.harvest_key
+
+    def _page_profile(self, page_obj, capture_profile: Optional[CaptureProfile]) -> CaptureProfile:
+        """The capture profile of a url, with the screenshot decided by the screenshot policy unless the profile sets it"""
+        profile = self._capture_profile(page_obj, capture_profile) or CaptureProfile()
+        if profile.screenshot is None:
+            needs_image = getattr(getattr(page_obj, "extraction_strategy", None), "needs_image", False) is True
+            profile = profile.model_copy(update={"screenshot": self.screenshots.policy.wants(needs_image)})
+        return profile
+
+    async def _failure_screenshot(self, page: Page, url: str, reason) -> Optional[str]:
+        """Screenshots a page that failed or was not ready in time, if the policy asks for it"""
+        if not self.screenshots.policy.on_failure or page.is_closed():
+            return None
+        path = await self.screenshots.capture(page)
+        if path:
+            logger.error(f"Screenshot of {url} ({reason}) saved to {path}")
+        return path
+
+    async def _navigate(self, page: Page, url: str) -> Optional[Response]:
+        """Navigates to `url` and reports latency and status to the concurrency limiter
+
+        Raises:
+            PageStatusError: The main response has an error status.
+            LoginRequiredError: The platform redirected to its login wall.
+        """
+        start = time.monotonic()
+        try:
+            response = await page.goto(url, wait_until="domcontentloaded")
+        except Exception:
+            self.semaphore.record(time.monotonic() - start, error=True)
+            raise
+        status = response.status if response else None
+        self.semaphore.record(time.monotonic() - start, status=status)
+        self._check_response(url, page.url, status)
+        return response
+
+    def _is_browserless(self, url: str) -> bool:
+        page_obj = self.platform.get_page_object_from_url(url)
+        return page_obj is not None and page_obj.browserless is True
+
+    async def _http_fetcher(self, browser_session: BrowserSession) -> Optional[HttpFetcher]:
+        """The session's HTTP client if any page object of the platform is browserless"""
+        pages = list(self.platform.pages) + [self.platform.dummy_page]
+        if any(page is not None and page.browserless is True for page in pages):
+            return await browser_session.http_fetcher()
+        return None
+
+    async def _fetch_url(
+        self, fetcher: HttpFetcher, url: str, capture_profile: Optional[CaptureProfile] = None
+    ) -> List[PageResponse]:
+        """Fetches `url` without a browser and parses it like `_process_url`, raising on any failure"""
+        page_obj = self.platform.get_page_object_from_url(url)
+        with self.timings.trace(_page_type(page_obj)) as stages, using(self.cpu_executor):
+            start = time.monotonic()
+            try:
+                with span("fetch"):
+                    response = await fetcher.fetch(url)
+            except Exception:
+                self.semaphore.record(time.monotonic() - start, error=True)
+                raise
+            self.semaphore.record(time.monotonic() - start, status=response.status_code)
+            self._check_response(url, str(response.url), response.status_code)
+            page_res = await abuild_page_response(
+                url=str(response.url),
+                raw_html=response.text,
+                profile=self._capture_profile(page_obj, capture_profile),
+                derive=self._precompute_derived(),
+            )
+        page_res.timings = stages
+        return [page_res]
+
+    def _precompute_derived(self) -> bool:
+        """Whether the derived representations are computed in the CPU executor right after capture"""
+        return self.cpu_executor is not None and self.cpu_executor.config.precompute_derived
+
+    @staticmethod
+    def _capture_profile(page_obj, capture_profile: Optional[CaptureProfile]) -> Optional[CaptureProfile]:
+        """The profile of this call if any, else the page object's"""
+        if capture_profile is not None:
+            return capture_profile
+        return page_obj.capture_profile if page_obj is not None else None
+
+    def _check_response(self, url: str, final_url: Optional[str], status: Optional[int]) -> None:
+        """Raises when the response of `url` is an error status or the platform's login wall"""
+        if isinstance(status, int) and status >= 400:
+            raise PageStatusError(url, status)
+        login_wall = self.platform.login_wall_pattern
+        if (
+            isinstance(login_wall, str)
+            and re.search(login_wall, final_url or "")
+            and not re.search(login_wall, url)
+        ):
+            raise LoginRequiredError(url, final_url)
+
+    async def _extract_single(self, page_response: PageResponse) -> Optional[PageResponse]:
+        """Extracts the data of one page response, returns None if the extraction failed"""
+        logger.debug(f"Extracting data for {page_response.url}")
+        page_obj = self.platform.get_page_object_from_url(page_response.url)
+        if page_response.timings is None:
+            page_response.timings = {}
+        with self.timings.trace(_page_type(page_obj), stages=page_response.timings), using(self.cpu_executor):
+            with span("extract"):
+                extracted_response = await self._extract_with(page_obj, page_response)
+        if extracted_response is not None:
+            await self._release(extracted_response)
+        return extracted_response
+
+    async def _release(self, page_response: PageResponse) -> None:
+        """Drops the payloads of an extracted page if `release_payloads`, archived in the content store first"""
+        if not self.release_payloads or page_response.extracted_data is None:
+            return
+        if self.content_store is not None:
+            try:
+                await self.content_store.aappend(page_response)
+            except Exception as e:
+                logger.error(f"Error while archiving {page_response.url}, keeping its payloads: {e}", exc_info=True)
+                return
+            page_response.content_ref = self.content_store.path.as_posix()
+        page_response.release()
+
+    async def _extract_with(self, page_obj, page_response: PageResponse) -> Optional[PageResponse]:
+        """Extracts with the captured responses or the extraction strategy of `page_obj`"""
+        if page_obj and page_response.captured:
+            try:
+                extracted_data = page_obj.parse_captured(page_response.captured)
+            except Exception as e:
+                logger.error(f"Error while parsing captured responses of {page_response.url}: {e}", exc_info=True)
+                extracted_data = None
+            if extracted_data is not None:
+                page_response.extracted_data = extracted_data
+                return page_response
+            if page_response.html is None:
+                return page_response  # captured only, nothing for an HTML strategy
+        if page_obj and page_obj.extraction_strategy:
+            strategy = page_obj.extraction_strategy
+            try:
+                if self.extraction_cache is not None and strategy.cache is None:
+                    extracted_response = await strategy.aextract_cached(page_response, self.extraction_cache)
+                else:
+                    extracted_response = await strategy.aextract(page_response)
+                if extracted_response:
+                    logger.debug(f"Extracted data for {page_response.url}")
+                    return extracted_response
             except Exception as e:
                 logger.error(
-                    f"Attempt {attempt + 1}: Error processing URL {url}: {e}",
+                    f"Error while extraction for {page_response.url}: {e}",
                     exc_info=True,
                 )
-                if attempt == max_retries - 1:
-                    logger.error(f"Max retries reached for URL {url}")
-        return results
-
-    # TODO: make this better
-    async def _block_resources(self, route: Route, request: Request, blocked_resources: Set[str]) -> None:
-        if request.resource_type in blocked_resources:
-            await route.abort()
         else:
-            await route.continue_()
-            
+            logger.debug(f"No extraction strategy for {page_response.url}")
+            return page_response
+
     async def _extract_data(
         self, page_responses: List[PageResponse]
     ) -> List[PageResponse]:
         """Extracts the data by the page strategy using concurrent tasks"""
-
-        async def extract_single(page_response: PageResponse) -> PageResponse:
-            logger.debug(f"Extracting data for {page_response.url}")
-            page_obj = self.platform.get_page_object_from_url(page_response.url)
-            if page_obj and page_obj.extraction_strategy:
-                try:
-                    extracted_response = await page_obj.extraction_strategy.aextract(
-                        page_response
-                    )
-                    if extracted_response:
-                        logger.debug(f"Extracted data for {page_response.url}")
-                        return extracted_response
-                except Exception as e:
-                    logger.error(
-                        f"Error while extraction for {page_response.url}: {e}",
-                        exc_info=True,
-                    )
-            else:
-                logger.debug(f"No extraction strategy for {page_response.url}")
-                return page_response
-
-        extraction_tasks = [extract_single(response) for response in page_responses]
+        extraction_tasks = [self._extract_single(response) for response in page_responses]
         results = await gather(*extraction_tasks)
         return [r for r in results if r]
+
+
+def _page_type(page_obj) -> str:
+    """The label of a page object in the stage timings"""
+    return type(page_obj).__name__ if page_obj is not None else UNKNOWN_PAGE_TYPE
@@ -1,5 +1,8 @@
+import asyncio
 import json
 import logging
+import os
+import tempfile
 from pathlib import Path
 from typing import AsyncIterable, List, TypeVar
 
@@ -19,14 +22,18 @@ async def list_to_async_iterator(responses: List[T]) -> AsyncIterable[T]:
 
 async def read_cookies(cookie_file: str) -> dict | list[dict] | None:
     """
-    Read cookies from a JSON file.
+    Read cookies from a JSON file without blocking the event loop.
     
     Args:
         cookie_file: Path to the cookie file
         
     Returns:
-        dict|list[dict]: Cookie data if successful, None otherwise
+        dict|list[dict]: A Playwright storage state (cookies and local storage) or a
+            plain cookie list from older files if successful, None otherwise
     """
+    return await asyncio.to_thread(_read_cookies, cookie_file)
+
+def _read_cookies(cookie_file: str) -> dict | list[dict] | None:
     try:
         cookie_path = Path(cookie_file)
         if not cookie_path.exists():
@@ -49,23 +56,39 @@ async def read_cookies(cookie_file: str) -> dict | list[dict] | None:
 
 async def save_cookies(content: dict | list[dict], cookie_file: str) -> bool:
     """
-    Save cookies to a JSON file.
+    Save cookies to a JSON file without blocking the event loop.
+
+    The JSON is compact and replaces the file atomically, so other processes
+    reading the same file never see a partial write.
     
     Args:
-        content: Cookie data to save
+        content: Cookie data or a Playwright storage state to save
         cookie_file: Path to save the cookie file
         
     Returns:
         bool: True if successful, False otherwise
     """
+    return await asyncio.to_thread(_save_cookies, content, cookie_file)
+
+def _save_cookies(content: dict | list[dict], cookie_file: str) -> bool:
     try:
         cookie_path = Path(cookie_file)
         
         # Ensure directory exists
         cookie_path.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(cookie_path, 'w', encoding='utf-8') as f:
-            json.dump(content, f, indent=4)
+        # a file of its own per save, concurrent saves of the same process never share one
+        with tempfile.NamedTemporaryFile(
+            'w', encoding='utf-8', dir=cookie_path.parent, prefix=f".{cookie_path.name}.", suffix=".tmp", delete=False
+        ) as f:
+            temp_path = f.name
+            try:
+                json.dump(content, f, separators=(',', ':'))
+            except BaseException:
+                f.close()
+                os.unlink(temp_path)
+                raise
+        os.replace(temp_path, cookie_path)
         return True
         
     except TypeError as e:
@@ -76,4 +99,4 @@ async def save_cookies(content: dict | list[dict], cookie_file: str) -> bool:
         return False
     except Exception as e:
         logger.error(f"Unexpected error saving cookie file {cookie_file}: {str(e)}")
-        return False
\ No newline at end of file
+        return False
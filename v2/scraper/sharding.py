@@ -0,0 +1,156 @@
+# scraper/sharding.py
+import asyncio
+import multiprocessing
+from multiprocessing.process import BaseProcess
+from queue import Empty
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple, Type
+
+from v2.core.page_output import PageResponse
+from v2.infrastructure.logging.logger import get_logger
+from v2.platforms.base_platform import WebsitePlatform
+
+logger = get_logger(__name__)
+
+DEFAULT_POLL_INTERVAL = 0.5
+
+IndexedUrl = Tuple[int, str]
+
+
+def split_urls(urls: Sequence[str], shards: int) -> List[List[IndexedUrl]]:
+    """
+    Deals `(index, url)` pairs round robin over `shards`.
+
+    Round robin keeps every shard working on the front of the list at the same
+    time, so an ordered merge can release results early.
+    """
+    shards = max(1, min(shards, len(urls)))
+    indexed_urls = list(enumerate(urls))
+    return [indexed_urls[shard::shards] for shard in range(shards)]
+
+
+def run_shard(
+    shard_id: int,
+    platform_cls: Type[WebsitePlatform],
+    indexed_urls: List[IndexedUrl],
+    engine_kwargs: Dict[str, Any],
+    scrap_kwargs: Dict[str, Any],
+    shards: int,
+    result_queue: multiprocessing.Queue,
+) -> None:
+    """
+    Entry point of a shard worker process.
+
+    Puts `(url index, PageResponse | None)` on `result_queue` for every url, None
+    marking a failed url, and `(None, shard_id)` once the shard is done.
+    """
+    try:
+        asyncio.run(
+            _scrap_shard(platform_cls, indexed_urls, engine_kwargs, scrap_kwargs, shards, result_queue)
+        )
+    except Exception as e:
+        logger.error(f"Shard {shard_id} failed: {e}", exc_info=True)
+    finally:
+        result_queue.put((None, shard_id))
+
+
+async def _scrap_shard(
+    platform_cls: Type[WebsitePlatform],
+    indexed_urls: List[IndexedUrl],
+    engine_kwargs: Dict[str, Any],
+    scrap_kwargs: Dict[str, Any],
+    shards: int,
+    result_queue: multiprocessing.Queue,
+) -> None:
+    # imported here, the engine imports this module
+    from v2.scraper.browser_session import BrowserSession
+    from v2.scraper.scheduler import DomainScheduler
+    from v2.scraper.scraper_engine import ScraperEngine
+
+    platform = platform_cls()
+    engine = ScraperEngine(platform, **engine_kwargs)
+    # the shards hit the same hosts, together they keep to the platform's rate
+    engine.scheduler = DomainScheduler(
+        rate_limit=platform.rate_limit / shards if platform.rate_limit else None,
+        burst=max(1, platform.rate_burst // shards),
+        min_delay=platform.min_delay * shards,
+    )
+
+    max_concurrent = scrap_kwargs.get("max_concurrent")
+    indices = [index for index, _ in indexed_urls]
+    urls = [url for _, url in indexed_urls]
+    try:
+        # cookies are shared read only, the parent owns the cookie file
+        async with BrowserSession(
+            platform,
+            cookie_file=scrap_kwargs.get("cookie_file"),
+            headless=scrap_kwargs.get("headless", True),
+            max_pages=engine._max_pages(max_concurrent),
+            resource_blocker=engine.resource_blocker,
+            persist_cookies=False,
+            scheduler=engine.scheduler,
+        ) as browser_session:
+            engine.set_semaphore(max_concurrent, max_limit=browser_session.max_pages)
+            async with browser_session.context() as context:
+                async for position, page_response in engine._stream_urls(
+                    browser_session.page_pool(context),
+                    urls,
+                    max_retries=scrap_kwargs.get("max_retries"),
+                    workers=max_concurrent or len(urls),
+                    include_failures=True,
+                    fetcher=await engine._http_fetcher(browser_session),
+                    capture_profile=scrap_kwargs.get("capture_profile"),
+                ):
+                    result_queue.put((indices[position], page_response))
+    finally:
+        engine.close()
+
+
+async def merge_results(
+    result_queue: multiprocessing.Queue,
+    processes: List[BaseProcess],
+    ordered: bool = True,
+    poll_interval: float = DEFAULT_POLL_INTERVAL,
+) -> AsyncIterator[Tuple[int, PageResponse]]:
+    """
+    Yields `(url index, PageResponse)` from the shard workers until all of them are done.
+
+    With `ordered` results are held back until every lower index has arrived,
+    failed urls are skipped. A worker that dies without reporting ends the merge
+    once the queue is drained.
+    """
+    loop = asyncio.get_running_loop()
+    running = len(processes)
+    held: Dict[int, Optional[PageResponse]] = {}
+    next_index = 0
+
+    while running:
+        try:
+            index, page_response = await loop.run_in_executor(
+                None, lambda: result_queue.get(timeout=poll_interval)
+            )
+        except Empty:
+            if not any(process.is_alive() for process in processes):
+                logger.error(f"{running} shard(s) exited without finishing")
+                break
+            continue
+
+        if index is None:
+            running -= 1
+            continue
+        if not ordered:
+            if page_response is not None:
+                yield index, page_response
+            continue
+
+        if index >= next_index:
+            held.setdefault(index, page_response)
+        while next_index in held:
+            page_response = held.pop(next_index)
+            if page_response is not None:
+                yield next_index, page_response
+            next_index += 1
+
+    # whatever is held back now waits on urls that were never reported
+    for index in sorted(held):
+        if held[index] is not None:
+            yield index, held[index]
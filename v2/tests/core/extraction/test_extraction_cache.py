@@ -0,0 +1,177 @@
+# tests/core/extraction/test_extraction_cache.py
+import pickle
+import tempfile
+from pathlib import Path
+from unittest import IsolatedAsyncioTestCase, TestCase
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from pydantic import BaseModel
+
+from v2.core.extraction import (
+    CSSExtractionStrategy,
+    ExtractionCache,
+    ExtractionMapping,
+    FieldConfig,
+    LLMExtractionStrategyHTML,
+)
+from v2.core.page_output import PageResponse
+from v2.scraper.scraper_engine import ScraperEngine
+
+HTML = "<html><body><h1 class='title'>Data Scientist</h1></body></html>"
+
+
+class JobModel(BaseModel):
+    title: str | None = None
+
+
+def completion_response(content: str):
+    return MagicMock(choices=[MagicMock(message=MagicMock(content=content))])
+
+
+class TestExtractionCache(TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / "cache.sqlite3"
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_persists_across_instances(self):
+        cache = ExtractionCache(self.path)
+        cache.set("key", {"title": "Data Scientist"})
+        cache.close()
+
+        cache = ExtractionCache(self.path)
+        self.assertEqual(cache.get("key"), {"title": "Data Scientist"})
+        self.assertIsNone(cache.get("other"))
+        self.assertEqual(cache.stats()["hits"], 1)
+        self.assertEqual(cache.stats()["misses"], 1)
+        cache.close()
+
+    def test_evicts_least_recently_used(self):
+        cache = ExtractionCache(self.path, max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), 1)
+        self.assertEqual(cache.get("c"), 3)
+        cache.close()
+
+    def test_evicts_beyond_max_bytes(self):
+        cache = ExtractionCache(self.path, max_entries=None, max_bytes=20)
+        cache.set("a", "x" * 10)
+        cache.set("b", "y" * 10)
+
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.get("b"), "y" * 10)
+        cache.close()
+
+    def test_bounds_hold_across_instances_of_the_file(self):
+        first = ExtractionCache(self.path, max_entries=2)
+        second = ExtractionCache(self.path, max_entries=2)
+
+        first.set("a", 1)
+        second.set("b", 2)
+        first.get("a")  # "b" is now the least recently used, for both
+        second.set("c", 3)
+
+        self.assertEqual(len(first), 2)
+        self.assertIsNone(first.get("b"))
+        self.assertEqual((first.get("a"), first.get("c")), (1, 3))
+        first.close()
+        second.close()
+
+    def test_pickles_as_its_file(self):
+        cache = ExtractionCache(self.path, max_entries=5)
+        cache.set("a", 1)
+
+        copy = pickle.loads(pickle.dumps(cache))
+        self.assertEqual(copy.max_entries, 5)
+        self.assertEqual(copy.get("a"), 1)
+        cache.close()
+        copy.close()
+
+
+class TestCachedStrategies(IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache = ExtractionCache(Path(self.tmp.name) / "cache.sqlite3")
+        self.mapping = ExtractionMapping(extraction_configs={"title": FieldConfig(selector=".title")})
+
+    def tearDown(self):
+        self.cache.close()
+        self.tmp.cleanup()
+
+    async def test_css_strategy_extracts_the_same_html_once(self):
+        strategy = CSSExtractionStrategy(self.mapping, cache=self.cache)
+        with patch.object(strategy, "extract", wraps=strategy.extract) as extract:
+            first = await strategy.aextract(PageResponse(html=HTML))
+            second = await strategy.aextract(PageResponse(html=HTML))
+
+        self.assertEqual(extract.call_count, 1)
+        self.assertEqual(first.extracted_data, {"title": "Data Scientist"})
+        self.assertEqual(second.extracted_data, {"title": "Data Scientist"})
+
+    async def test_mapping_change_misses(self):
+        await CSSExtractionStrategy(self.mapping, cache=self.cache).aextract(PageResponse(html=HTML))
+        other = ExtractionMapping(extraction_configs={"heading": FieldConfig(selector="h1")})
+
+        response = await CSSExtractionStrategy(other, cache=self.cache).aextract(PageResponse(html=HTML))
+
+        self.assertEqual(response.extracted_data, {"heading": "Data Scientist"})
+        self.assertEqual(len(self.cache), 2)
+
+    @patch("v2.core.extraction.extraction.acompletion", new_callable=AsyncMock)
+    async def test_llm_strategy_completes_the_same_html_once(self, acompletion):
+        acompletion.return_value = completion_response('{"title": "Data Scientist"}')
+        strategy = LLMExtractionStrategyHTML(model="test-model", extraction_model=JobModel, cache=self.cache)
+
+        await strategy.aextract(PageResponse(html=HTML))
+        response = await strategy.aextract(PageResponse(html=HTML))
+
+        acompletion.assert_awaited_once()
+        self.assertEqual(response.extracted_data, JobModel(title="Data Scientist"))
+
+    @patch("v2.core.extraction.extraction.acompletion", new_callable=AsyncMock)
+    async def test_failed_extraction_is_not_cached(self, acompletion):
+        acompletion.side_effect = RuntimeError("rate limited")
+        strategy = LLMExtractionStrategyHTML(model="test-model", extraction_model=JobModel, cache=self.cache)
+
+        await strategy.aextract(PageResponse(html=HTML))
+
+        self.assertEqual(len(self.cache), 0)
+
+    @patch("v2.core.extraction.extraction.acompletion", new_callable=AsyncMock)
+    async def test_invalid_reply_is_not_cached(self, acompletion):
+        strategy = LLMExtractionStrategyHTML(model="test-model", extraction_model=JobModel, cache=self.cache)
+
+        for reply in ['{"title": ["Data Scientist"]}', "Sorry, I cannot read this page."]:
+            acompletion.return_value = completion_response(reply)
+            response = await strategy.aextract(PageResponse(html=HTML))
+
+            self.assertNotIsInstance(response.extracted_data, JobModel)
+        self.assertEqual(len(self.cache), 0)
+        self.assertEqual(acompletion.await_count, 2)
+
+    async def test_engine_cache_for_strategies_without_one(self):
+        strategy = CSSExtractionStrategy(self.mapping)
+        platform = MagicMock(rate_limit=None, rate_burst=1, min_delay=0.0, blocked_url_patterns=[], login_wall_pattern=None)
+        platform.get_page_object_from_url.return_value = MagicMock(extraction_strategy=strategy, captured=None)
+        engine = ScraperEngine(platform, extraction_cache=self.cache)
+
+        with patch.object(strategy, "extract", wraps=strategy.extract) as extract:
+            results = await engine._extract_data([
+                PageResponse(url="https://example.com/1", html=HTML),
+                PageResponse(url="https://example.com/2", html=HTML),
+            ])
+            results += await engine._extract_data([PageResponse(url="https://example.com/3", html=HTML)])
+
+        self.assertLessEqual(extract.call_count, 2)  # the first batch runs concurrently
+        self.assertEqual([r.extracted_data for r in results], [{"title": "Data Scientist"}] * 3)
+        self.assertGreaterEqual(self.cache.stats()["hits"], 1)
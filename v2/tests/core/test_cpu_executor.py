@@ -0,0 +1,72 @@
+# tests/core/test_cpu_executor.py
+import threading
+from unittest import IsolatedAsyncioTestCase
+
+from v2.core.cpu_executor import CpuExecutor, CpuExecutorConfig, current_executor, run_cpu
+from v2.core.extraction import CSSExtractionStrategy, ExtractionMapping, FieldConfig
+from v2.core.page_output import PageResponse, abuild_page_response, html_to_text
+from v2.infrastructure.metrics.timing import StageTimings, span
+
+HTML = "<html><body><h1 class='title'>Fish &amp; chips</h1><script>var x;</script></body></html>"
+
+
+def thread_name() -> str:
+    return threading.current_thread().name
+
+
+def timed_work() -> None:
+    with span("work"):
+        pass
+
+
+class TestCpuExecutor(IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.executor = CpuExecutor(CpuExecutorConfig(max_workers=2))
+
+    def tearDown(self):
+        self.executor.shutdown()
+
+    async def test_inline_without_executor(self):
+        self.assertIsNone(current_executor())
+        self.assertEqual(await run_cpu(thread_name), threading.current_thread().name)
+
+    async def test_runs_in_the_pool_inside_use(self):
+        with self.executor.use():
+            name = await run_cpu(thread_name)
+
+        self.assertTrue(name.startswith("cpu"))
+        self.assertIsNone(current_executor())
+
+    async def test_thread_pool_keeps_the_stage_timings(self):
+        timings = StageTimings()
+        with timings.trace("JobPage") as stages, self.executor.use():
+            await run_cpu(timed_work)
+
+        self.assertIn("work", stages)
+
+    async def test_process_pool(self):
+        executor = CpuExecutor(CpuExecutorConfig(kind="process", max_workers=1))
+        try:
+            with executor.use():
+                text = await run_cpu(html_to_text, HTML)
+        finally:
+            executor.shutdown()
+
+        self.assertEqual(text, "Fish & chips")
+
+    async def test_page_derivations_in_the_pool(self):
+        with self.executor.use():
+            page_response = await abuild_page_response("https://example.com", HTML, derive=True)
+
+        self.assertEqual(page_response.text, "Fish & chips")
+        self.assertEqual(page_response.underived(), set())
+        self.assertIn("Fish & chips", page_response.clean_html)
+
+    async def test_css_extraction_in_the_pool(self):
+        strategy = CSSExtractionStrategy(ExtractionMapping(extraction_configs={"title": FieldConfig(selector=".title")}))
+
+        with self.executor.use():
+            page_response = await strategy.aextract(PageResponse(html=HTML))
+
+        self.assertEqual(page_response.extracted_data, {"title": "Fish & chips"})
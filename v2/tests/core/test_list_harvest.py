@@ -0,0 +1,89 @@
+# tests/core/test_list_harvest.py
+from unittest import IsolatedAsyncioTestCase, TestCase
+from unittest.mock import AsyncMock, MagicMock
+
+from selectolax.parser import HTMLParser
+
+from v2.core.list_harvest import HARVEST_COLLECT_SCRIPT, HARVEST_START_SCRIPT, ListHarvester, merge_harvested
+from v2.core.page_output import PageResponse
+
+SELECTOR = "li[data-job-id]"
+
+
+def card(job_id, title=""):
+    return f'<li data-job-id="{job_id}">{title}</li>'
+
+
+def page_html(*cards):
+    return f"<html><body><ul>{''.join(cards)}</ul></body></html>"
+
+
+def card_texts(raw_html):
+    return [(node.attributes["data-job-id"], node.text()) for node in HTMLParser(raw_html).css(SELECTOR)]
+
+
+class TestMergeHarvested(TestCase):
+
+    def test_emptied_cards_are_filled_in(self):
+        merged = merge_harvested(
+            page_html(card(1), card(2, "Data Engineer")),
+            SELECTOR, "data-job-id",
+            {"1": card(1, "Data Scientist"), "2": card(2)},
+        )
+
+        self.assertEqual(card_texts(merged), [("1", "Data Scientist"), ("2", "Data Engineer")])
+
+    def test_removed_cards_are_put_back_in_order(self):
+        merged = merge_harvested(
+            page_html(card(3, "C")),
+            SELECTOR, "data-job-id",
+            {str(i): card(i, title) for i, title in [(1, "A"), (2, "B"), (3, "C"), (4, "D"), (5, "E")]},
+        )
+
+        self.assertEqual(card_texts(merged), [("1", "A"), ("2", "B"), ("3", "C"), ("4", "D"), ("5", "E")])
+
+    def test_html_without_cards_is_left_as_is(self):
+        raw_html = "<html><body><p>No results</p></body></html>"
+
+        self.assertEqual(merge_harvested(raw_html, SELECTOR, "data-job-id", {"1": card(1, "A")}), raw_html)
+
+
+class TestListHarvester(IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.page = MagicMock(url="https://test.com/jobs/search/")
+        self.page.is_closed.return_value = False
+        self.page.evaluate = AsyncMock(side_effect=self.evaluate)
+        self.harvested = [{"key": "1", "html": card(1, "A")}, {"key": "2", "html": card(2, "B")}]
+
+    async def evaluate(self, script, *args):
+        return self.harvested if script == HARVEST_COLLECT_SCRIPT else None
+
+    async def test_cards_seen_while_scrolling_are_merged(self):
+        async with ListHarvester(self.page, SELECTOR, "data-job-id") as harvester:
+            page_response = await harvester.merge(PageResponse(url=self.page.url, html=page_html(card(2, "B"))))
+
+        self.assertEqual(card_texts(page_response.html), [("1", "A"), ("2", "B")])
+        self.assertEqual(self.page.evaluate.await_args_list[0].args, (HARVEST_START_SCRIPT, {"selector": SELECTOR, "key": "data-job-id"}))
+        self.assertEqual(self.page.evaluate.await_count, 2)  # started and collected once
+
+    async def test_observer_is_stopped_without_collecting(self):
+        async with ListHarvester(self.page, SELECTOR, "data-job-id"):
+            pass
+
+        self.assertEqual(self.page.evaluate.await_args.args, (HARVEST_COLLECT_SCRIPT,))
+
+    async def test_nothing_is_observed_without_selector(self):
+        html = page_html(card(1))
+
+        async with ListHarvester(self.page) as harvester:
+            page_response = await harvester.merge(PageResponse(url=self.page.url, html=html))
+
+        self.page.evaluate.assert_not_awaited()
+        self.assertEqual(page_response.html, html)
+
+    async def test_harvest_lost_to_a_navigation(self):
+        self.harvested = None
+
+        async with ListHarvester(self.page, SELECTOR, "data-job-id") as harvester:
+            self.assertEqual(await harvester.collect(), {})
@@ -0,0 +1,103 @@
+# tests/core/test_page_archive.py
+import tempfile
+from pathlib import Path
+from unittest import IsolatedAsyncioTestCase, TestCase
+
+from v2.core import page_archive
+from v2.core.page_archive import PageArchive
+from v2.core.page_output import build_page_response
+
+
+def make_response(n: int):
+    html = f"<html><body><h1>Job {n}</h1><p>{'description ' * 200}</p></body></html>"
+    return build_page_response(f"https://www.linkedin.com/jobs/view/{n}/", html, text=f"Job {n}")
+
+
+class TestPageArchive(TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / "pages" / "job_pages.pages"
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_random_access_and_streaming(self):
+        with PageArchive(self.path, codec="gzip") as archive:
+            for n in range(5):
+                archive.append(make_response(n))
+
+        with PageArchive(self.path) as archive:
+            self.assertEqual(len(archive), 5)
+            page = archive.get("https://www.linkedin.com/jobs/view/3/")
+            self.assertEqual(page.text, "Job 3")
+            self.assertIn("Job 3\n=====", page.markdown)
+            self.assertIsNone(archive.get("https://www.linkedin.com/jobs/view/9/"))
+            self.assertEqual([page.text for page in archive], [f"Job {n}" for n in range(5)])
+
+    def test_records_are_compressed(self):
+        with PageArchive(self.path, codec="gzip") as archive:
+            response = make_response(1)
+            archive.append(response)
+
+        self.assertLess(self.path.stat().st_size, len(response.html) / 4)
+
+    def test_underived_fields_are_not_stored(self):
+        response = make_response(1)
+        response.markdown = "kept"
+        with PageArchive(self.path, codec="gzip") as archive:
+            archive.append(response)
+            archive.append(make_response(2))
+
+            self.assertEqual(archive.get(response.url).markdown, "kept")
+            self.assertIn("Job 2\n=====", archive.get("https://www.linkedin.com/jobs/view/2/").markdown)
+
+    def test_appending_a_url_again_replaces_it(self):
+        with PageArchive(self.path, codec="gzip") as archive:
+            archive.append(make_response(1))
+            archive.append(make_response(2))
+            archive.append(make_response(1).model_copy(update={"text": "updated"}))
+
+            self.assertEqual(archive.urls(), ["https://www.linkedin.com/jobs/view/2/", "https://www.linkedin.com/jobs/view/1/"])
+            self.assertEqual(archive.get("https://www.linkedin.com/jobs/view/1/").text, "updated")
+
+    def test_recovers_records_missing_from_the_index(self):
+        with PageArchive(self.path, codec="gzip") as archive:
+            for n in range(3):
+                archive.append(make_response(n))
+        index_path = self.path.with_name(self.path.name + page_archive.INDEX_SUFFIX)
+        lines = index_path.read_text().splitlines(keepends=True)
+        index_path.write_text("".join(lines[:1]))
+        with open(self.path, "ab") as data:
+            data.write(page_archive.MAGIC + b"\x01\x00")  # a torn record
+
+        with PageArchive(self.path) as archive:
+            self.assertEqual(len(archive), 3)
+            self.assertEqual(archive.get("https://www.linkedin.com/jobs/view/2/").text, "Job 2")
+            archive.append(make_response(3))
+
+        with PageArchive(self.path) as archive:
+            self.assertEqual([page.text for page in archive], [f"Job {n}" for n in range(4)])
+
+    def test_gzip_unless_zstd_is_asked_for(self):
+        with PageArchive(self.path) as archive:
+            archive.append(make_response(1))
+
+        self.assertEqual(archive.codec, "gzip")
+        self.assertEqual(page_archive.HEADER.unpack_from(self.path.read_bytes())[1], page_archive.CODECS["gzip"])
+
+    def test_zstd_needs_zstandard(self):
+        if page_archive.zstandard is not None:
+            self.skipTest("zstandard is installed")
+        with self.assertRaises(ImportError):
+            PageArchive(self.path, codec="zstd")
+
+
+class TestPageArchiveAsync(IsolatedAsyncioTestCase):
+
+    async def test_aappend(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            with PageArchive(Path(tmp) / "pages.pages", codec="gzip") as archive:
+                await archive.aappend(make_response(1))
+
+                self.assertIn("https://www.linkedin.com/jobs/view/1/", archive)
@@ -3,12 +3,12 @@ import asyncio
 import os
 from pathlib import Path
 from tempfile import NamedTemporaryFile
-from unittest import TestCase
+from unittest import IsolatedAsyncioTestCase, TestCase
 from unittest.mock import AsyncMock, patch
 
 import pytest
 
-from v2.core.page_output import PageResponse, parse_page_response
+from v2.core.page_output import CaptureProfile, PageResponse, build_page_response, parse_page_response
 
 
 class TestPageResponse(TestCase):
@@ -81,3 +81,60 @@ class TestParsePageResponse(TestCase):
         self.assertEqual(page_response.clean_html2, "<h1>Test Content</h1>")
         
         self.mock_page.screenshot.assert_called_once()
+
+
+class TestLazyDerivedFields(TestCase):
+
+    def test_derived_fields_are_computed_once_on_access(self):
+        page_response = PageResponse(url="https://example.com", html="<p>Fish &amp; chips</p>")
+        self.assertEqual(page_response.underived(), {"markdown", "clean_html", "clean_html2"})
+
+        with patch("v2.core.page_output.markdownify.markdownify", return_value="Fish & chips") as mock_markdownify:
+            self.assertEqual(page_response.markdown, "Fish & chips")
+            self.assertEqual(page_response.markdown, "Fish & chips")
+
+        mock_markdownify.assert_called_once()
+        self.assertEqual(page_response.underived(), {"clean_html", "clean_html2"})
+        self.assertEqual(page_response.clean_html, "<p>Fish & chips</p>")
+
+    def test_given_values_survive_a_round_trip(self):
+        page_response = PageResponse(url="https://example.com", html="<p>a</p>", markdown="given")
+
+        restored = PageResponse.model_validate_json(page_response.model_dump_json())
+
+        self.assertEqual(restored.markdown, "given")
+        self.assertEqual(restored.clean_html2, page_response.clean_html2)
+
+    def test_profile_limits_the_representations(self):
+        profile = CaptureProfile(text=False, markdown=False)
+
+        page_response = build_page_response("https://example.com", "<html><body><p>hi</p></body></html>", profile=profile)
+
+        self.assertIsNone(page_response.text)
+        self.assertIsNone(page_response.markdown)
+        self.assertIsNotNone(page_response.clean_html)
+
+    def test_release_drops_the_payloads(self):
+        page_response = build_page_response("https://example.com", "<html><body><p>hi</p></body></html>")
+        page_response.extracted_data = {"greeting": "hi"}
+
+        page_response.release()
+
+        self.assertIsNone(page_response.html)
+        self.assertIsNone(page_response.text)
+        self.assertIsNone(page_response.markdown)
+        self.assertEqual(page_response.extracted_data, {"greeting": "hi"})
+
+
+class TestCaptureProfile(IsolatedAsyncioTestCase):
+
+    async def test_skipped_representations_are_not_read(self):
+        page = AsyncMock(url="https://example.com")
+        page.content = AsyncMock(return_value="<html><body><h1>Job</h1></body></html>")
+
+        page_response = await parse_page_response(page, profile=CaptureProfile(screenshot=False, text=False))
+
+        page.screenshot.assert_not_called()
+        page.inner_text.assert_not_called()
+        self.assertIsNone(page_response.screenshot_path)
+        self.assertIn("Job", page_response.markdown)
@@ -0,0 +1,142 @@
+# tests/core/test_screenshots.py
+import os
+import tempfile
+import time
+from pathlib import Path
+from unittest import IsolatedAsyncioTestCase, TestCase
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from pydantic import ValidationError
+
+from v2.core.screenshots import ScreenshotPolicy, ScreenshotStore
+from v2.scraper.scraper_engine import ScraperEngine
+
+
+def make_page(*images):
+    page = MagicMock(url="https://example.com/jobs/view/1", is_closed=MagicMock(return_value=False))
+    page.screenshot = AsyncMock(side_effect=list(images))
+    return page
+
+
+class TestScreenshotPolicy(TestCase):
+
+    def test_needed_only_for_image_strategies(self):
+        policy = ScreenshotPolicy()
+
+        self.assertTrue(policy.wants(needs_image=True))
+        self.assertFalse(policy.wants(needs_image=False))
+        self.assertTrue(ScreenshotPolicy(when="always").wants(needs_image=False))
+        self.assertFalse(ScreenshotPolicy(when="never").wants(needs_image=True))
+
+    def test_clip_area_needs_a_clip(self):
+        with self.assertRaises(ValidationError):
+            ScreenshotPolicy(area="clip")
+
+    def test_screenshot_options(self):
+        store = ScreenshotStore(ScreenshotPolicy(area="clip", clip={"x": 0, "y": 0, "width": 800, "height": 600}, quality=60))
+
+        self.assertEqual(
+            store._screenshot_options(),
+            {"type": "jpeg", "quality": 60, "clip": {"x": 0, "y": 0, "width": 800, "height": 600}},
+        )
+        self.assertEqual(ScreenshotStore(ScreenshotPolicy(format="png"))._screenshot_options(), {"type": "png", "full_page": True})
+
+    def test_webp_without_pillow(self):
+        with patch.dict("sys.modules", {"PIL": None}):
+            with self.assertRaises(ImportError):
+                ScreenshotStore(ScreenshotPolicy(format="webp"))
+
+
+class TestScreenshotStore(IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.directory = Path(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    async def test_identical_images_are_stored_once(self):
+        store = ScreenshotStore(ScreenshotPolicy(directory=self.directory))
+        page = make_page(b"same", b"same", b"other")
+
+        first = await store.capture(page)
+        second = await store.capture(page)
+        third = await store.capture(page)
+
+        self.assertEqual(first, second)
+        self.assertNotEqual(first, third)
+        self.assertTrue(first.endswith(".jpeg"))
+        self.assertEqual(len(list(self.directory.iterdir())), 2)
+
+    async def test_oldest_screenshots_are_pruned(self):
+        old = self.directory / f"{'0' * 32}.jpeg"
+        old.write_bytes(b"old")
+        os.utime(old, (time.time() - 60, time.time() - 60))
+        store = ScreenshotStore(ScreenshotPolicy(directory=self.directory, max_files=2))
+
+        await store.capture(make_page(b"a"))
+        await store.capture(make_page(b"b"))
+
+        self.assertFalse(old.exists())
+        self.assertEqual(len(list(self.directory.iterdir())), 2)
+
+    async def test_only_content_hash_named_screenshots_are_pruned(self):
+        saved = self.directory / "job-1.jpeg"
+        saved.write_bytes(b"saved by an earlier version")
+        os.utime(saved, (time.time() - 60, time.time() - 60))
+        store = ScreenshotStore(ScreenshotPolicy(directory=self.directory, max_bytes=2))
+
+        paths = [await store.capture(make_page(image)) for image in (b"a", b"b", b"c")]
+
+        self.assertTrue(saved.exists())
+        self.assertEqual([Path(path).exists() for path in paths], [False, True, True])
+        self.assertEqual(store._bytes, 2)
+
+    async def test_screenshots_are_kept_by_default(self):
+        store = ScreenshotStore(ScreenshotPolicy(directory=self.directory))
+
+        for image in (b"a", b"b", b"c"):
+            await store.capture(make_page(image))
+
+        self.assertEqual(len(list(self.directory.iterdir())), 3)
+        self.assertIsNone(store._files)
+
+    async def test_failed_screenshot_returns_none(self):
+        page = make_page(Exception("Target closed"))
+
+        self.assertIsNone(await ScreenshotStore(ScreenshotPolicy(directory=self.directory)).capture(page))
+
+
+class TestEngineScreenshots(IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.platform = MagicMock(rate_limit=None, rate_burst=1, min_delay=0.0, blocked_url_patterns=[], login_wall_pattern=None)
+        self.platform.get_page_object_from_url.return_value = None
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    async def test_failed_page_is_screenshotted(self):
+        engine = ScraperEngine(
+            self.platform, screenshot_policy=ScreenshotPolicy(when="never", on_failure=True, directory=self.tmp.name)
+        )
+        page = make_page(b"failed page")
+        page.goto = AsyncMock(side_effect=Exception("net::ERR_CONNECTION_RESET"))
+
+        with self.assertRaises(Exception):
+            await engine._process_url(page, "https://example.com/jobs/view/1")
+
+        page.screenshot.assert_called_once()
+        self.assertEqual(len(os.listdir(self.tmp.name)), 1)
+
+    def test_screenshot_only_when_the_strategy_needs_it(self):
+        engine = ScraperEngine(self.platform)
+        css_page = MagicMock(capture_profile=None)
+        css_page.extraction_strategy.needs_image = False
+        image_page = MagicMock(capture_profile=None)
+        image_page.extraction_strategy.needs_image = True
+
+        self.assertFalse(engine._page_profile(css_page, None).screenshot)
+        self.assertTrue(engine._page_profile(image_page, None).screenshot)
@@ -0,0 +1,117 @@
+# tests/infrastructure/test_timing.py
+import asyncio
+import json
+import tempfile
+from unittest import IsolatedAsyncioTestCase, TestCase
+from unittest.mock import AsyncMock, MagicMock
+
+from v2.core.extraction.css_extraction import CSSExtractionStrategy, ExtractionMapping, FieldConfig
+from v2.core.page_output import PageResponse
+from v2.infrastructure.metrics.timing import Histogram, StageTimings, span
+from v2.platforms.base_platform import PageBase
+from v2.scraper.scraper_engine import ScraperEngine
+
+
+class TestHistogram(TestCase):
+
+    def test_buckets_are_cumulative(self):
+        histogram = Histogram(buckets=(0.1, 1.0))
+        for seconds in (0.05, 0.5, 0.7, 3.0):
+            histogram.observe(seconds)
+
+        self.assertEqual(histogram.cumulative(), [(0.1, 1), (1.0, 3), (float("inf"), 4)])
+        self.assertEqual(histogram.count, 4)
+        self.assertAlmostEqual(histogram.sum, 4.25)
+
+    def test_quantiles_stay_within_observed_range(self):
+        histogram = Histogram(buckets=(0.1, 1.0))
+        for _ in range(10):
+            histogram.observe(0.5)
+
+        self.assertEqual(histogram.quantile(0.5), 0.5)
+        self.assertEqual(histogram.quantile(0.95), 0.5)
+        self.assertIsNone(Histogram().quantile(0.5))
+
+
+class TestStageTimings(TestCase):
+
+    def test_span_outside_a_trace_records_nothing(self):
+        timings = StageTimings()
+        with span("navigate"):
+            pass
+
+        self.assertEqual(timings.to_dict(), {})
+
+    def test_spans_record_per_page_type_and_url(self):
+        timings = StageTimings()
+        with timings.trace("JobPage") as stages:
+            with span("navigate"):
+                pass
+            with span("navigate"):
+                pass
+        with timings.trace("SearchPage"):
+            with span("navigate"):
+                pass
+
+        exported = json.loads(timings.to_json())
+        self.assertEqual(exported["JobPage"]["navigate"]["count"], 2)
+        self.assertEqual(exported["SearchPage"]["navigate"]["count"], 1)
+        self.assertEqual(list(stages), ["navigate"])
+
+    def test_prometheus_format(self):
+        timings = StageTimings(buckets=(1.0,))
+        timings.observe("JobPage", "extract", 0.5)
+
+        text = timings.to_prometheus()
+
+        self.assertIn("# TYPE scraper_stage_duration_seconds histogram", text)
+        self.assertIn('scraper_stage_duration_seconds_bucket{page_type="JobPage",stage="extract",le="1.0"} 1', text)
+        self.assertIn('scraper_stage_duration_seconds_bucket{page_type="JobPage",stage="extract",le="+Inf"} 1', text)
+        self.assertIn('scraper_stage_duration_seconds_count{page_type="JobPage",stage="extract"} 1', text)
+
+    def test_strategy_spans(self):
+        timings = StageTimings()
+        strategy = CSSExtractionStrategy(ExtractionMapping(extraction_configs={"title": FieldConfig(selector="h1")}))
+        with timings.trace("JobPage") as stages:
+            strategy.extract(PageResponse(html="<h1>Data Scientist</h1>"))
+
+        self.assertEqual(set(stages), {"parse", "select"})
+
+
+class JobPage(PageBase):
+
+    async def page_action(self, page):
+        await asyncio.sleep(0)
+
+
+class TestEngineTimings(IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.platform = MagicMock(rate_limit=None, rate_burst=1, min_delay=0.0, blocked_url_patterns=[], login_wall_pattern=None)
+        self.platform.get_page_object_from_url.return_value = JobPage()
+        self.engine = ScraperEngine(platform=self.platform)
+
+    async def test_process_and_extract_are_timed(self):
+        page = MagicMock(url="https://x.com/jobs/1")
+        page.goto = AsyncMock(return_value=MagicMock(status=200))
+        page.screenshot = AsyncMock()
+        page.content = AsyncMock(return_value="<html><body><h1>Job</h1></body></html>")
+        page.inner_text = AsyncMock(return_value="Job")
+
+        results = await self.engine._process_url(page, "https://x.com/jobs/1")
+        await self.engine._extract_single(results[0])
+
+        stages = set(results[0].timings)
+        self.assertTrue({"navigate", "ready", "page_action", "content", "inner_text", "extract"} <= stages)
+        self.assertNotIn("markdownify", stages)  # derived lazily, outside of the url's trace
+        metrics = self.engine.timing_metrics()
+        self.assertEqual(metrics["JobPage"]["navigate"]["count"], 1)
+
+    def test_export_format_follows_the_suffix(self):
+        self.engine.timings.observe("JobPage", "navigate", 0.2)
+        with tempfile.TemporaryDirectory() as tmp:
+            prometheus = self.engine.export_timings(f"{tmp}/timings.prom")
+            as_json = self.engine.export_timings(f"{tmp}/timings.json")
+
+            self.assertIn("_bucket{", prometheus.read_text())
+            self.assertIn("JobPage", json.loads(as_json.read_text()))
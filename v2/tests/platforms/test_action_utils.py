@@ -1,17 +1,29 @@
 # tests/platforms/test_action_utils.py
 import asyncio
-from unittest import TestCase
-from unittest.mock import AsyncMock, patch
+import json
+import shutil
+import subprocess
+from unittest import skipUnless
+from unittest import IsolatedAsyncioTestCase, TestCase
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from playwright.async_api import TimeoutError
 
+from v2.core.page_output import CaptureProfile
 from v2.platforms.action_utils import (
+    DEFAULT_EXPAND_TEXT,
+    EXPAND_SCRIPT,
+    SCROLL_SCRIPT,
     expand_all_buttons,
     expand_buttons_by_selector,
+    expand_in_page,
+    rolldown_next_button,
     scroll_container,
+    scroll_in_page,
     scroll_to,
     scroll_to_element,
+    wait_for_selectors,
 )
 
 class TestActionUtils(TestCase):
@@ -221,3 +233,202 @@ class TestActionUtils(TestCase):
          mock_page = AsyncMock()
          with self.assertRaises(ValueError):
             await scroll_to_element(mock_page)
+
+
+class TestWaitForSelectors(IsolatedAsyncioTestCase):
+
+    async def test_waits_for_all_selectors_against_one_deadline(self):
+        page = MagicMock(url="https://x.com")
+        page.wait_for_selector = AsyncMock()
+
+        ready = await wait_for_selectors(page, ["h1", "div.jobs", ""], timeout=2.5)
+
+        self.assertTrue(ready)
+        self.assertEqual(page.wait_for_selector.call_count, 2)
+        page.wait_for_selector.assert_any_call("div.jobs", state="attached", timeout=2500)
+
+    async def test_missing_selector_is_not_ready(self):
+        page = MagicMock(url="https://x.com")
+        page.wait_for_selector = AsyncMock(side_effect=[None, TimeoutError("Timeout 10ms exceeded")])
+
+        self.assertFalse(await wait_for_selectors(page, ["h1", "div.jobs"], timeout=0.01))
+
+    async def test_nothing_to_wait_for(self):
+        page = MagicMock()
+
+        self.assertTrue(await wait_for_selectors(page, []))
+        page.wait_for_selector.assert_not_called()
+
+
+class TestRolldownNextButton(IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.page = MagicMock(url="https://test.com/jobs/search/")
+        self.page.wait_for_url = AsyncMock()
+        self.button = MagicMock(is_visible=AsyncMock(return_value=True), click=AsyncMock())
+        self.action = AsyncMock()
+
+    @patch("v2.platforms.action_utils.parse_page_response", new_callable=AsyncMock)
+    async def test_stops_at_max_depth(self, parse_page_response):
+        next_button = AsyncMock(return_value=self.button)
+
+        content = await rolldown_next_button(self.page, next_button, self.action, max_depth=3)
+
+        self.assertEqual(len(content), 3)
+        self.assertEqual(self.button.click.await_count, 2)
+
+    @patch("v2.platforms.action_utils.parse_page_response", new_callable=AsyncMock)
+    async def test_every_click_waits_for_the_throttle(self, parse_page_response):
+        throttle = AsyncMock()
+
+        await rolldown_next_button(self.page, AsyncMock(return_value=self.button), self.action, max_depth=3, throttle=throttle)
+
+        self.assertEqual(throttle.await_count, self.button.click.await_count)
+        throttle.assert_awaited_with("https://test.com/jobs/search/")
+
+    @patch("v2.platforms.action_utils.parse_page_response", new_callable=AsyncMock)
+    async def test_pages_are_parsed_with_the_screenshot_store(self, parse_page_response):
+        screenshots = MagicMock()
+        profile = CaptureProfile(screenshot=True)
+
+        await rolldown_next_button(
+            self.page, AsyncMock(return_value=self.button), self.action, max_depth=2,
+            screenshots=screenshots, capture_profile=profile,
+        )
+
+        self.assertEqual(parse_page_response.await_count, 2)
+        parse_page_response.assert_awaited_with(self.page, profile=profile, screenshots=screenshots)
+
+    @patch("v2.platforms.action_utils.parse_page_response", new_callable=AsyncMock)
+    async def test_deep_pagination_does_not_grow_the_stack(self, parse_page_response):
+        buttons = [self.button] * 1999 + [None]
+
+        content = await rolldown_next_button(self.page, AsyncMock(side_effect=buttons), self.action, max_depth=-1)
+
+        self.assertEqual(len(content), 2000)
+
+    @patch("v2.platforms.action_utils.parse_page_response", new_callable=AsyncMock)
+    async def test_error_keeps_the_page_once(self, parse_page_response):
+        self.button.click.side_effect = RuntimeError("detached")
+
+        content = await rolldown_next_button(self.page, AsyncMock(return_value=self.button), self.action, max_depth=3)
+
+        self.assertEqual(len(content), 1)
+
+
+class TestScrollInPage(IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.page = MagicMock()
+        self.page.wait_for_selector = AsyncMock(return_value=MagicMock())
+
+    def stats(self, reason, steps=3):
+        self.page.evaluate = AsyncMock(return_value={"reason": reason, "steps": steps, "height": 1200, "elapsed_ms": 42.0})
+
+    async def test_one_round_trip_with_the_selectors_as_arguments(self):
+        self.stats("end")
+
+        stats = await scroll_in_page(self.page, container_selector='div[data-id="a\'b"]', step=200)
+
+        self.page.evaluate.assert_awaited_once()
+        script, args = self.page.evaluate.await_args.args
+        self.assertNotIn("data-id", script)
+        self.assertEqual(args["container"], 'div[data-id="a\'b"]')
+        self.assertIsNone(args["target"])
+        self.assertEqual(args["step"], 200)
+        self.assertEqual((stats.reason, stats.steps, stats.height), ("end", 3, 1200))
+
+    async def test_scroll_container_returns_the_stats(self):
+        self.stats("end")
+
+        stats = await scroll_container(self.page, container_selector="#list", scroll_step=100)
+
+        self.assertEqual(stats.steps, 3)
+        self.assertEqual(self.page.evaluate.await_args.args[1]["container"], "#list")
+
+    async def test_scroll_to_element_targets_the_selector(self):
+        self.stats("target")
+
+        stats = await scroll_to_element(self.page, selector="#footer", max_attempts=10)
+
+        args = self.page.evaluate.await_args.args[1]
+        self.assertEqual((args["target"], args["maxSteps"], args["container"]), ("#footer", 10, None))
+        self.assertEqual(stats.reason, "target")
+
+    async def test_scroll_to_element_raises_when_the_element_never_shows(self):
+        self.stats("end")
+
+        with self.assertRaises(ValueError):
+            await scroll_to_element(self.page, selector="#footer")
+
+    async def test_scroll_to_end_stops_at_max_attempts(self):
+        self.stats("max_steps", steps=5)
+
+        stats = await scroll_to_element(self.page, scroll_to_end=True, max_attempts=5)
+
+        self.assertIsNone(self.page.evaluate.await_args.args[1]["target"])
+        self.assertEqual(stats.reason, "max_steps")
+
+
+# a document of `height` pixels growing by `growth` pixels `lazyMs` after its bottom is first reached
+GROWING_PAGE = """
+const root = {
+    scrollTop: 0, clientHeight: 1000, scrollHeight: %(height)d, grown: false,
+    scrollBy(x, y) {
+        this.scrollTop = Math.min(this.scrollTop + y, this.scrollHeight - this.clientHeight);
+        if (!this.grown && this.scrollTop + this.clientHeight >= this.scrollHeight) {
+            this.grown = true;
+            setTimeout(() => { this.scrollHeight += %(growth)d; }, %(lazyMs)d);
+        }
+    },
+};
+globalThis.document = { scrollingElement: root, querySelector: () => null };
+(%(script)s)(%(args)s).then((stats) => console.log(JSON.stringify(stats)));
+"""
+
+
+@skipUnless(shutil.which("node"), "runs the in-page script with node")
+class TestScrollScript(TestCase):
+
+    def run_script(self, **args):
+        source = GROWING_PAGE % {
+            "height": 6000, "growth": 2000, "lazyMs": 100, "script": SCROLL_SCRIPT,
+            "args": json.dumps({"container": None, "target": None, "maxSteps": None, "deadlineMs": 10_000, **args}),
+        }
+        result = subprocess.run(["node", "-e", source], capture_output=True, text=True, timeout=30, check=True)
+        return json.loads(result.stdout)
+
+    def test_waits_for_content_loaded_at_the_bottom(self):
+        # reaching the bottom takes longer than idleMs, the content appended then is still scrolled through
+        stats = self.run_script(step=300, delayMs=50, idleMs=500)
+
+        self.assertEqual(stats["reason"], "end")
+        self.assertEqual(stats["height"], 8000)
+        self.assertGreater(stats["steps"], 20)
+
+
+class TestExpandInPage(IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.page = MagicMock(url="https://test.com/in/someone/")
+        self.page.evaluate = AsyncMock(return_value=4)
+
+    async def test_expands_in_one_round_trip(self):
+        expanded = await expand_in_page(self.page, "button.see-more", idle_ms=100, timeout_ms=1000)
+
+        self.assertEqual(expanded, 4)
+        self.page.evaluate.assert_awaited_once_with(
+            EXPAND_SCRIPT, {"selector": "button.see-more", "text": None, "idleMs": 100, "timeoutMs": 1000}
+        )
+        self.page.wait_for_timeout.assert_not_called()  # the page settles inside the same evaluate
+
+    async def test_expand_all_buttons_matches_the_text(self):
+        self.assertEqual(await expand_all_buttons(self.page), 4)
+
+        args = self.page.evaluate.await_args.args[1]
+        self.assertEqual((args["selector"], args["text"]), ("button", DEFAULT_EXPAND_TEXT))
+
+    async def test_expand_buttons_by_selector_reports_failures_as_none_expanded(self):
+        self.page.evaluate.side_effect = RuntimeError("Execution context was destroyed")
+
+        self.assertEqual(await expand_buttons_by_selector(self.page, "#test"), 0)
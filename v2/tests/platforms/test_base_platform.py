@@ -8,6 +8,7 @@ import pytest
 from pydantic import BaseModel
 
 from v2.core.extraction import ExtractionStrategyBase
+from v2.core.extraction.css_extraction import CSSExtractionStrategy, ExtractionMapping, FieldConfig
 from v2.platforms.base_platform import PageBase, WebsitePlatform
 
 
@@ -70,6 +71,26 @@ class TestPageBase(TestCase):
          self.assertFalse(page.url_match('test'))
 
 
+class TestReadiness(TestCase):
+    def test_default_is_any_top_level_field_of_the_mapping(self):
+        class JobPage(MockPage):
+            extraction_strategy = CSSExtractionStrategy(ExtractionMapping(extraction_configs={
+                "title": FieldConfig(selector="h1"),
+                "cards": FieldConfig(selector="li.card", multiple=True, sub_fields={"link": FieldConfig(selector="a")}),
+            }))
+
+        self.assertEqual(JobPage().readiness_selectors(), ["h1, li.card"])
+
+    def test_declared_selectors_win(self):
+        class JobPage(MockPage):
+            ready_selectors = ["h1", "div.description"]
+
+        self.assertEqual(JobPage().readiness_selectors(), ["h1", "div.description"])
+
+    def test_no_mapping_no_wait(self):
+        self.assertEqual(MockPage().readiness_selectors(), [])
+
+
 class TestWebsitePlatform(TestCase):
     
     def setUp(self):
@@ -105,3 +126,51 @@ class TestWebsitePlatform(TestCase):
           mock_page = AsyncMock()
           result = await self.platform.after_search_action(mock_page, test='value')
           self.assertIsNone(result)
+
+
+class PaginatedPlatform(MockWebsitePlatform):
+    pagination_param = "start"
+    pagination_step = 25
+    max_result_pages = 3
+
+    async def _has_next_page(self, page):
+        return None
+
+
+class TestResultPageUrls(TestCase):
+
+    def setUp(self):
+        self.platform = PaginatedPlatform()
+
+    def test_offsets_the_pagination_param(self):
+        urls = self.platform.result_page_urls("https://test.com/jobs/search/?keywords=python&f_WT=2", max_depth=3)
+
+        self.assertEqual(urls, [
+            "https://test.com/jobs/search/?keywords=python&f_WT=2&start=25",
+            "https://test.com/jobs/search/?keywords=python&f_WT=2&start=50",
+        ])
+
+    def test_starts_from_the_current_offset(self):
+        urls = self.platform.result_page_urls("https://test.com/jobs/search/?start=50&keywords=python", max_depth=2)
+
+        self.assertEqual(urls, ["https://test.com/jobs/search/?start=75&keywords=python"])
+
+    def test_unlimited_depth_uses_max_result_pages(self):
+        self.assertEqual(len(self.platform.result_page_urls("https://test.com/jobs/search/", max_depth=-1)), 2)
+
+    def test_bounded_by_the_result_count(self):
+        self.platform.max_result_pages = 40
+
+        self.assertEqual(len(self.platform.result_page_urls("https://test.com/jobs/search/", max_depth=-1, result_count=30)), 1)
+        self.assertEqual(len(self.platform.result_page_urls("https://test.com/jobs/search/", max_depth=10, result_count=25)), 0)
+        self.assertEqual(len(self.platform.result_page_urls("https://test.com/jobs/search/?start=25", max_depth=10, result_count=80)), 2)
+
+    def test_offset_that_is_not_a_number(self):
+        self.assertEqual(self.platform.result_page_urls("https://test.com/jobs/search/?start=abc", max_depth=3), [])
+
+    def test_falls_back_to_clicking(self):
+        self.assertEqual(self.platform.result_page_urls("https://test.com/jobs/search/", max_depth=1), [])
+        self.platform.max_result_pages = None
+        self.assertEqual(self.platform.result_page_urls("https://test.com/jobs/search/", max_depth=-1), [])
+        self.platform.pagination_param = None
+        self.assertEqual(self.platform.result_page_urls("https://test.com/jobs/search/", max_depth=5), [])
@@ -0,0 +1,137 @@
+# tests/scraper/test_browser_session.py
+import time
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from v2.scraper.browser_session import BrowserSession
+
+
+def make_playwright(mock_browser):
+    mock_playwright = AsyncMock()
+    mock_playwright.chromium.launch.return_value = mock_browser
+    return mock_playwright
+
+
+class TestBrowserSession(IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.platform = MagicMock()
+        self.platform.name = 'MockPlatform'
+        self.platform.login_url = 'https://test.login.com'
+        self.platform.login = AsyncMock()
+        self.platform.session_check_url = 'https://test.com/feed'
+        self.platform.is_logged_in = AsyncMock(return_value=False)
+        self.mock_browser = AsyncMock()
+        self.mock_context = AsyncMock()
+        self.mock_browser.new_context.return_value = self.mock_context
+
+    @patch("v2.scraper.browser_session.save_cookies")
+    @patch("v2.scraper.browser_session.read_cookies")
+    @patch("v2.scraper.browser_session.async_playwright")
+    async def test_start_logs_in_once_and_shares_state(self, mock_async_playwright, mock_read_cookies, mock_save_cookies):
+        mock_async_playwright.return_value.start = AsyncMock(return_value=make_playwright(self.mock_browser))
+        mock_read_cookies.return_value = [{"name": "test", "value": "test"}]
+        self.mock_context.storage_state.return_value = {"cookies": [], "origins": []}
+
+        async with BrowserSession(self.platform, credentials={'email': 'a'}, pool_size=3) as session:
+            self.assertTrue(session.is_started)
+            self.assertEqual(self.mock_browser.new_context.call_count, 3)
+            self.mock_browser.new_context.assert_called_with(storage_state={"cookies": [], "origins": []})
+            self.platform.login.assert_called_once()
+            self.mock_context.add_cookies.assert_called_once_with(cookies=[{"name": "test", "value": "test"}])
+
+        mock_save_cookies.assert_called_once()
+        self.mock_browser.close.assert_called_once()
+        self.assertFalse(session.is_started)
+
+    @patch("v2.scraper.browser_session.save_cookies")
+    @patch("v2.scraper.browser_session.read_cookies")
+    @patch("v2.scraper.browser_session.async_playwright")
+    async def test_context_is_returned_to_pool(self, mock_async_playwright, mock_read_cookies, mock_save_cookies):
+        mock_async_playwright.return_value.start = AsyncMock(return_value=make_playwright(self.mock_browser))
+        mock_read_cookies.return_value = None
+
+        async with BrowserSession(self.platform) as session:
+            async with session.context() as context:
+                self.assertIs(context, self.mock_context)
+                self.assertTrue(session._idle.empty())
+            self.assertEqual(session._idle.qsize(), 1)
+
+        self.platform.login.assert_not_called()
+
+    @patch("v2.scraper.browser_session.save_cookies")
+    @patch("v2.scraper.browser_session.read_cookies")
+    @patch("v2.scraper.browser_session.async_playwright")
+    async def test_valid_restored_state_skips_login(self, mock_async_playwright, mock_read_cookies, mock_save_cookies):
+        mock_async_playwright.return_value.start = AsyncMock(return_value=make_playwright(self.mock_browser))
+        saved_state = {"cookies": [{"name": "test", "value": "test"}], "origins": []}
+        mock_read_cookies.return_value = saved_state
+        self.platform.is_logged_in.return_value = True
+        self.mock_context.storage_state.return_value = saved_state
+
+        async with BrowserSession(self.platform, credentials={'email': 'a'}):
+            self.mock_browser.new_context.assert_called_once_with(storage_state=saved_state)
+            self.platform.is_logged_in.assert_awaited_once()
+            self.platform.login.assert_not_called()
+
+        mock_save_cookies.assert_called_once_with(content=saved_state, cookie_file='MockPlatform-cookies.jsonl')
+
+    @patch("v2.scraper.browser_session.save_cookies")
+    @patch("v2.scraper.browser_session.read_cookies")
+    @patch("v2.scraper.browser_session.async_playwright")
+    async def test_unexpired_session_cookie_skips_the_check(self, mock_async_playwright, mock_read_cookies, mock_save_cookies):
+        mock_async_playwright.return_value.start = AsyncMock(return_value=make_playwright(self.mock_browser))
+        self.platform.session_cookie = "li_at"
+        mock_read_cookies.return_value = {"cookies": [{"name": "li_at", "value": "token", "expires": time.time() + 3600}], "origins": []}
+
+        async with BrowserSession(self.platform, credentials={'email': 'a'}):
+            self.mock_context.new_page.assert_not_called()
+            self.platform.is_logged_in.assert_not_called()
+            self.platform.login.assert_not_called()
+
+    @patch("v2.scraper.browser_session.save_cookies")
+    @patch("v2.scraper.browser_session.read_cookies")
+    @patch("v2.scraper.browser_session.async_playwright")
+    async def test_expired_session_cookie_logs_in_without_check(self, mock_async_playwright, mock_read_cookies, mock_save_cookies):
+        mock_async_playwright.return_value.start = AsyncMock(return_value=make_playwright(self.mock_browser))
+        self.platform.session_cookie = "li_at"
+        mock_read_cookies.return_value = [{"name": "li_at", "value": "token", "expires": time.time() - 60}]
+
+        async with BrowserSession(self.platform, credentials={'email': 'a'}):
+            self.platform.is_logged_in.assert_not_called()
+            self.platform.login.assert_called_once()
+
+    @patch("v2.scraper.browser_session.save_cookies")
+    @patch("v2.scraper.browser_session.read_cookies")
+    @patch("v2.scraper.browser_session.async_playwright")
+    async def test_no_saved_state_logs_in_without_check(self, mock_async_playwright, mock_read_cookies, mock_save_cookies):
+        mock_async_playwright.return_value.start = AsyncMock(return_value=make_playwright(self.mock_browser))
+        mock_read_cookies.return_value = None
+
+        async with BrowserSession(self.platform, credentials={'email': 'a'}):
+            self.platform.is_logged_in.assert_not_called()
+            self.platform.login.assert_called_once()
+
+    @patch("v2.scraper.browser_session.save_cookies")
+    @patch("v2.scraper.browser_session.read_cookies")
+    @patch("v2.scraper.browser_session.async_playwright")
+    async def test_session_check_and_login_wait_for_the_scheduler(self, mock_async_playwright, mock_read_cookies, mock_save_cookies):
+        mock_async_playwright.return_value.start = AsyncMock(return_value=make_playwright(self.mock_browser))
+        mock_read_cookies.return_value = {"cookies": [{"name": "test", "value": "test"}], "origins": []}
+        scheduler = MagicMock(wait=AsyncMock())
+
+        async with BrowserSession(self.platform, credentials={'email': 'a'}, scheduler=scheduler):
+            self.assertEqual(
+                [call.args for call in scheduler.wait.await_args_list],
+                [('https://test.com/feed',), ('https://test.login.com',)],
+            )
+
+    async def test_context_requires_started_session(self):
+        session = BrowserSession(self.platform)
+        with self.assertRaises(RuntimeError):
+            async with session.context():
+                pass
+
+    def test_invalid_pool_size(self):
+        with self.assertRaises(ValueError):
+            BrowserSession(self.platform, pool_size=0)
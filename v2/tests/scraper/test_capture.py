@@ -0,0 +1,73 @@
+# tests/scraper/test_capture.py
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from v2.core.page_output import CapturedResponse, PageResponse
+from v2.scraper.capture import ResponseCapture
+from v2.scraper.scraper_engine import ScraperEngine
+
+
+def make_response(url, body=None, resource_type="xhr", status=200):
+    response = MagicMock(url=url, status=status)
+    response.request.resource_type = resource_type
+    response.json = AsyncMock(return_value=body) if body is not None else AsyncMock(side_effect=ValueError("not json"))
+    return response
+
+
+class TestResponseCapture(IsolatedAsyncioTestCase):
+
+    async def test_collects_matching_json_responses(self):
+        page = MagicMock()
+
+        async with ResponseCapture(page, [r"/api/jobs/"]) as capture:
+            handler = page.on.call_args.args[1]
+            handler(make_response("https://x.com/api/jobs/1", {"title": "A"}))
+            handler(make_response("https://x.com/api/other", {"title": "B"}))
+            handler(make_response("https://x.com/api/jobs/2"))  # not JSON
+            handler(make_response("https://x.com/api/jobs/logo.png", {"x": 1}, resource_type="image"))
+            captured = await capture.collect()
+
+        self.assertEqual(captured, [CapturedResponse(url="https://x.com/api/jobs/1", status=200, body={"title": "A"})])
+        page.remove_listener.assert_called_once_with("response", handler)
+
+    async def test_no_patterns_no_listener(self):
+        page = MagicMock()
+
+        async with ResponseCapture(page, []) as capture:
+            self.assertEqual(await capture.collect(), [])
+
+        page.on.assert_not_called()
+
+
+class TestEngineCapture(IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.page_obj = MagicMock(capture_patterns=[r"/api/jobs/"], capture_only=True)
+        self.page_obj.page_action = AsyncMock()
+        self.platform = MagicMock(rate_limit=None, rate_burst=1, min_delay=0.0, blocked_url_patterns=[])
+        self.platform.get_page_object_from_url.return_value = self.page_obj
+        self.engine = ScraperEngine(platform=self.platform)
+
+    async def test_capture_only_skips_the_dom(self):
+        page = MagicMock(url="https://x.com/jobs/view/1")
+
+        async def goto(url, **kwargs):
+            page.on.call_args.args[1](make_response("https://x.com/api/jobs/1", {"title": "A"}))
+            return MagicMock(status=200)
+
+        page.goto = goto
+        with patch("v2.scraper.scraper_engine.parse_page_response") as mock_parse:
+            results = await self.engine._process_url(page, "https://x.com/jobs/view/1")
+
+        mock_parse.assert_not_called()
+        self.assertEqual(results[0].captured[0].body, {"title": "A"})
+
+    async def test_extract_from_captured_skips_the_strategy(self):
+        self.page_obj.parse_captured.return_value = {"title": "A"}
+        self.page_obj.extraction_strategy.aextract = AsyncMock()
+        page_response = PageResponse(url="https://x.com/jobs/view/1", captured=[CapturedResponse(url="u", body={})])
+
+        result = await self.engine._extract_single(page_response)
+
+        self.assertEqual(result.extracted_data, {"title": "A"})
+        self.page_obj.extraction_strategy.aextract.assert_not_called()
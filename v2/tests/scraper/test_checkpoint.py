@@ -0,0 +1,83 @@
+# tests/scraper/test_checkpoint.py
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import MagicMock
+
+from v2.core.page_output import PageResponse
+from v2.scraper.checkpoint import CheckpointStore
+from v2.scraper.scraper_engine import ScraperEngine
+from v2.scraper.scraper_utils import list_to_async_iterator
+
+
+class TestCheckpointStore(IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.temp_dir = TemporaryDirectory()
+        self.path = Path(self.temp_dir.name) / "checkpoints.sqlite3"
+        self.store = CheckpointStore(self.path)
+
+    def tearDown(self):
+        self.store.close()
+        self.temp_dir.cleanup()
+
+    async def test_completed_urls_survive_a_reopen(self):
+        await self.store.asave("run", PageResponse(url="https://a", extracted_data={"title": "A"}))
+        self.store.close()
+
+        self.store = CheckpointStore(self.path)
+
+        self.assertEqual(self.store.completed("run"), {"https://a"})
+        self.assertEqual(self.store.load("run")[0].extracted_data, {"title": "A"})
+        self.assertEqual(self.store.completed("other run"), set())
+
+    def test_pending_keeps_the_url_order(self):
+        self.store.save("run", PageResponse(url="https://b"))
+
+        self.assertEqual(self.store.pending("run", ["https://a", "https://b", "https://c"]), ["https://a", "https://c"])
+
+    def test_load_in_url_order_by_requested_url(self):
+        self.store.save("run", PageResponse(url="https://b"))
+        self.store.save("run", PageResponse(url="https://redirected"), url="https://a")
+
+        loaded = self.store.load("run", ["https://a", "https://b", "https://c"])
+
+        self.assertEqual([r.url for r in loaded], ["https://redirected", "https://b"])
+
+    def test_clear(self):
+        self.store.save("run", PageResponse(url="https://a"))
+        self.store.clear("run")
+
+        self.assertEqual(self.store.load("run"), [])
+
+
+class TestEngineCheckpoint(IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.temp_dir = TemporaryDirectory()
+        self.store = CheckpointStore(Path(self.temp_dir.name) / "checkpoints.sqlite3")
+        self.engine = ScraperEngine(platform=MagicMock(rate_limit=None, rate_burst=1, min_delay=0.0, blocked_url_patterns=[]))
+
+    def tearDown(self):
+        self.store.close()
+        self.temp_dir.cleanup()
+
+    async def test_checkpointed_records_each_item(self):
+        items = list_to_async_iterator([(1, PageResponse(url="https://b")), (0, PageResponse(url="https://a"))])
+
+        passed = [item async for item in self.engine._checkpointed(items, ["https://a", "https://b"], self.store, "run")]
+
+        self.assertEqual(len(passed), 2)
+        self.assertEqual(self.store.completed("run"), {"https://a", "https://b"})
+
+    async def test_completed_run_does_not_open_a_browser(self):
+        self.store.save("run", PageResponse(url="https://a"))
+        self.engine._browser_session = MagicMock(side_effect=AssertionError("browser opened"))
+
+        results = await self.engine.scrap(urls=["https://a"], checkpoint=self.store, run_id="run")
+
+        self.assertEqual([r.url for r in results], ["https://a"])
+
+    async def test_checkpoint_requires_run_id(self):
+        with self.assertRaises(ValueError):
+            await self.engine.scrap(urls=["https://a"], checkpoint=self.store)
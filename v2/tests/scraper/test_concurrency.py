@@ -0,0 +1,79 @@
+# tests/scraper/test_concurrency.py
+import asyncio
+from unittest import IsolatedAsyncioTestCase, TestCase
+
+from v2.scraper.concurrency import AdaptiveLimiter
+
+
+class TestAdaptiveLimiter(TestCase):
+
+    def test_limit_grows_after_healthy_window(self):
+        limiter = AdaptiveLimiter(initial_limit=2, max_limit=4, window=3)
+        for _ in range(3):
+            limiter.record(0.5, status=200)
+
+        self.assertEqual(limiter.limit, 3)
+        self.assertEqual(limiter.history[-1].reason, "healthy window")
+
+    def test_limit_is_capped(self):
+        limiter = AdaptiveLimiter(initial_limit=2, max_limit=2, window=1)
+        for _ in range(5):
+            limiter.record(0.5, status=200)
+
+        self.assertEqual(limiter.limit, 2)
+        self.assertEqual(len(limiter.history), 1)
+
+    def test_throttling_halves_the_limit_once_per_cooldown(self):
+        limiter = AdaptiveLimiter(initial_limit=8, window=3, throttle_cooldown=60)
+        limiter.record(0.5, status=999)
+        limiter.record(0.5, status=429)
+
+        self.assertEqual(limiter.limit, 4)
+        self.assertEqual(limiter.counts["throttled"], 2)
+
+    def test_errors_shrink_the_limit(self):
+        limiter = AdaptiveLimiter(initial_limit=6, window=4, error_threshold=0.2)
+        limiter.record(0.5, status=200)
+        for _ in range(3):
+            limiter.record(5.0, error=True)
+
+        self.assertEqual(limiter.limit, 3)
+
+    def test_slow_window_shrinks_the_limit(self):
+        limiter = AdaptiveLimiter(initial_limit=4, window=2, latency_tolerance=2.0)
+        limiter.record(0.5, status=200)
+        limiter.record(0.5, status=200)
+        limiter.record(3.0, status=200)
+        limiter.record(3.0, status=200)
+
+        self.assertEqual(limiter.limit, 2)
+        self.assertTrue(limiter.history[-1].reason.startswith("latency"))
+
+    def test_metrics(self):
+        limiter = AdaptiveLimiter(initial_limit=3)
+        metrics = limiter.metrics()
+
+        self.assertEqual(metrics["limit"], 3)
+        self.assertEqual(metrics["history"][0]["reason"], "initial")
+
+    def test_invalid_bounds(self):
+        with self.assertRaises(ValueError):
+            AdaptiveLimiter(min_limit=5, max_limit=2)
+
+
+class TestAdaptiveLimiterAsync(IsolatedAsyncioTestCase):
+
+    async def test_in_flight_is_bounded_by_limit(self):
+        limiter = AdaptiveLimiter(initial_limit=2)
+        peak = 0
+
+        async def worker():
+            nonlocal peak
+            async with limiter:
+                peak = max(peak, limiter.in_flight)
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(*(worker() for _ in range(6)))
+
+        self.assertEqual(peak, 2)
+        self.assertEqual(limiter.in_flight, 0)
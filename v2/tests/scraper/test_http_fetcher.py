@@ -0,0 +1,75 @@
+# tests/scraper/test_http_fetcher.py
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+
+from v2.scraper.http_fetcher import HttpFetcher, to_httpx_cookies
+from v2.scraper.retry import PageStatusError
+from v2.scraper.scraper_engine import ScraperEngine
+
+JOB_HTML = "<html><body><h1>Data Scientist</h1><script>var x</script></body></html>"
+
+
+def handler(request: httpx.Request) -> httpx.Response:
+    if request.url.path == "/missing":
+        return httpx.Response(404, text="not found")
+    return httpx.Response(200, text=JOB_HTML, headers={"content-type": "text/html"})
+
+
+class TestHttpFetcher(IsolatedAsyncioTestCase):
+
+    def test_playwright_cookies_are_converted(self):
+        jar = to_httpx_cookies([
+            {"name": "li_at", "value": "token", "domain": ".linkedin.com", "path": "/"},
+            {"value": "no name"},
+        ])
+
+        self.assertEqual(jar.get("li_at", domain=".linkedin.com"), "token")
+        self.assertEqual(len(jar), 1)
+
+    async def test_fetch_requires_start(self):
+        with self.assertRaises(RuntimeError):
+            await HttpFetcher().fetch("https://example.com")
+
+
+class TestEngineBrowserless(IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.page_obj = MagicMock(browserless=True, capture_patterns=[], capture_profile=None)
+        self.platform = MagicMock(rate_limit=None, rate_burst=1, min_delay=0.0, blocked_url_patterns=[], login_wall_pattern=None)
+        self.platform.get_page_object_from_url.return_value = self.page_obj
+        self.engine = ScraperEngine(platform=self.platform)
+
+        self.fetcher = HttpFetcher(cookies=[])
+        await self.fetcher.start()
+        await self.fetcher._client.aclose()
+        self.fetcher._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        self.page_pool = MagicMock()
+
+    async def asyncTearDown(self):
+        await self.fetcher.close()
+
+    async def test_browserless_url_skips_the_page_pool(self):
+        results = await self.engine._process_url_with_semaphore(
+            self.page_pool, "https://example.com/jobs/view/1", max_retries=1, fetcher=self.fetcher
+        )
+
+        self.page_pool.page.assert_not_called()
+        self.assertEqual(results[0].url, "https://example.com/jobs/view/1")
+        self.assertEqual(results[0].text, "Data Scientist")
+        self.assertIn("Data Scientist", results[0].markdown)
+
+    async def test_error_status_raises(self):
+        with self.assertRaises(PageStatusError):
+            await self.engine._fetch_url(self.fetcher, "https://example.com/missing")
+
+    async def test_http_fetcher_only_for_browserless_platforms(self):
+        browser_session = MagicMock(http_fetcher=AsyncMock(return_value=self.fetcher))
+        self.platform.pages = [MagicMock(browserless=False)]
+        self.platform.dummy_page = None
+
+        self.assertIsNone(await self.engine._http_fetcher(browser_session))
+
+        self.platform.pages.append(self.page_obj)
+        self.assertIs(await self.engine._http_fetcher(browser_session), self.fetcher)
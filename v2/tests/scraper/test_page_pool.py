@@ -0,0 +1,82 @@
+# tests/scraper/test_page_pool.py
+import asyncio
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import AsyncMock, MagicMock
+
+from v2.scraper.page_pool import PagePool
+
+
+def make_page():
+    page = AsyncMock()
+    page.is_closed = MagicMock(return_value=False)
+    return page
+
+
+class TestPagePool(IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.mock_context = AsyncMock()
+        self.mock_context.new_page.side_effect = lambda: make_page()
+
+    async def test_page_is_recycled(self):
+        pool = PagePool(self.mock_context, max_pages=2, max_uses=10)
+
+        async with pool.page() as first:
+            pass
+        async with pool.page() as second:
+            pass
+
+        self.assertIs(first, second)
+        self.assertEqual(self.mock_context.new_page.call_count, 1)
+        first.unroute_all.assert_called()
+        first.close.assert_not_called()
+
+    async def test_page_is_replaced_after_max_uses(self):
+        pool = PagePool(self.mock_context, max_pages=1, max_uses=2)
+
+        pages = []
+        for _ in range(3):
+            async with pool.page() as page:
+                pages.append(page)
+
+        self.assertIs(pages[0], pages[1])
+        self.assertIsNot(pages[1], pages[2])
+        pages[0].close.assert_called_once()
+
+    async def test_page_is_discarded_on_error(self):
+        pool = PagePool(self.mock_context)
+
+        with self.assertRaises(RuntimeError):
+            async with pool.page() as page:
+                raise RuntimeError('test error')
+
+        page.close.assert_called_once()
+        self.assertEqual(pool.open_pages, 0)
+
+    async def test_pool_is_bounded(self):
+        pool = PagePool(self.mock_context, max_pages=2)
+        in_use = 0
+        peak = 0
+
+        async def worker():
+            nonlocal in_use, peak
+            async with pool.page():
+                in_use += 1
+                peak = max(peak, in_use)
+                await asyncio.sleep(0.01)
+                in_use -= 1
+
+        await asyncio.gather(*(worker() for _ in range(6)))
+
+        self.assertEqual(peak, 2)
+        self.assertEqual(self.mock_context.new_page.call_count, 2)
+
+    async def test_close(self):
+        pool = PagePool(self.mock_context)
+        async with pool.page() as page:
+            pass
+
+        await pool.close()
+
+        page.close.assert_called_once()
+        self.assertEqual(pool.open_pages, 0)
@@ -0,0 +1,92 @@
+# tests/scraper/test_resource_blocking.py
+from unittest import IsolatedAsyncioTestCase, TestCase
+from unittest.mock import AsyncMock, MagicMock
+
+from v2.scraper.resource_blocking import ESTIMATED_BYTES, BlockingRules, ResourceBlocker
+from v2.scraper.scraper_engine import ScraperEngine
+
+
+class TestBlockingRules(TestCase):
+
+    def test_url_pattern_matches_extensions_and_trackers(self):
+        pattern = BlockingRules(resource_types={"image", "font"}).url_pattern()
+
+        self.assertTrue(pattern.search("https://static.example.com/logo.PNG?v=2"))
+        self.assertTrue(pattern.search("https://example.com/fonts/a.woff2"))
+        self.assertTrue(pattern.search("https://www.google-analytics.com/collect?v=1"))
+        self.assertTrue(pattern.search("https://px.ads.linkedin.com/collect"))
+        self.assertFalse(pattern.search("https://www.linkedin.com/jobs/view/1"))
+        self.assertFalse(pattern.search("https://example.com/page?image=a.png"))
+        self.assertFalse(pattern.search("https://example.com/app.js"))
+
+    def test_url_regexes_are_included(self):
+        pattern = BlockingRules(resource_types=set(), block_trackers=False, url_regexes=[r"/dms/image/"]).url_pattern()
+
+        self.assertTrue(pattern.search("https://media.licdn.com/dms/image/abc"))
+        self.assertFalse(pattern.search("https://www.google-analytics.com/collect"))
+
+    def test_no_rules_no_pattern(self):
+        self.assertIsNone(BlockingRules(resource_types=set(), block_trackers=False).url_pattern())
+
+
+class TestResourceBlocker(IsolatedAsyncioTestCase):
+
+    async def test_apply_routes_on_the_context(self):
+        context = AsyncMock()
+        blocker = ResourceBlocker(BlockingRules(url_globs=["**/*.pdf"]))
+
+        await blocker.apply(context)
+
+        self.assertEqual([call.args[0] for call in context.route.await_args_list[1:]], ["**/*.pdf", "**/*"])
+
+    async def test_extensionless_image_is_blocked_by_default(self):
+        context = AsyncMock()
+        blocker = ResourceBlocker()
+        await blocker.apply(context)
+        handler = context.route.await_args_list[-1].args[1]
+        url = "https://cdn.example.com/images/profile/123?size=200"
+        self.assertFalse(blocker.rules.url_pattern().search(url))
+
+        route = AsyncMock()
+        await handler(route, MagicMock(resource_type="image", url=url))
+
+        route.abort.assert_awaited_once_with("blockedbyclient")
+        self.assertEqual(blocker.stats["image"], 1)
+
+    async def test_pattern_only_without_strict_resource_types(self):
+        context = AsyncMock()
+
+        await ResourceBlocker(BlockingRules(strict_resource_types=False)).apply(context)
+
+        context.route.assert_awaited_once()
+
+    async def test_strict_resource_types_fall_back_for_other_types(self):
+        context = AsyncMock()
+        blocker = ResourceBlocker(BlockingRules(resource_types={"image"}, strict_resource_types=True))
+        await blocker.apply(context)
+        handler = context.route.await_args_list[-1].args[1]
+
+        image_route, script_route = AsyncMock(), AsyncMock()
+        await handler(image_route, MagicMock(resource_type="image"))
+        await handler(script_route, MagicMock(resource_type="script"))
+
+        image_route.abort.assert_awaited_once()
+        script_route.fallback.assert_awaited_once()
+        script_route.abort.assert_not_called()
+
+    async def test_metrics(self):
+        blocker = ResourceBlocker()
+        route = AsyncMock()
+        await blocker._abort(route, MagicMock(resource_type="image"))
+        await blocker._abort(route, MagicMock(resource_type="image"))
+
+        self.assertEqual(
+            blocker.metrics(),
+            {"blocked": 2, "by_type": {"image": 2}, "estimated_bytes_saved": 2 * ESTIMATED_BYTES["image"]},
+        )
+
+    def test_engine_adds_platform_patterns(self):
+        platform = MagicMock(rate_limit=None, rate_burst=1, min_delay=0.0, blocked_url_patterns=[r"/dms/image/"])
+        engine = ScraperEngine(platform=platform)
+
+        self.assertIn(r"/dms/image/", engine.resource_blocker.rules.url_regexes)
@@ -0,0 +1,135 @@
+# tests/scraper/test_retry.py
+import asyncio
+from unittest import IsolatedAsyncioTestCase, TestCase
+from unittest.mock import AsyncMock, MagicMock
+
+from playwright.async_api import Error as PlaywrightError
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+from v2.core.page_output import PageResponse
+from v2.scraper.retry import (
+    CircuitBreaker,
+    CircuitState,
+    FailureKind,
+    LoginRequiredError,
+    PageStatusError,
+    RetryPolicy,
+    classify_failure,
+)
+from v2.scraper.scraper_engine import ScraperEngine
+
+
+class TestClassifyFailure(TestCase):
+
+    def test_statuses(self):
+        self.assertEqual(classify_failure(PageStatusError("u", 999)), FailureKind.THROTTLED)
+        self.assertEqual(classify_failure(PageStatusError("u", 429)), FailureKind.THROTTLED)
+        self.assertEqual(classify_failure(PageStatusError("u", 404)), FailureKind.NOT_FOUND)
+        self.assertEqual(classify_failure(PageStatusError("u", 503)), FailureKind.SERVER_ERROR)
+        self.assertEqual(classify_failure(PageStatusError("u", 403)), FailureKind.CLIENT_ERROR)
+
+    def test_playwright_errors(self):
+        self.assertEqual(classify_failure(PlaywrightTimeoutError("Timeout 30000ms exceeded")), FailureKind.TIMEOUT)
+        self.assertEqual(classify_failure(PlaywrightError("net::ERR_CONNECTION_RESET at u")), FailureKind.NETWORK)
+        self.assertEqual(classify_failure(PlaywrightError("net::ERR_NAME_NOT_RESOLVED at u")), FailureKind.INVALID_URL)
+        self.assertEqual(classify_failure(PlaywrightError("Target page, context or browser has been closed")), FailureKind.TARGET_CLOSED)
+
+    def test_other_errors(self):
+        self.assertEqual(classify_failure(LoginRequiredError("u", "authwall")), FailureKind.LOGIN_REQUIRED)
+        self.assertEqual(classify_failure(ValueError("boom")), FailureKind.UNKNOWN)
+
+
+class TestRetryPolicy(TestCase):
+
+    def test_permanent_failures_are_not_retried(self):
+        policy = RetryPolicy()
+        self.assertFalse(policy.should_retry(FailureKind.NOT_FOUND))
+        self.assertFalse(policy.should_retry(FailureKind.LOGIN_REQUIRED))
+        self.assertTrue(policy.should_retry(FailureKind.TIMEOUT))
+
+    def test_backoff_is_capped_and_throttling_waits_longer(self):
+        policy = RetryPolicy(base_delay=1.0, max_delay=5.0, multiplier=2.0, throttle_multiplier=4.0)
+        for _ in range(50):
+            self.assertLessEqual(policy.backoff(1, FailureKind.TIMEOUT), 1.0)
+            self.assertLessEqual(policy.backoff(10, FailureKind.TIMEOUT), 5.0)
+        self.assertTrue(any(policy.backoff(1, FailureKind.THROTTLED) > 1.0 for _ in range(50)))
+
+
+class TestCircuitBreaker(IsolatedAsyncioTestCase):
+
+    async def test_opens_on_failure_rate(self):
+        breaker = CircuitBreaker(window=4, min_calls=4, failure_threshold=0.5, cooldown=60)
+        for success in (True, True, False, False):
+            breaker.record(success)
+
+        self.assertEqual(breaker.state, CircuitState.OPEN)
+        self.assertEqual(breaker.metrics()["times_opened"], 1)
+        with self.assertRaises(asyncio.TimeoutError):
+            await asyncio.wait_for(breaker.wait(), 0.05)
+
+    async def test_half_open_lets_one_probe_through(self):
+        breaker = CircuitBreaker(window=2, min_calls=2, cooldown=0.01)
+        breaker.record(False)
+        breaker.record(False)
+        await asyncio.sleep(0.02)
+
+        await breaker.wait()  # the probe
+        self.assertEqual(breaker.state, CircuitState.HALF_OPEN)
+        waiter = asyncio.create_task(breaker.wait())
+        await asyncio.sleep(0)
+        self.assertFalse(waiter.done())
+
+        breaker.record(True)
+        await asyncio.wait_for(waiter, 1)
+        self.assertEqual(breaker.state, CircuitState.CLOSED)
+
+    async def test_failed_probe_opens_again(self):
+        breaker = CircuitBreaker(window=2, min_calls=2, cooldown=0.01)
+        breaker.record(False)
+        breaker.record(False)
+        await asyncio.sleep(0.02)
+        await breaker.wait()
+
+        breaker.record(False)
+        self.assertEqual(breaker.state, CircuitState.OPEN)
+        self.assertEqual(breaker.times_opened, 2)
+
+
+class TestEngineRetries(IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.platform = MagicMock(rate_limit=None, rate_burst=1, min_delay=0.0, login_wall_pattern=None)
+        self.engine = ScraperEngine(
+            platform=self.platform, retry_policy=RetryPolicy(base_delay=0.0)
+        )
+        self.page_pool = MagicMock()
+        self.page_pool.page.return_value.__aenter__ = AsyncMock(return_value=AsyncMock())
+        self.page_pool.page.return_value.__aexit__ = AsyncMock(return_value=False)
+
+    async def test_transient_failure_is_retried(self):
+        self.engine._process_url = AsyncMock(
+            side_effect=[PlaywrightTimeoutError("timeout"), [PageResponse(url="https://test.com")]]
+        )
+
+        results = await self.engine._process_url_with_semaphore(self.page_pool, "https://test.com", max_retries=3)
+
+        self.assertEqual(len(results), 1)
+        self.assertEqual(self.engine._process_url.await_count, 2)
+        self.assertEqual(self.engine.retry_metrics()["outcomes"], {"timeout": 1, "success": 1})
+
+    async def test_permanent_failure_is_not_retried(self):
+        self.engine._process_url = AsyncMock(side_effect=PageStatusError("https://test.com", 404))
+
+        results = await self.engine._process_url_with_semaphore(self.page_pool, "https://test.com", max_retries=3)
+
+        self.assertEqual(results, [])
+        self.assertEqual(self.engine._process_url.await_count, 1)
+        self.assertEqual(self.engine.outcomes["not_found"], 1)
+
+    async def test_navigate_raises_on_login_wall(self):
+        self.platform.login_wall_pattern = r"example\.com/authwall"
+        page = AsyncMock(url="https://example.com/authwall?from=job")
+        page.goto.return_value = MagicMock(status=200)
+
+        with self.assertRaises(LoginRequiredError):
+            await self.engine._navigate(page, "https://example.com/jobs/view/1")
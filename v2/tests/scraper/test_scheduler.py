@@ -0,0 +1,83 @@
+# tests/scraper/test_scheduler.py
+import asyncio
+from unittest import IsolatedAsyncioTestCase, TestCase
+from unittest.mock import MagicMock
+
+from v2.scraper.scheduler import DomainScheduler, TokenBucket, get_domain
+
+
+class TestTokenBucket(TestCase):
+
+    def test_burst_then_rate(self):
+        bucket = TokenBucket(rate=2.0, burst=2)
+        now = bucket._updated
+
+        self.assertEqual(bucket.reserve(now), 0)
+        self.assertEqual(bucket.reserve(now), 0)
+        self.assertAlmostEqual(bucket.reserve(now), 0.5)
+        self.assertAlmostEqual(bucket.reserve(now), 1.0)
+
+    def test_min_delay(self):
+        bucket = TokenBucket(rate=None, min_delay=0.3)
+        now = bucket._updated
+
+        self.assertEqual(bucket.reserve(now), 0)
+        self.assertAlmostEqual(bucket.reserve(now), 0.3)
+        self.assertAlmostEqual(bucket.reserve(now + 1), 0)
+
+    def test_tokens_refill(self):
+        bucket = TokenBucket(rate=1.0, burst=1)
+        now = bucket._updated
+        bucket.reserve(now)
+
+        self.assertAlmostEqual(bucket.reserve(now + 2), 0)
+
+    def test_no_limit(self):
+        bucket = TokenBucket()
+        self.assertTrue(all(bucket.reserve() == 0 for _ in range(100)))
+
+    def test_invalid_rate(self):
+        with self.assertRaises(ValueError):
+            TokenBucket(rate=0)
+
+
+class TestDomainScheduler(IsolatedAsyncioTestCase):
+
+    def test_get_domain(self):
+        self.assertEqual(get_domain("https://www.linkedin.com/jobs/view/1/"), "www.linkedin.com")
+
+    def test_from_platform(self):
+        platform = MagicMock(rate_limit=2.0, rate_burst=3, min_delay=0.1)
+        scheduler = DomainScheduler.from_platform(platform)
+
+        self.assertEqual((scheduler.rate_limit, scheduler.burst, scheduler.min_delay), (2.0, 3, 0.1))
+
+    async def test_queue_interleaves_domains(self):
+        scheduler = DomainScheduler(rate_limit=1.0, burst=1)
+        urls = ["https://a.com/1", "https://a.com/2", "https://b.com/1", "https://b.com/2"]
+        queue = scheduler.queue((url, url) for url in urls)
+
+        first_two = [await queue.next(), await queue.next()]
+
+        # the second a.com url has to wait, b.com is served first
+        self.assertEqual({get_domain(url) for url in first_two}, {"a.com", "b.com"})
+        self.assertEqual(len(queue), 2)
+
+    async def test_queue_exhausted(self):
+        scheduler = DomainScheduler()
+        queue = scheduler.queue([("x", "https://a.com/")])
+
+        self.assertEqual(await queue.next(), "x")
+        self.assertIsNone(await queue.next())
+
+    async def test_rate_is_held_per_domain(self):
+        scheduler = DomainScheduler(rate_limit=50.0, burst=1)
+        queue = scheduler.queue((i, "https://a.com/") for i in range(3))
+        loop = asyncio.get_running_loop()
+
+        start = loop.time()
+        while await queue.next() is not None:
+            pass
+
+        self.assertGreaterEqual(loop.time() - start, 0.035)
+        self.assertEqual(scheduler.metrics()["a.com"]["requests"], 3)
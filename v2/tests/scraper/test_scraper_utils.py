@@ -0,0 +1,48 @@
+# tests/scraper/test_scraper_utils.py
+import asyncio
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import IsolatedAsyncioTestCase
+
+from v2.scraper.scraper_utils import read_cookies, save_cookies
+
+
+class TestCookieFile(IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.temp_dir = TemporaryDirectory()
+        self.cookie_file = Path(self.temp_dir.name) / "nested" / "cookies.jsonl"
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    async def test_storage_state_round_trip(self):
+        state = {"cookies": [{"name": "li_at", "value": "token"}], "origins": []}
+
+        self.assertTrue(await save_cookies(content=state, cookie_file=self.cookie_file))
+
+        self.assertEqual(await read_cookies(cookie_file=self.cookie_file), state)
+        # compact, and no temporary file left behind
+        self.assertNotIn("\n", self.cookie_file.read_text())
+        self.assertEqual(list(self.cookie_file.parent.iterdir()), [self.cookie_file])
+
+    async def test_concurrent_saves_leave_one_whole_file(self):
+        states = [{"cookies": [{"name": "li_at", "value": "x" * 50_000 + str(i)}], "origins": []} for i in range(20)]
+
+        saved = await asyncio.gather(*(save_cookies(content=state, cookie_file=self.cookie_file) for state in states))
+
+        self.assertTrue(all(saved))
+        self.assertIn(await read_cookies(cookie_file=self.cookie_file), states)
+        self.assertEqual(list(self.cookie_file.parent.iterdir()), [self.cookie_file])
+
+    async def test_unserializable_content_leaves_no_temporary_file(self):
+        self.assertFalse(await save_cookies(content={"cookies": [object()]}, cookie_file=self.cookie_file))
+
+        self.assertEqual(list(self.cookie_file.parent.iterdir()), [])
+
+    async def test_missing_or_invalid_file(self):
+        self.assertIsNone(await read_cookies(cookie_file=self.cookie_file))
+
+        self.cookie_file.parent.mkdir(parents=True)
+        self.cookie_file.write_text("{not json")
+        self.assertIsNone(await read_cookies(cookie_file=self.cookie_file))
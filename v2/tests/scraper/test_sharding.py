@@ -0,0 +1,72 @@
+# tests/scraper/test_sharding.py
+import multiprocessing
+from unittest import IsolatedAsyncioTestCase, TestCase
+from unittest.mock import AsyncMock, MagicMock
+
+from v2.core.page_output import PageResponse
+from v2.scraper.scraper_engine import ScraperEngine
+from v2.scraper.sharding import merge_results, split_urls
+
+
+class TestSplitUrls(TestCase):
+
+    def test_round_robin(self):
+        shards = split_urls(["a", "b", "c", "d", "e"], 2)
+
+        self.assertEqual(shards, [[(0, "a"), (2, "c"), (4, "e")], [(1, "b"), (3, "d")]])
+
+    def test_no_more_shards_than_urls(self):
+        self.assertEqual(len(split_urls(["a", "b"], 8)), 2)
+
+
+class TestMergeResults(IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.queue = multiprocessing.Queue()
+        self.process = MagicMock(is_alive=MagicMock(return_value=True))
+
+    def put(self, *items):
+        for item in items:
+            self.queue.put(item)
+
+    async def test_ordered_holds_back_until_lower_indices_arrive(self):
+        self.put(
+            (2, PageResponse(url="c")),
+            (0, PageResponse(url="a")),
+            (1, None),  # a failed url
+            (None, 0),
+        )
+
+        items = [item async for item in merge_results(self.queue, [self.process], poll_interval=0.1)]
+
+        self.assertEqual([index for index, _ in items], [0, 2])
+
+    async def test_unordered_yields_in_arrival_order(self):
+        self.put((2, PageResponse(url="c")), (0, PageResponse(url="a")), (None, 0), (None, 1))
+
+        items = [
+            item async for item in merge_results(self.queue, [self.process, self.process], ordered=False, poll_interval=0.1)
+        ]
+
+        self.assertEqual([index for index, _ in items], [2, 0])
+
+    async def test_dead_worker_ends_the_merge(self):
+        self.process.is_alive.return_value = False
+        self.put((1, PageResponse(url="b")))
+
+        items = [item async for item in merge_results(self.queue, [self.process], poll_interval=0.1)]
+
+        # index 0 was never reported, what was held back is still returned
+        self.assertEqual([index for index, _ in items], [1])
+
+
+class TestShareCookies(IsolatedAsyncioTestCase):
+
+    async def test_open_session_saves_its_cookies(self):
+        engine = ScraperEngine(platform=MagicMock(rate_limit=None, rate_burst=1, min_delay=0.0, blocked_url_patterns=[]))
+        engine.browser_session = AsyncMock(cookie_file="shared.jsonl")
+
+        cookie_file = await engine._share_cookies()
+
+        self.assertEqual(cookie_file, "shared.jsonl")
+        engine.browser_session.save_cookies.assert_awaited_once()